@@ -0,0 +1,6 @@
+"""
+The Python-Markdown benchmark suite.
+
+Run `python -m benchmarks --help` from the root of the repository for usage. See the
+[Contributing Guide](https://python-markdown.github.io/contributing/#benchmarks) for details.
+"""
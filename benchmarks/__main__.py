@@ -0,0 +1,119 @@
+"""
+Command line interface of the benchmark suite.
+
+```sh
+python -m benchmarks run -o base.json
+python -m benchmarks run -o new.json
+python -m benchmarks compare base.json new.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any
+
+from .harness import build_cases, compare, run
+
+
+def format_size(size: float) -> str:
+    """ Format a number of bytes. """
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GiB'
+
+
+def print_result(name: str, result: dict[str, Any]) -> None:
+    print(
+        f'{name:<48}{result["min"] * 1000:>11.2f} ms{format_size(result["throughput"]) + "/s":>16}'
+        f'{format_size(result["peak_memory"]):>14}',
+        flush=True
+    )
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    for case in build_cases(args.scale, args.select):
+        print(case.name)
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    cases = build_cases(args.scale, args.select)
+    if not cases:
+        print('No benchmarks match the selection.', file=sys.stderr)
+        return 1
+    print(f'{"benchmark":<48}{"time":>14}{"throughput":>16}{"peak memory":>14}')
+    results = run(cases, args.min_time, args.min_repeat, progress=print_result)
+    results['meta']['scale'] = args.scale
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    with open(args.base, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.new, encoding='utf-8') as f:
+        new = json.load(f)
+    if base['meta'].get('scale') != new['meta'].get('scale'):
+        print('Warning: the runs used different scales.', file=sys.stderr)
+    comparisons = compare(base, new, args.threshold, args.memory_threshold)
+    print(f'{"benchmark":<48}{"time":>10}{"memory":>10}')
+    for c in comparisons:
+        flag = '  REGRESSION' if c.regression else ''
+        print(f'{c.name:<48}{c.time_ratio:>9.2f}x{c.memory_ratio:>9.2f}x{flag}')
+    regressions = sum(c.regression for c in comparisons)
+    print(f'\n{len(comparisons)} benchmarks compared, {regressions} regressions.')
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Python-Markdown benchmark suite.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for name, func, help in (
+        ('run', cmd_run, 'run the benchmarks'),
+        ('list', cmd_list, 'list the benchmarks'),
+    ):
+        command = commands.add_parser(name, help=help)
+        command.set_defaults(func=func)
+        command.add_argument(
+            '-k', dest='select', action='append', default=[], metavar='SUBSTRING',
+            help='only include benchmarks whose name contains SUBSTRING (may be repeated)'
+        )
+        command.add_argument(
+            '--scale', type=float, default=1.0, help='multiply the size of the synthetic documents (default: 1)'
+        )
+    run_command = commands.choices['run']
+    run_command.add_argument('-o', '--output', help='write the results as JSON to this file')
+    run_command.add_argument(
+        '--min-time', type=float, default=1.0, help='minimum time in seconds spent timing each benchmark (default: 1)'
+    )
+    run_command.add_argument(
+        '--min-repeat', type=int, default=3, help='minimum number of timed runs of each benchmark (default: 3)'
+    )
+
+    compare_command = commands.add_parser('compare', help='compare the results of two runs')
+    compare_command.set_defaults(func=cmd_compare)
+    compare_command.add_argument('base', help='the results of the base run')
+    compare_command.add_argument('new', help='the results of the new run')
+    compare_command.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='flag a benchmark which is slower by more than this fraction (default: 0.1)'
+    )
+    compare_command.add_argument(
+        '--memory-threshold', type=float, default=0.1,
+        help='flag a benchmark which uses more peak memory by more than this fraction (default: 0.1)'
+    )
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
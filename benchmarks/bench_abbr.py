@@ -0,0 +1,70 @@
+"""
+Measure the time the `abbr` extension takes to convert a document as its glossary grows.
+
+Run with `python benchmarks/bench_abbr.py`. For each size of the glossary, a document which mentions some of its
+abbreviations is converted again and again by the same instance, as a site generator would, with and without an
+abbreviation defined in the document itself. The time per conversion is reported in milliseconds. The time
+without the `abbr` extension is reported for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import markdown
+
+
+def glossary(size: int) -> dict[str, str]:
+    """ Return a glossary of `size` abbreviations. """
+    return {f'T{i:X}Z': f'Term {i}' for i in range(size)}
+
+
+def document(size: int, paragraphs: int, local: bool) -> str:
+    """ Return a document which mentions abbreviations of a glossary of `size` and may define one of its own. """
+    text = ''.join(
+        f'Paragraph {i} mentions T{i * 7919 % size:X}Z, *T{i % size:X}Z* and a few more words than that.\n\n'
+        for i in range(paragraphs)
+    )
+    return text + ('*[LOCAL]: A local abbreviation\n' if local else '')
+
+
+def bench(sizes: list[int], paragraphs: int, number: int, repeat: int) -> list[tuple[int, float, float, float]]:
+    """
+    Return the best time per conversion (in seconds) of the document without `abbr`, with `abbr` and with `abbr`
+    and a local abbreviation for each size of the glossary.
+    """
+    results = []
+    for size in sizes:
+        md = markdown.Markdown(extensions=['abbr'], extension_configs={'abbr': {'glossary': glossary(size)}})
+        plain = markdown.Markdown()
+        timings = []
+        for converter, local in ((plain, False), (md, False), (md, True)):
+            source = document(size, paragraphs, local)
+
+            def run() -> None:
+                converter.reset().convert(source)
+
+            timings.append(min(timeit.repeat(run, number=number, repeat=repeat)) / number)
+        results.append((size, *timings))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '-s', '--sizes', type=int, nargs='+', default=[10, 1000, 10000],
+        help='numbers of abbreviations in the glossary (default: 10 1000 10000)'
+    )
+    parser.add_argument('-p', '--paragraphs', type=int, default=200, help='paragraphs per document (default: 200)')
+    parser.add_argument('-n', '--number', type=int, default=5, help='conversions per timing (default: 5)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='timings per document (default: 3)')
+    args = parser.parse_args()
+
+    print(f'{"glossary":>10}{"no abbr":>12}{"abbr":>12}{"local abbr":>12}')
+    for size, plain, glossary_only, local in bench(args.sizes, args.paragraphs, args.number, args.repeat):
+        print(f'{size:>10}' + ''.join(f'{t * 1e3:>10.2f}ms' for t in (plain, glossary_only, local)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Compare the cost of building a new `Markdown` instance with the cost of copying a configured one.
+
+Run with `python benchmarks/bench_clone.py`. Each approach is timed for a few sets of extensions and the mean time
+per instance is reported in microseconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import markdown
+
+EXTENSION_SETS = {
+    'none': [],
+    'extra+toc': ['extra', 'toc'],
+    'extra+toc+codehilite+smarty': ['extra', 'toc', 'codehilite', 'smarty'],
+    'all': [
+        'extra', 'toc', 'codehilite', 'smarty', 'admonition', 'meta', 'nl2br', 'sane_lists', 'wikilinks',
+        'legacy_attrs', 'legacy_em'
+    ],
+}
+
+
+def bench(number: int, repeat: int) -> list[tuple[str, float, float, float]]:
+    """ Return the best mean time (in seconds) of each approach for each set of extensions. """
+    results = []
+    for name, extensions in EXTENSION_SETS.items():
+        md = markdown.Markdown(extensions=extensions)
+        prototype = markdown.MarkdownPrototype(md)
+        timings = [
+            min(timeit.repeat(func, number=number, repeat=repeat)) / number
+            for func in (lambda: markdown.Markdown(extensions=extensions), md.clone, prototype.new)
+        ]
+        results.append((name, *timings))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=500, help='instances built per timing (default: 500)')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='timings per approach (default: 5)')
+    args = parser.parse_args()
+
+    print(f'{"extensions":<30}{"Markdown()":>14}{"clone()":>14}{"prototype":>14}{"speedup":>10}')
+    for name, construct, clone, prototype in bench(args.number, args.repeat):
+        print(
+            f'{name:<30}{construct * 1e6:>12.1f}us{clone * 1e6:>12.1f}us{prototype * 1e6:>12.1f}us'
+            f'{construct / prototype:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
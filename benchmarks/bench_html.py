@@ -0,0 +1,79 @@
+"""
+Measure how the time spent extracting raw HTML from a document grows with the number of HTML blocks in it.
+
+Run with `python benchmarks/bench_html.py`. For each kind of document, a document is built with an increasing
+number of blocks and only the `html_block` preprocessor is timed, with and without the `md_in_html` extension. The
+time per block is reported in microseconds and should stay roughly constant as the document grows; a time which
+grows with the size of the document indicates quadratic behavior.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import markdown
+
+DOCUMENTS = {
+    'blocks': '<div class="note">\n<p>Note {i} &amp; <em>more</em>.</p>\n</div>\n\nText {i} with <b>bold</b>.\n\n',
+    'table': '<table>\n  <tr><td>{i}</td><td>&lt;{i}&gt;</td><td><a href="#{i}">Link</a></td></tr>\n</table>\n',
+    'comments': '<!-- Comment {i} -->\n<hr>\nText {i} &#{i};.\n\n',
+    'md_in_html': '<div markdown="1">\n# Section {i}\n\n<div markdown="1">\nSome *text* {i}.\n</div>\n</div>\n\n',
+}
+"""
+Each kind of document: a name mapped to a template of the blocks which are repeated in it. The template is
+formatted with the index `i` of each block.
+"""
+
+
+def document(name: str, count: int) -> list[str]:
+    """ Return the lines of the document `name` which contains `count` blocks. """
+    return ''.join(DOCUMENTS[name].format(i=i) for i in range(count)).split('\n')
+
+
+def bench(names: list[str], sizes: list[int], extensions: list[str], repeat: int) -> list[tuple[str, list[float]]]:
+    """ Return the best time per block (in seconds) of each kind of document for each size. """
+    md = markdown.Markdown(extensions=extensions)
+    preprocessor = md.preprocessors['html_block']
+    results = []
+    for name in names:
+        timings = []
+        for size in sizes:
+            lines = document(name, size)
+
+            def run() -> None:
+                # Empty the stash which the previous run filled.
+                md.reset()
+                preprocessor.run(lines)
+
+            timings.append(min(timeit.repeat(run, number=1, repeat=repeat)) / size)
+        results.append((name, timings))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '-k', dest='select', action='append', default=[], metavar='SUBSTRING',
+        help='only include documents whose name contains SUBSTRING (may be repeated)'
+    )
+    parser.add_argument(
+        '-s', '--sizes', type=int, nargs='+', default=[1000, 2000, 4000, 8000],
+        help='numbers of blocks per document (default: 1000 2000 4000 8000)'
+    )
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='timings per document (default: 3)')
+    args = parser.parse_args()
+
+    names = [name for name in DOCUMENTS if not args.select or any(s in name for s in args.select)]
+    print(f'{"document":<24}' + ''.join(f'{size:>12}' for size in args.sizes) + f'{"growth":>10}')
+    for extensions in ([], ['md_in_html']):
+        for name, timings in bench(names, args.sizes, extensions, args.repeat):
+            label = f'{name} ({extensions[0]})' if extensions else name
+            print(
+                f'{label:<24}' + ''.join(f'{t * 1e6:>10.1f}us' for t in timings) +
+                f'{timings[-1] / timings[0]:>9.2f}x'
+            )
+
+
+if __name__ == '__main__':
+    main()
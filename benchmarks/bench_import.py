@@ -0,0 +1,84 @@
+"""
+Measure the startup time of importing Markdown and running its command line interface.
+
+Run with `python benchmarks/bench_import.py`. Each case is run in a new Python process and the best time of several
+runs is reported in milliseconds, along with its time minus that of an empty interpreter. Pass `--path` to time
+another copy of the package (the directory which contains the `markdown` package, for example an older checkout) so
+that two versions can be compared. Pass `--modules` to list the modules which `import markdown` loads.
+
+The bytecode of the modules is written to a temporary directory by a first, untimed run of each case, so that the
+timings do not include compiling the source, as is the case for an installed package.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CASES: dict[str, tuple[list[str], str]] = {
+    'python': (['-c', 'pass'], ''),
+    'import markdown': (['-c', 'import markdown'], ''),
+    'markdown.markdown()': (['-c', 'import markdown; markdown.markdown("*foo*")'], ''),
+    'fenced_code': (
+        ['-c', 'import markdown; markdown.markdown("*foo*", extensions=["fenced_code", "codehilite"])'], ''
+    ),
+    'python -m markdown': (['-m', 'markdown'], '# Header\n\nSome *emphasis*.\n'),
+}
+""" The arguments passed to the interpreter and the input written to it for each case, keyed by name. """
+
+
+def run_python(args: list[str], stdin: str, path: str, env: dict[str, str]) -> str:
+    """ Run the interpreter with `args` in `path` (so the package is imported from there) and return its output. """
+    process = subprocess.run([sys.executable, *args], input=stdin, cwd=path, env=env, text=True, check=True,
+                             capture_output=True)
+    return process.stdout
+
+
+def time_case(args: list[str], stdin: str, path: str, env: dict[str, str], repeat: int) -> float:
+    """ Return the best time (in seconds) of running the interpreter with `args`. """
+    timings = []
+    run_python(args, stdin, path, env)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_python(args, stdin, path, env)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def imported_modules(path: str, env: dict[str, str]) -> list[str]:
+    """ Return the names of the modules loaded by `import markdown` in a new process. """
+    code = 'import sys; before = set(sys.modules); import markdown; print(*sorted(set(sys.modules) - before))'
+    return run_python(['-c', code], '', path, env).split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--path', default=str(ROOT), help='the directory of the package to time (default: this tree)')
+    parser.add_argument('-r', '--repeat', type=int, default=20, help='runs per case (default: 20)')
+    parser.add_argument('--modules', action='store_true', help='list the modules loaded by `import markdown`')
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=args.path)
+    if args.modules:
+        modules = imported_modules(args.path, env)
+        print(f'{len(modules)} modules: {" ".join(modules)}')
+        return
+
+    with tempfile.TemporaryDirectory() as cache:
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        env['PYTHONPYCACHEPREFIX'] = cache
+        timings = {name: time_case(*case, args.path, env, args.repeat) for name, case in CASES.items()}
+    print(f'{"case":<24}{"time":>12}{"startup":>12}')
+    for name, timing in timings.items():
+        print(f'{name:<24}{timing * 1000:>10.1f}ms{(timing - timings["python"]) * 1000:>10.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
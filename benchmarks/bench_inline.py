@@ -0,0 +1,74 @@
+"""
+Measure how the time spent converting a single element grows with the number of inline elements in it.
+
+Run with `python benchmarks/bench_inline.py`. For each kind of document, a document is built with an increasing
+number of inline elements and the time per element is reported in microseconds. The time per element should stay
+roughly constant as the document grows; a time which grows with the size of the document indicates quadratic
+behavior. For example, time lists of up to 50,000 items with
+`python benchmarks/bench_inline.py -k list -s 6250 12500 25000 50000`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import markdown
+
+DOCUMENTS = {
+    'links': ('{}\n', '[link {i}](http://example.com/{i} "Title {i}") '),
+    'emphasis': ('{}\n', '*emphasis {i}* and **strong {i}** '),
+    'code': ('{}\n', '`code {i}` '),
+    'autolinks': ('{}\n', '<http://example.com/{i}> '),
+    'mixed': ('{}\n', '[link {i}](http://example.com/{i}) *emphasis {i}* `code {i}` '),
+    'strong-wrapping': ('**{}**\n', '`code {i}` and [link {i}](http://example.com/{i}) '),
+    'list': ('{}', '* Item {i} with *emphasis* and `code`.\n'),
+}
+"""
+Each kind of document: a name mapped to a format string of the document and a template of the elements which are
+repeated in it. The template is formatted with the index `i` of each element.
+"""
+
+
+def document(name: str, count: int) -> str:
+    """ Return the document `name` which contains `count` elements. """
+    wrapper, element = DOCUMENTS[name]
+    return wrapper.format(''.join(element.format(i=i) for i in range(count)))
+
+
+def bench(names: list[str], sizes: list[int], repeat: int) -> list[tuple[str, list[float]]]:
+    """ Return the best time per element (in seconds) of each kind of document for each size. """
+    md = markdown.Markdown()
+    results = []
+    for name in names:
+        timings = []
+        for size in sizes:
+            source = document(name, size)
+            timings.append(min(timeit.repeat(lambda: md.reset().convert(source), number=1, repeat=repeat)) / size)
+        results.append((name, timings))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '-k', dest='select', action='append', default=[], metavar='SUBSTRING',
+        help='only include documents whose name contains SUBSTRING (may be repeated)'
+    )
+    parser.add_argument(
+        '-s', '--sizes', type=int, nargs='+', default=[1250, 2500, 5000, 10000],
+        help='numbers of elements per document (default: 1250 2500 5000 10000)'
+    )
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='timings per document (default: 3)')
+    args = parser.parse_args()
+
+    names = [name for name in DOCUMENTS if not args.select or any(s in name for s in args.select)]
+    print(f'{"document":<16}' + ''.join(f'{size:>12}' for size in args.sizes) + f'{"growth":>10}')
+    for name, timings in bench(names, args.sizes, args.repeat):
+        print(
+            f'{name:<16}' + ''.join(f'{t * 1e6:>10.1f}us' for t in timings) + f'{timings[-1] / timings[0]:>9.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
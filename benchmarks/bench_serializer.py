@@ -0,0 +1,75 @@
+"""
+Measure the time spent serializing the trees of the test corpus to HTML and XHTML.
+
+Run with `python benchmarks/bench_serializer.py`. Each document of the test corpus is parsed once with the `extra`,
+`toc` and `admonition` extensions and the tree is kept. The serializers are then timed on all of the trees and the
+total time per pass is reported in milliseconds. Pass `--unsorted` to also time writing the attributes in the order
+they were set. To compare two versions of the serializers, run the script with each of them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from pathlib import Path
+from xml.etree.ElementTree import Element
+
+import markdown
+from markdown.serializers import to_html_string, to_xhtml_string
+
+TESTS_DIR = Path(__file__).resolve().parent.parent / 'tests'
+EXTENSIONS = ['extra', 'toc', 'admonition']
+
+
+class KeepTree(markdown.treeprocessors.Treeprocessor):
+    """ Keep the tree of each document after all other treeprocessors have run. """
+
+    def __init__(self, md: markdown.Markdown, trees: list[Element]):
+        super().__init__(md)
+        self.trees = trees
+
+    def run(self, root: Element) -> None:
+        self.trees.append(root)
+
+
+def load_trees() -> list[Element]:
+    """ Return the tree of each document of the test corpus. """
+    trees: list[Element] = []
+    for path in sorted(TESTS_DIR.glob('**/*.txt')):
+        md = markdown.Markdown(extensions=EXTENSIONS)
+        md.treeprocessors.register(KeepTree(md, trees), 'keep_tree', -1000)
+        md.convert(path.read_text(encoding='utf-8'))
+    return trees
+
+
+def bench(trees: list[Element], unsorted: bool, repeat: int) -> list[tuple[str, float]]:
+    """ Return the best time (in seconds) of a pass over all trees with each serializer. """
+    cases = [('html', to_html_string, {}), ('xhtml', to_xhtml_string, {})]
+    if unsorted:
+        cases += [
+            ('html (unsorted)', to_html_string, {'sort_attributes': False}),
+            ('xhtml (unsorted)', to_xhtml_string, {'sort_attributes': False}),
+        ]
+    results = []
+    for name, serializer, kwargs in cases:
+        timing = min(timeit.repeat(lambda: [serializer(tree, **kwargs) for tree in trees], number=1, repeat=repeat))
+        results.append((name, timing))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--unsorted', action='store_true', help='also time writing attributes in the order they were set'
+    )
+    parser.add_argument('-r', '--repeat', type=int, default=20, help='timings per serializer (default: 20)')
+    args = parser.parse_args()
+
+    trees = load_trees()
+    print(f'{len(trees)} trees, {sum(1 for tree in trees for _ in tree.iter())} elements')
+    for name, timing in bench(trees, args.unsorted, args.repeat):
+        print(f'{name:<20}{timing * 1000:>10.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+The documents converted by the benchmark suite.
+
+Two kinds of documents are provided: the existing test corpora of the repository (`tests/basic`,
+`tests/extensions` and `tests/pl`) and synthetic documents which stress a single construct at scale. The size of
+each synthetic document is multiplied by the `scale` passed to `load_documents`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+TESTS_DIR = Path(__file__).resolve().parent.parent / 'tests'
+
+CORPORA = {
+    'basic': ('basic', '*.txt'),
+    'extensions': ('extensions', '**/*.txt'),
+    'pl': ('pl', '**/*.text'),
+}
+""" The test corpora: a name mapped to a directory in `tests` and a glob pattern of its source files. """
+
+
+def long_list(scale: float) -> str:
+    """ A long loose list of short items with some nested items. """
+    items = []
+    for i in range(int(1000 * scale)):
+        items.append(f'* Item {i} with *emphasis* and `code`.\n')
+        if i % 10 == 0:
+            items.append(f'\n    1. Nested item {i}.\n    2. Another nested item.\n')
+        items.append('\n')
+    return ''.join(items)
+
+
+def deep_blockquotes(scale: float) -> str:
+    """ Repeated runs of deeply nested blockquotes. """
+    blocks = []
+    for i in range(int(20 * scale)):
+        for depth in range(1, 40):
+            blocks.append('> ' * depth + f'Quote {i} at depth {depth} with a [link](http://example.com/{i}).\n')
+        blocks.append('\n')
+    return ''.join(blocks)
+
+
+def huge_table(scale: float) -> str:
+    """ A single table with many rows. """
+    rows = ['| ' + ' | '.join(f'Column {c}' for c in range(8)) + ' |\n', '|' + ' --- |' * 8 + '\n']
+    for r in range(int(500 * scale)):
+        rows.append('| ' + ' | '.join(f'*r{r}* c{c}' for c in range(8)) + ' |\n')
+    return ''.join(rows)
+
+
+def many_links(scale: float) -> str:
+    """ Paragraphs full of inline links, reference links and autolinks. """
+    count = int(500 * scale)
+    paragraphs = [
+        f'See [link {i}](http://example.com/{i} "Title {i}"), [ref {i}][r{i}] and <http://example.com/a/{i}>.\n\n'
+        for i in range(count)
+    ]
+    paragraphs.extend(f'[r{i}]: http://example.com/ref/{i}\n' for i in range(count))
+    return ''.join(paragraphs)
+
+
+def many_paragraphs(scale: float) -> str:
+    """ Many short paragraphs. """
+    return ''.join(f'Paragraph {i} with some text.\n\n' for i in range(int(20000 * scale)))
+
+
+def many_footnotes(scale: float) -> str:
+    """ Paragraphs which each reference a footnote. """
+    count = int(1000 * scale)
+    paragraphs = [f'Paragraph {i} with a footnote.[^{i}]\n\n' for i in range(count)]
+    paragraphs.extend(f'[^{i}]: The footnote {i} with *emphasis*.\n\n' for i in range(count))
+    return ''.join(paragraphs)
+
+
+def many_headers(scale: float) -> str:
+    """ Headers of all levels separated by short paragraphs. """
+    sections = []
+    for i in range(int(1000 * scale)):
+        level = i % 6 + 1
+        sections.append('#' * level + f' Header {i} with `code` & *emphasis*\n\nSome text for section {i}.\n\n')
+    return ''.join(sections)
+
+
+def code_heavy(scale: float) -> str:
+    """ Fenced and indented code blocks and raw HTML blocks separated by short paragraphs. """
+    sections = []
+    for i in range(int(500 * scale)):
+        sections.append(
+            f'Step {i} runs:\n\n```python\ndef step_{i}(x):\n    return x * {i} < 10\n```\n\n'
+            f'    $ run --step {i}\n\n<div class="note">\nNote {i}\n</div>\n\n'
+        )
+    return ''.join(sections)
+
+
+def html_blocks(scale: float) -> str:
+    """ Raw HTML blocks, a raw HTML table and inline HTML separated by short paragraphs. """
+    sections = []
+    for i in range(int(500 * scale)):
+        sections.append(
+            f'<div class="note">\n<p>Note {i} &amp; <em>more</em>.</p>\n</div>\n\n'
+            f'Text {i} with <span class="x">inline</span> HTML &#{i + 100};.\n\n'
+        )
+        if i % 50 == 0:
+            rows = ''.join(f'  <tr><td>{r}</td><td>Cell {i}</td><td>&lt;{r}&gt;</td></tr>\n' for r in range(50))
+            sections.append(f'<table>\n{rows}</table>\n\n')
+    return ''.join(sections)
+
+
+def markdown_in_html(scale: float) -> str:
+    """ Nested raw HTML blocks with Markdown content (for the `md_in_html` extension). """
+    sections = []
+    for i in range(int(300 * scale)):
+        sections.append(
+            f'<div markdown="1" class="section">\n## Section {i}\n\n<div markdown="1">\n'
+            f'Some *text* {i} with <b>bold</b> HTML.\n\n* Item {i}\n</div>\n<hr>\n</div>\n\n'
+        )
+    return ''.join(sections)
+
+
+SYNTHETIC: dict[str, tuple[Callable[[float], str], tuple[str, ...]]] = {
+    'long-list': (long_list, ('default', 'all')),
+    'deep-blockquotes': (deep_blockquotes, ('default', 'all')),
+    'huge-table': (huge_table, ('default', 'extra', 'all')),
+    'many-links': (many_links, ('default', 'smarty', 'all')),
+    'many-paragraphs': (many_paragraphs, ('default',)),
+    'many-footnotes': (many_footnotes, ('default', 'extra', 'all')),
+    'many-headers': (many_headers, ('default', 'toc', 'all')),
+    'code-heavy': (code_heavy, ('default', 'codehilite', 'all')),
+    'html-blocks': (html_blocks, ('default', 'extra')),
+    'markdown-in-html': (markdown_in_html, ('extra', 'all')),
+}
+"""
+The synthetic documents: a name mapped to a function which builds the document for a given scale and the names
+of the extension sets it is converted with. The test corpora are converted with every extension set.
+"""
+
+
+def load_documents(scale: float = 1.0) -> dict[str, tuple[list[str], tuple[str, ...] | None]]:
+    """
+    Return each set of documents keyed by its name (`corpus/<name>` or `synthetic/<name>`) along with the names of
+    the extension sets it is converted with (or `None` for all extension sets).
+    """
+    documents: dict[str, tuple[list[str], tuple[str, ...] | None]] = {}
+    for name, (directory, pattern) in CORPORA.items():
+        paths = sorted(TESTS_DIR.joinpath(directory).glob(pattern))
+        documents[f'corpus/{name}'] = ([path.read_text(encoding='utf-8') for path in paths], None)
+    for name, (build, extension_sets) in SYNTHETIC.items():
+        documents[f'synthetic/{name}'] = ([build(scale)], extension_sets)
+    return documents
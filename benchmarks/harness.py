@@ -0,0 +1,183 @@
+"""
+Run the benchmark suite and compare its results.
+
+Each case converts a set of documents with [`markdown.markdown`][] and a set of extensions. The time of a case is
+the best of several runs over all of its documents and its memory is the peak of the memory allocated by Python
+(as reported by `tracemalloc`) during a separate run.
+"""
+
+from __future__ import annotations
+
+import gc
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, NamedTuple
+
+import markdown
+
+from .corpus import load_documents
+
+EXTENSION_SETS: dict[str, list[str]] = {
+    'default': [],
+    'extra': ['extra'],
+    'toc': ['toc'],
+    'codehilite': ['fenced_code', 'codehilite'],
+    'smarty': ['smarty'],
+    'all': ['extra', 'toc', 'codehilite', 'smarty'],
+}
+""" The sets of extensions the documents are converted with, keyed by name. """
+
+
+class Case(NamedTuple):
+    """ A single benchmark. """
+    name: str
+    """ The name of the case: `<documents>[<extension set>]`. """
+    documents: list[str]
+    """ The documents converted by the case. """
+    extensions: list[str]
+    """ The extensions passed to `markdown.markdown`. """
+
+
+class Comparison(NamedTuple):
+    """ The change of a case between two runs. """
+    name: str
+    time_ratio: float
+    """ The time of the new run divided by the time of the base run. """
+    memory_ratio: float
+    """ The peak memory of the new run divided by the peak memory of the base run. """
+    regression: bool
+    """ Whether either ratio exceeds its threshold. """
+
+
+def build_cases(scale: float = 1.0, select: Iterable[str] = ()) -> list[Case]:
+    """ Return every case whose name contains one of the strings in `select` (or all cases if it is empty). """
+    select = list(select)
+    cases = []
+    for doc_name, (documents, extension_sets) in load_documents(scale).items():
+        for ext_name, extensions in EXTENSION_SETS.items():
+            if extension_sets is not None and ext_name not in extension_sets:
+                continue
+            name = f'{doc_name}[{ext_name}]'
+            if not select or any(s in name for s in select):
+                cases.append(Case(name, documents, extensions))
+    return cases
+
+
+def convert_all(case: Case) -> None:
+    """ Convert every document of a case. """
+    for text in case.documents:
+        markdown.markdown(text, extensions=case.extensions)
+
+
+def measure_time(func: Callable[[], Any], min_time: float, min_repeat: int) -> list[float]:
+    """ Call `func` at least `min_repeat` times and until `min_time` seconds have passed. Return each time. """
+    times = []
+    started = time.perf_counter()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while len(times) < min_repeat or time.perf_counter() - started < min_time:
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+            gc.collect()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return times
+
+
+def measure_memory(func: Callable[[], Any]) -> int:
+    """ Return the peak memory (in bytes) allocated by Python while calling `func`. """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(case: Case, min_time: float = 1.0, min_repeat: int = 3) -> dict[str, Any]:
+    """ Run a single case and return its results. """
+    size = sum(len(text.encode('utf-8')) for text in case.documents)
+    # Warm up any caches and lazy imports so that they are not included in the first timing.
+    convert_all(case)
+    times = measure_time(lambda: convert_all(case), min_time, min_repeat)
+    best = min(times)
+    return {
+        'documents': len(case.documents),
+        'bytes': size,
+        'extensions': case.extensions,
+        'runs': len(times),
+        'min': best,
+        'median': statistics.median(times),
+        'throughput': size / best,
+        'peak_memory': measure_memory(lambda: convert_all(case)),
+    }
+
+
+def run(
+    cases: Iterable[Case],
+    min_time: float = 1.0,
+    min_repeat: int = 3,
+    progress: Callable[[str, dict[str, Any]], Any] | None = None
+) -> dict[str, Any]:
+    """ Run each case and return the results along with a description of the environment. """
+    results = {}
+    for case in cases:
+        results[case.name] = run_case(case, min_time, min_repeat)
+        if progress is not None:
+            progress(case.name, results[case.name])
+    return {
+        'meta': {
+            'markdown': markdown.__version__,
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'pygments': _version('pygments'),
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        },
+        'results': results,
+    }
+
+
+def compare(
+    base: dict[str, Any],
+    new: dict[str, Any],
+    time_threshold: float = 0.1,
+    memory_threshold: float = 0.1
+) -> list[Comparison]:
+    """
+    Compare the cases found in both of two runs.
+
+    A case is a regression when its time grew by more than `time_threshold` or its peak memory grew by more than
+    `memory_threshold` (both given as a fraction of the base run).
+    """
+    comparisons = []
+    for name, old in base['results'].items():
+        if name not in new['results']:
+            continue
+        result = new['results'][name]
+        time_ratio = result['min'] / old['min']
+        memory_ratio = result['peak_memory'] / old['peak_memory'] if old['peak_memory'] else 1.0
+        comparisons.append(Comparison(
+            name,
+            time_ratio,
+            memory_ratio,
+            time_ratio > 1 + time_threshold or memory_ratio > 1 + memory_threshold
+        ))
+    return comparisons
+
+
+def _version(name: str) -> str | None:
+    """ Return the installed version of a distribution or `None`. """
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
@@ -18,9 +18,9 @@
 # License: BSD (see LICENSE.md for details).
 
 """
-Python-Markdown provides two public functions ([`markdown.markdown`][] and [`markdown.markdownFromFile`][])
-both of which wrap the public class [`markdown.Markdown`][]. All submodules support these public functions
-and class and/or provide extension support.
+Python-Markdown provides three public functions ([`markdown.markdown`][], [`markdown.markdownFromFile`][] and
+[`markdown.convert_many`][]) all of which wrap the public class [`markdown.Markdown`][]. All submodules support
+these public functions and class and/or provide extension support.
 
 Modules:
     core: Core functionality.
@@ -31,6 +31,8 @@ Modules:
     inlinepatterns: Inline patterns.
     postprocessors: Post-processors.
     serializers: Serializers.
+    profiler: Pipeline profiler.
+    cache: Render caches.
     util: Utility functions.
     htmlparser: HTML parser.
     test_tools: Testing utilities.
@@ -39,10 +41,15 @@ Modules:
 
 from __future__ import annotations
 
-from .core import Markdown, markdown, markdownFromFile
+from .core import (
+    Markdown, ConversionResult, MarkdownPool, PoolStats, MarkdownPrototype, markdown, markdownFromFile, convert_many
+)
 from .__meta__ import __version__, __version_info__  # noqa
 
 # For backward compatibility as some extensions expect it...
 from .extensions import Extension  # noqa
 
-__all__ = ['Markdown', 'markdown', 'markdownFromFile']
+__all__ = [
+    'Markdown', 'ConversionResult', 'MarkdownPool', 'PoolStats', 'MarkdownPrototype', 'markdown', 'markdownFromFile',
+    'convert_many'
+]
@@ -23,18 +23,6 @@ import sys
 import optparse
 import warnings
 import markdown
-try:
-    # We use `unsafe_load` because users may need to pass in actual Python
-    # objects. As this is only available from the CLI, the user has much
-    # worse problems if an attacker can use this as an attach vector.
-    from yaml import unsafe_load as yaml_load
-except ImportError:  # pragma: no cover
-    try:
-        # Fall back to PyYAML <5.1
-        from yaml import load as yaml_load
-    except ImportError:
-        # Fall back to JSON
-        from json import load as yaml_load
 
 import logging
 from logging import DEBUG, WARNING, CRITICAL
@@ -42,6 +30,28 @@ from logging import DEBUG, WARNING, CRITICAL
 logger = logging.getLogger('MARKDOWN')
 
 
+def yaml_load(stream):
+    """
+    Load the extension configs from a YAML (or JSON) file.
+
+    The YAML library is only imported when a config file is passed, as it is
+    slow to import and not needed otherwise.
+    """
+    try:
+        # We use `unsafe_load` because users may need to pass in actual Python
+        # objects. As this is only available from the CLI, the user has much
+        # worse problems if an attacker can use this as an attach vector.
+        from yaml import unsafe_load as load
+    except ImportError:  # pragma: no cover
+        try:
+            # Fall back to PyYAML <5.1
+            from yaml import load
+        except ImportError:
+            # Fall back to JSON
+            from json import load
+    return load(stream)
+
+
 def parse_options(args=None, values=None):
     """
     Define and parse `optparse` options for command-line usage.
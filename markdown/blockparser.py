@@ -29,7 +29,10 @@ as they need to alter how Markdown blocks are parsed.
 
 from __future__ import annotations
 
+import functools
+import re
 import xml.etree.ElementTree as etree
+from collections import deque
 from typing import TYPE_CHECKING, Iterable, Any
 from . import util
 
@@ -72,6 +75,113 @@ class State(list):
             return False
 
 
+class BlockQueue(deque):
+    """ The blocks of text which remain to be parsed by [`parseBlocks`][markdown.blockparser.BlockParser.parseBlocks].
+
+    Block processors take blocks from and return blocks to the front of the queue with `blocks.pop(0)` and
+    `blocks.insert(0, block)`, which take constant time rather than the time to move every other block of a `list`.
+
+    The queue also supports the parts of the `list` API which block processors written against a `list` use: `pop`
+    and `insert` at any index, slicing (which returns a `list`), and comparison with and concatenation of a `list`.
+
+    """
+
+    def pop(self, index: int = -1) -> str:
+        """ Remove and return the block at `index` (the last block by default). """
+        if index == 0:
+            return self.popleft()
+        if index == -1:
+            return super().pop()
+        block = self[index]
+        del self[index]
+        return block
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return list(self)[key]
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: int | slice, value: Any) -> None:
+        if isinstance(key, slice):
+            blocks = list(self)
+            blocks[key] = value
+            self.clear()
+            self.extend(blocks)
+        else:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key: int | slice) -> None:
+        if isinstance(key, slice):
+            self[key] = []
+        else:
+            super().__delitem__(key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            return list(self) == other
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Iterable[str]) -> BlockQueue:
+        return BlockQueue([*self, *other])
+
+    def __radd__(self, other: Iterable[str]) -> list[str]:
+        return [*other, *self]
+
+
+@functools.lru_cache(maxsize=None)
+def _inherits_trigger(cls: type) -> bool:
+    """
+    Return `True` if the `TRIGGER_RE` of a class of block processor can be relied upon.
+
+    A `TRIGGER_RE` inherited by a subclass which overrides `test` or `__init__` (where a processor usually builds its
+    regular expressions) may no longer describe the blocks the subclass accepts. It is ignored unless the subclass
+    declares its own.
+    """
+    mro = cls.__mro__
+    owner = next((c for c in mro if 'TRIGGER_RE' in vars(c)), None)
+    if owner is None:
+        return False
+    for name in ('test', '__init__'):
+        if not issubclass(owner, next(c for c in mro if name in vars(c))):
+            return False
+    return True
+
+
+def _trigger_re(processor: BlockProcessor) -> re.Pattern[str] | None:
+    """ Return the `TRIGGER_RE` of a block processor or `None` if it is unknown. """
+    if 'TRIGGER_RE' in vars(processor):
+        return processor.TRIGGER_RE
+    if _inherits_trigger(type(processor)):
+        return processor.TRIGGER_RE
+    return None
+
+
+class _DispatchTable(dict):
+    """
+    The block processors which may apply to a block, in priority order, keyed by the first character of the block.
+
+    The lists are built on demand. An empty block (keyed by an empty string) is tested by every processor.
+    """
+
+    def __init__(self, snapshot: tuple[BlockProcessor, ...]):
+        super().__init__()
+        self.snapshot = snapshot
+        self.processors = [(processor, _trigger_re(processor)) for processor in snapshot]
+
+    def __missing__(self, char: str) -> list[BlockProcessor]:
+        processors = [
+            processor for processor, trigger in self.processors
+            if trigger is None or not char or trigger.match(char)
+        ]
+        self[char] = processors
+        return processors
+
+
 class BlockParser:
     """ Parse Markdown blocks into an `ElementTree` object.
 
@@ -96,6 +206,7 @@ class BlockParser:
         self.blockprocessors: util.Registry[BlockProcessor] = util.Registry()
         self.state = State()
         self.md = md
+        self._dispatch = _DispatchTable(())
 
     def parseDocument(self, lines: Iterable[str]) -> etree.ElementTree:
         """ Parse a Markdown document into an `ElementTree`.
@@ -133,9 +244,9 @@ class BlockParser:
             text: The text to parse.
 
         """
-        self.parseBlocks(parent, text.split('\n\n'))
+        self.parseBlocks(parent, BlockQueue(text.split('\n\n')))
 
-    def parseBlocks(self, parent: etree.Element, blocks: list[str]) -> None:
+    def parseBlocks(self, parent: etree.Element, blocks: list[str] | BlockQueue) -> None:
         """ Process blocks of Markdown text and attach to given `etree` node.
 
         Given a list of `blocks`, each `blockprocessor` is stepped through
@@ -143,6 +254,14 @@ class BlockParser:
         call this method directly, it's generally expected to be used
         internally.
 
+        The blocks are passed to each `blockprocessor` as a
+        [`BlockQueue`][markdown.blockparser.BlockQueue]. A `list` passed in is
+        emptied, as all of its blocks are parsed.
+
+        A `blockprocessor` which declares a
+        [`TRIGGER_RE`][markdown.blockprocessors.BlockProcessor.TRIGGER_RE] is
+        only tested against blocks whose first character it matches.
+
         This is a public method as an extension may need to add/alter
         additional `BlockProcessors` which call this method to recursively
         parse a nested block.
@@ -152,9 +271,23 @@ class BlockParser:
             blocks: The blocks of text to parse.
 
         """
-        while blocks:
-            for processor in self.blockprocessors:
-                if processor.test(parent, blocks[0]):
-                    if processor.run(parent, blocks) is not False:
+        queue = blocks if isinstance(blocks, BlockQueue) else BlockQueue(blocks)
+        table = self._dispatch_table()
+        while queue:
+            for processor in table[queue[0][:1]]:
+                if processor.test(parent, queue[0]):
+                    if processor.run(parent, queue) is not False:
                         # run returns True or None
                         break
+        if queue is not blocks:
+            blocks.clear()
+
+    def _dispatch_table(self) -> _DispatchTable:
+        """
+        Return the dispatch table of the registered block processors, building it again if a block processor was
+        registered or deregistered since it was built.
+        """
+        snapshot = self.blockprocessors.snapshot()
+        if snapshot is not self._dispatch.snapshot:
+            self._dispatch = _DispatchTable(snapshot)
+        return self._dispatch
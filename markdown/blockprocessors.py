@@ -32,6 +32,7 @@ import xml.etree.ElementTree as etree
 from typing import TYPE_CHECKING, Any
 from . import util
 from .blockparser import BlockParser
+from .postprocessors import RawHtmlPostprocessor
 
 if TYPE_CHECKING:  # pragma: no cover
     from markdown import Markdown
@@ -52,6 +53,7 @@ def build_block_parser(md: Markdown, **kwargs: Any) -> BlockParser:
     parser.blockprocessors.register(UListProcessor(parser), 'ulist', 30)
     parser.blockprocessors.register(BlockQuoteProcessor(parser), 'quote', 20)
     parser.blockprocessors.register(ReferenceProcessor(parser), 'reference', 15)
+    parser.blockprocessors.register(RawHtmlProcessor(parser), 'raw_html', 12)
     parser.blockprocessors.register(ParagraphProcessor(parser), 'paragraph', 10)
     return parser
 
@@ -71,6 +73,13 @@ class BlockProcessor:
 
     """
 
+    TRIGGER_RE: re.Pattern[str] | None = None
+    """
+    A regular expression which matches the first character of every block for which `test` may return `True`, or
+    `None` if any block may pass. The parser does not test the processor against a block whose first character does
+    not match. A subclass which overrides `test` or `__init__` must declare its own `TRIGGER_RE` for it to be used.
+    """
+
     def __init__(self, parser: BlockParser):
         self.parser = parser
         self.tab_length = parser.md.tab_length
@@ -166,6 +175,7 @@ class ListIndentProcessor(BlockProcessor):
     """ List of tags used for list items. """
     LIST_TYPES = ['ul', 'ol']
     """ Types of lists this processor can operate on. """
+    TRIGGER_RE = re.compile(r'[ ]')
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -251,6 +261,8 @@ class ListIndentProcessor(BlockProcessor):
 class CodeBlockProcessor(BlockProcessor):
     """ Process code blocks. """
 
+    TRIGGER_RE = re.compile(r'[ ]')
+
     def test(self, parent: etree.Element, block: str) -> bool:
         return block.startswith(' '*self.tab_length)
 
@@ -341,6 +353,7 @@ class OListProcessor(BlockProcessor):
     Markdown does not require the type of a new list item match the previous list item type.
     This is the list of types which can be mixed.
     """
+    TRIGGER_RE = re.compile(r'[ \d]')
 
     def __init__(self, parser: BlockParser):
         super().__init__(parser)
@@ -447,6 +460,7 @@ class UListProcessor(OListProcessor):
 
     TAG: str = 'ul'
     """ The tag used for the the wrapping element. """
+    TRIGGER_RE = re.compile(r'[ *+-]')
 
     def __init__(self, parser: BlockParser):
         super().__init__(parser)
@@ -550,6 +564,8 @@ class HRProcessor(BlockProcessor):
 class EmptyBlockProcessor(BlockProcessor):
     """ Process blocks that are empty or start with an empty line. """
 
+    TRIGGER_RE = re.compile(r'\n')
+
     def test(self, parent: etree.Element, block: str) -> bool:
         return not block or block.startswith('\n')
 
@@ -603,6 +619,48 @@ class ReferenceProcessor(BlockProcessor):
         return False
 
 
+class RawHtmlProcessor(BlockProcessor):
+    """
+    Process blocks which only hold the placeholder of a block-level raw HTML block.
+
+    Rather than wrapping the placeholder in a paragraph which is unwrapped again by the
+    [`RawHtmlPostprocessor`][markdown.postprocessors.RawHtmlPostprocessor], the HTML is taken from the
+    [`htmlStash`][markdown.util.HtmlStash] and inserted as a [`RawHtml`][markdown.util.RawHtml] node.
+    """
+
+    TRIGGER_RE = re.compile(r'[ %s]' % util.STX)
+
+    def test(self, parent: etree.Element, block: str) -> bool:
+        # The text of a paragraph in a tight list is added to the list item without a `p`.
+        return self.get_html(block) is not None and not self.parser.state.isstate('list')
+
+    def run(self, parent: etree.Element, blocks: list[str]) -> None:
+        parent.append(util.RawHtml(self.get_html(blocks.pop(0))))
+
+    def get_html(self, block: str) -> str | None:
+        """ Return the raw HTML if the block only holds the placeholder of block-level HTML. """
+        m = util.HTML_PLACEHOLDER_RE.fullmatch(block.lstrip())
+        if m:
+            index = int(m.group(1))
+            stash = self.parser.md.htmlStash
+            if index < stash.html_counter:
+                html = stash.rawHtmlBlocks[index]
+                if isinstance(html, str) and self.isblocklevel(html):
+                    return html
+        return None
+
+    def isblocklevel(self, html: str) -> bool:
+        """
+        Check if a block of HTML is block-level, as decided by the `raw_html` postprocessor which would otherwise
+        unwrap it. Without that postprocessor, the placeholder is left in a paragraph.
+        """
+        postprocessors = self.parser.md.postprocessors
+        if 'raw_html' not in postprocessors:
+            return False
+        postprocessor = postprocessors['raw_html']
+        return isinstance(postprocessor, RawHtmlPostprocessor) and postprocessor.isblocklevel(html)
+
+
 class ParagraphProcessor(BlockProcessor):
     """ Process Paragraph blocks. """
 
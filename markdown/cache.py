@@ -0,0 +1,317 @@
+# Python Markdown
+
+# A Python implementation of John Gruber's Markdown.
+
+# Documentation: https://python-markdown.github.io/
+# GitHub: https://github.com/Python-Markdown/markdown/
+# PyPI: https://pypi.org/project/Markdown/
+
+# Started by Manfred Stienstra (http://www.dwerg.net/).
+# Maintained for a few years by Yuri Takhteyev (http://www.freewisdom.org).
+# Currently maintained by Waylan Limberg (https://github.com/waylan),
+# Dmitry Shachnev (https://github.com/mitya57) and Isaac Muse (https://github.com/facelessuser).
+
+# Copyright 2007-2023 The Python Markdown Project (v. 1.7 and later)
+# Copyright 2004, 2005, 2006 Yuri Takhteyev (v. 0.2-1.6b)
+# Copyright 2004 Manfred Stienstra (the original version)
+
+# License: BSD (see LICENSE.md for details).
+
+"""
+Cache the output of [`Markdown.convert`][markdown.Markdown.convert] by the content of the document.
+
+Caching is opt-in. Pass a [`RenderCache`][markdown.cache.RenderCache] as the `cache` keyword argument of a
+[`Markdown`][markdown.Markdown] instance (or of [`markdown.markdown`][]) and the output of each document is stored
+under a key which is a hash of the source text, the keyword arguments of the instance (its extensions, their
+configs, the output format and so on) and the version of Python-Markdown:
+
+```python
+cache = MemoryCache(maxsize=64 * 1024 * 1024)
+md = markdown.Markdown(extensions=['toc'], cache=cache)
+html = md.convert(text)
+toc = md.toc
+```
+
+When a document is found in the cache, none of the processors run and the side outputs of the document (`toc` and
+`toc_tokens` of the [TOC](../extensions/toc.md) extension and `Meta` of the [Meta-Data](../extensions/meta_data.md)
+extension) are restored from the cache. Any other state which extensions set on the instance is not.
+
+The documents of an instance whose keyword arguments cannot be told apart from those of other instances by their
+value (such as a lambda or a closure passed as a config option, or an object without a `repr` of its own) are
+converted as if it had no cache.
+
+The key only depends on the keyword arguments an instance was created with. An instance which is changed in any
+other way after it is created (for example, by registering a processor on it) must not share a cache with instances
+which are not changed in the same way.
+
+A cache may be shared by any number of instances (for example, by each instance of a
+[`MarkdownPool`][markdown.MarkdownPool]) and is thread-safe. A clone of an instance shares its cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import types
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, NamedTuple
+
+from .__meta__ import __version__
+from .extensions import Extension
+
+if TYPE_CHECKING:  # pragma: no cover
+    from markdown import ConversionResult
+
+__all__ = ['RenderCache', 'MemoryCache', 'DiskCache', 'CachedRender', 'CacheStats']
+
+
+class CachedRender(NamedTuple):
+    """ The output of a single document stored in a cache. """
+    html: str
+    """ The converted document. """
+    toc: str | None
+    """ The rendered table of contents or `None` if the TOC extension was not in use. """
+    toc_tokens: list[dict[str, Any]] | None
+    """ The table of contents as a list of tokens or `None` if the TOC extension was not in use. """
+    Meta: dict[str, list[str]] | None
+    """ The meta-data of the document or `None` if the Meta-Data extension was not in use. """
+
+
+class CacheStats(NamedTuple):
+    """ A snapshot of the counters of a [`RenderCache`][markdown.cache.RenderCache]. """
+    hits: int
+    """ The number of documents found in the cache. """
+    misses: int
+    """ The number of documents not found in the cache, which were converted. """
+    evictions: int
+    """ The number of documents removed from the cache to make room for others. """
+
+
+def _encode_setting(value: Any) -> Any:
+    """
+    Return a value which stands for `value` in the key of a document if `value` is not a JSON type.
+
+    Raise `TypeError` if `value` cannot be told apart from other values by its name or its `repr` (such as a lambda,
+    a closure or an object with the default `repr`).
+    """
+    if isinstance(value, Extension):
+        return [_encode_setting(type(value)), value.getConfigs()]
+    if isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        name = f'{value.__module__}.{value.__qualname__}'
+        # All lambdas have the same name and functions or classes defined in a function may differ between calls.
+        if '<lambda>' in name or '<locals>' in name:
+            raise TypeError(f'Cannot key the setting {value!r}')
+        return name
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(item) for item in value)
+    text = repr(value)
+    # The default `repr` (which may also be part of the `repr` of a bound method or a partial function) only
+    # tells an object apart from others alive at the same time in the same process.
+    if type(value).__repr__ is object.__repr__ or ' at 0x' in text:
+        raise TypeError(f'Cannot key the setting {text}')
+    return text
+
+
+class RenderCache:
+    """
+    The base class of render caches, which keeps the counters and encodes the stored documents.
+
+    Subclasses store the encoded documents by overriding [`load`][markdown.cache.RenderCache.load],
+    [`store`][markdown.cache.RenderCache.store] and [`clear`][markdown.cache.RenderCache.clear].
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __copy__(self) -> RenderCache:
+        # A cache is shared by the instances it is assigned to, including copies made by `Markdown.clone`.
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> RenderCache:
+        return self
+
+    def settings(self, kwargs: Mapping[str, Any]) -> str | None:
+        """
+        Return the part of the key of each document which stands for the keyword arguments of an instance or `None`
+        if they cannot be encoded faithfully, in which case the documents of the instance are not cached.
+        """
+        settings = {name: value for name, value in kwargs.items() if name != 'cache'}
+        try:
+            return json.dumps([__version__, settings], sort_keys=True, default=_encode_setting)
+        except (TypeError, ValueError):
+            # A setting which cannot be keyed, a dictionary with keys of different types (which cannot be sorted)
+            # or a circular reference.
+            return None
+
+    def key(self, source: str, settings: str) -> str:
+        """ Return the key of the document `source` converted with `settings`. """
+        digest = hashlib.sha256(settings.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(source.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedRender | None:
+        """ Return the document stored under `key` or `None` if there is none. """
+        data = self.load(key)
+        render = None
+        if data is not None:
+            try:
+                render = CachedRender(*json.loads(data))
+            except (ValueError, TypeError):
+                # A corrupt entry is converted again and replaced.
+                pass
+        with self._lock:
+            if render is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return render
+
+    def set(self, key: str, render: CachedRender | ConversionResult) -> None:
+        """ Store the output of a document (without the `error` of a `ConversionResult`) under `key`. """
+        data = json.dumps(list(render[:4]), separators=(',', ':')).encode('utf-8')
+        evicted = self.store(key, data)
+        if evicted:
+            with self._lock:
+                self._evictions += evicted
+
+    def stats(self) -> CacheStats:
+        """ Return a snapshot of the counters of the cache. """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions)
+
+    def load(self, key: str) -> bytes | None:
+        """ Return the encoded document stored under `key` or `None` if there is none. """
+        raise NotImplementedError  # pragma: no cover
+
+    def store(self, key: str, data: bytes) -> int:
+        """ Store the encoded document `data` under `key` and return the number of documents evicted to do so. """
+        raise NotImplementedError  # pragma: no cover
+
+    def clear(self) -> None:
+        """ Remove all documents from the cache. The counters are not reset. """
+        raise NotImplementedError  # pragma: no cover
+
+
+class MemoryCache(RenderCache):
+    """
+    A cache which holds the documents in memory and evicts the least recently used ones when it is full.
+
+    Attributes:
+        maxsize (int): The maximum number of bytes of encoded documents held by the cache.
+        size (int): The number of bytes of encoded documents currently held by the cache.
+
+    """
+
+    def __init__(self, maxsize: int = 32 * 1024 * 1024):
+        """
+        Create a new cache.
+
+        Arguments:
+            maxsize: The maximum number of bytes of encoded documents held by the cache. A document which is larger
+                than `maxsize` is not stored. Default: 32 MiB.
+
+        """
+        super().__init__()
+        self.maxsize = maxsize
+        self.size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def store(self, key: str, data: bytes) -> int:
+        if len(data) > self.maxsize:
+            return 0
+        evicted = 0
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            while self.size + len(data) > self.maxsize:
+                self.size -= len(self._entries.popitem(last=False)[1])
+                evicted += 1
+            self._entries[key] = data
+            self.size += len(data)
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class DiskCache(RenderCache):
+    """
+    A cache which stores each document in a file of a directory, so that it may be shared between processes and
+    outlive them.
+
+    Documents are never evicted. Remove the files of the directory (or call [`clear`][markdown.cache.DiskCache.clear])
+    to free the space they use.
+
+    Attributes:
+        directory (str): The directory which holds the documents.
+
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        """
+        Create a new cache.
+
+        Arguments:
+            directory: The directory which holds the documents. It is created if it does not exist.
+
+        """
+        super().__init__()
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def _paths(self) -> Iterator[str]:
+        """ Return the paths of the files of all documents in the cache. """
+        for entry in os.scandir(self.directory):
+            if entry.is_dir() and len(entry.name) == 2:
+                for file in os.scandir(entry.path):
+                    if file.name.endswith('.json'):
+                        yield file.path
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._paths())
+
+    def load(self, key: str) -> bytes | None:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, data: bytes) -> int:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a file of a unique name first so that no process ever reads a partly written document.
+        temp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+        return 0
+
+    def clear(self) -> None:
+        for path in list(self._paths()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
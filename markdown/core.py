@@ -20,29 +20,73 @@
 from __future__ import annotations
 
 import codecs
+import copy
+import io
+import re
 import sys
+import types
 import logging
 import importlib
-from typing import TYPE_CHECKING, Any, BinaryIO, Callable, ClassVar, Mapping, Sequence
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Callable, ClassVar, Iterable, Iterator, Literal, Mapping, NamedTuple, Sequence,
+    TextIO
+)
 from . import util
 from .preprocessors import build_preprocessors
-from .blockprocessors import build_block_parser
+from .blockparser import BlockParser
+from .blockprocessors import BlockProcessor, build_block_parser
 from .treeprocessors import build_treeprocessors
-from .inlinepatterns import build_inlinepatterns
+from .inlinepatterns import Pattern, build_inlinepatterns
 from .postprocessors import build_postprocessors
 from .extensions import Extension
-from .serializers import to_html_string, to_xhtml_string
+from .serializers import to_html_string, to_xhtml_string, _iter_html, _write_html_content
+from .profiler import Profiler
 from .util import BLOCK_LEVEL_ELEMENTS
 
 if TYPE_CHECKING:  # pragma: no cover
     from xml.etree.ElementTree import Element
+    from .cache import RenderCache
 
-__all__ = ['Markdown', 'markdown', 'markdownFromFile']
+__all__ = [
+    'Markdown', 'markdown', 'markdownFromFile', 'convert_many', 'ConversionResult', 'MarkdownPool', 'PoolStats',
+    'MarkdownPrototype'
+]
 
 
 logger = logging.getLogger('MARKDOWN')
 
 
+_CONTENT_FORMATS: dict[Callable[[Element], str], Literal['html', 'xhtml']] = {
+    to_html_string: 'html',
+    to_xhtml_string: 'xhtml',
+}
+""" The built-in serializers, which can serialize the content of the root without the top-level tags. """
+
+
+class ConversionResult(NamedTuple):
+    """
+    The result of converting a single document with [`Markdown.convert_many`][markdown.Markdown.convert_many].
+
+    Side outputs which are only set by some extensions (`toc` and `toc_tokens` by the
+    [TOC](../extensions/toc.md) extension and `Meta` by the [Meta-Data](../extensions/meta_data.md)
+    extension) are `None` when the extension is not in use.
+    """
+    html: str | None
+    """ The converted document or `None` if the conversion failed. """
+    toc: str | None
+    """ The rendered table of contents. """
+    toc_tokens: list[dict[str, Any]] | None
+    """ The table of contents as a list of tokens. """
+    Meta: dict[str, list[str]] | None
+    """ The meta-data of the document. """
+    error: Exception | None
+    """ The exception raised while converting the document or `None` on success. """
+
+
 class Markdown:
     """
     A parser which converts Markdown to HTML.
@@ -71,6 +115,10 @@ class Markdown:
         Markdown.inlinePatterns (util.Registry): A collection of [`inlinepatterns`][markdown.inlinepatterns].
         Markdown.treeprocessors (util.Registry): A collection of [`treeprocessors`][markdown.treeprocessors].
         Markdown.postprocessors (util.Registry): A collection of [`postprocessors`][markdown.postprocessors].
+        Markdown.profiler (profiler.Profiler | None): A [`Profiler`][markdown.profiler.Profiler] which records
+            the time spent in each processor during a conversion. Default: `None`.
+        Markdown.cache (cache.RenderCache | None): A [`RenderCache`][markdown.cache.RenderCache] which stores the
+            output of each conversion by the content of the document. Default: `None`.
 
     """
 
@@ -103,9 +151,12 @@ class Markdown:
                 * `xhtml`: Outputs XHTML style tags. Default.
                 * `html`: Outputs HTML style tags.
             tab_length (int): Length of tabs in the source. Default: `4`
+            cache (RenderCache): A [`RenderCache`][markdown.cache.RenderCache] which stores the output of each
+                conversion. Default: `None`.
 
         """
 
+        self._init_kwargs: dict[str, Any] = kwargs
         self.tab_length: int = kwargs.get('tab_length', 4)
 
         self.ESCAPED_CHARS: list[str] = [
@@ -118,6 +169,8 @@ class Markdown:
         self.registeredExtensions: list[Extension] = []
         self.docType = ""  # TODO: Maybe delete this. It does not appear to be used anymore.
         self.stripTopLevelTags: bool = True
+        self.profiler: Profiler | None = None
+        self.cache: RenderCache | None = kwargs.get('cache')
 
         self.build_parser()
 
@@ -203,7 +256,8 @@ class Markdown:
         Returns:
             An instance of the extension with the given configuration settings.
 
-        First attempt to load an entry point. The string name must be registered as an entry point in the
+        First attempt to load an entry point (see [`get_extension_class`][markdown.util.get_extension_class]). The
+        string name must be the name of a built-in extension or be registered as an entry point in the
         `markdown.extensions` group which points to a subclass of the [`markdown.extensions.Extension`][] class.
         If multiple distributions have registered the same name, the first one found is returned.
 
@@ -213,10 +267,9 @@ class Markdown:
         """
         configs = dict(configs)
 
-        entry_points = [ep for ep in util.get_installed_extensions() if ep.name == ext_name]
-        if entry_points:
-            ext = entry_points[0].load()
-            return ext(**configs)
+        extension_class = util.get_extension_class(ext_name)
+        if extension_class is not None:
+            return extension_class(**configs)
 
         # Get class name (if provided): `path.to.module:ClassName`
         ext_name, class_name = ext_name.split(':', 1) if ':' in ext_name else (ext_name, '')
@@ -285,6 +338,8 @@ class Markdown:
 
         """
         self.output_format = format.lower().rstrip('145')  # ignore number
+        # The output format is part of the key of each document in the cache.
+        self._cache_settings: str | None = None
         try:
             self.serializer = self.output_formats[self.output_format]
         except KeyError as e:
@@ -343,9 +398,113 @@ class Markdown:
 
         """
 
+        if self.cache is not None:
+            return self._convert_cached(source)
+        with self._profiling():
+            return self._serialize(self._build_tree(source))
+
+    def _cache_key(self, source: str) -> str | None:
+        """ Return the key of `source` in the cache or `None` if the documents of this instance are not cached. """
+        if self._cache_settings is None:
+            # An empty string stands for settings which cannot be keyed.
+            settings = self.cache.settings(dict(self._init_kwargs, output_format=self.output_format))
+            self._cache_settings = settings or ''
+        if not self._cache_settings:
+            return None
+        return self.cache.key(source, self._cache_settings)
+
+    def _convert_cached(self, source: str) -> str:
+        """ Return the output of `source` from the cache or convert it and store it in the cache. """
+        key = self._cache_key(source)
+        if key is None:
+            with self._profiling():
+                return self._serialize(self._build_tree(source))
+        render = self.cache.get(key)
+        if render is None:
+            with self._profiling():
+                html = self._serialize(self._build_tree(source))
+            self.cache.set(key, ConversionResult(html, *self._side_outputs(), None))
+            return html
+        for name, value in zip(('toc', 'toc_tokens', 'Meta'), render[1:]):
+            if value is not None:
+                setattr(self, name, value)
+        return render.html
+
+    def _side_outputs(self) -> tuple[str | None, list[dict[str, Any]] | None, dict[str, list[str]] | None]:
+        """ Return the side outputs of the last conversion which are kept by a `ConversionResult`. """
+        return getattr(self, 'toc', None), getattr(self, 'toc_tokens', None), getattr(self, 'Meta', None)
+
+    @contextmanager
+    def _profiling(self) -> Iterator[None]:
+        """ Profile the conversion run in the body of the `with` statement if a profiler is set. """
+        if self.profiler is None:
+            yield
+            return
+        session = self.profiler.start(self)
+        try:
+            yield
+        except BaseException:
+            # Do not let the callback hide the error of the conversion.
+            session.stop(callback=False)
+            raise
+        session.stop()
+
+    def _serialize(self, root: Element | None) -> str:
+        """ Serialize the tree, strip the top-level tags and run the postprocessors. """
+        if root is None:
+            return ''  # a blank Unicode string
+
+        format = self._content_format(root)
+        if format is not None:
+            # Serialize the content of the root only, which strips the top-level tags.
+            output = self._serialize_content(root, format)
+        else:
+            # Serialize _properly_.  Strip top-level tags.
+            output = self.serializer(root)
+            if self.stripTopLevelTags:
+                try:
+                    start = output.index(
+                        '<%s>' % self.doc_tag) + len(self.doc_tag) + 2
+                    end = output.rindex('</%s>' % self.doc_tag)
+                    output = output[start:end].strip()
+                except ValueError as e:  # pragma: no cover
+                    if output.strip().endswith('<%s />' % self.doc_tag):
+                        # We have an empty document
+                        output = ''
+                    else:
+                        # We have a serious problem
+                        raise ValueError('Markdown failed to strip top-level '
+                                         'tags. Document=%r' % output.strip()) from e
+
+        # Run the text post-processors
+        for pp in self.postprocessors:
+            output = pp.run(output)
+
+        return output.strip()
+
+    def _content_format(self, root: Element) -> Literal['html', 'xhtml'] | None:
+        """
+        Return the output format if the top-level tags can be stripped by serializing only the content of `root`
+        with a built-in serializer. Otherwise, return `None`.
+        """
+        if self.stripTopLevelTags and root.tag == self.doc_tag and not root.attrib:
+            # The serializer may be wrapped (for example, by a profiler).
+            return _CONTENT_FORMATS.get(getattr(self.serializer, '__wrapped__', self.serializer))
+        return None
+
+    def _serialize_content(self, root: Element, format: Literal['html', 'xhtml']) -> str:
+        """ Serialize the content of `root` without the top-level tags in the output format `format`. """
+        return _write_html_content(root, format)
+
+    def _iter_content(self, root: Element, format: Literal['html', 'xhtml']) -> Iterator[str]:
+        """ Serialize the content of `root` in the output format `format` one top-level element at a time. """
+        return _iter_html(root, format)
+
+    def _build_tree(self, source: str) -> Element | None:
+        """ Run the preprocessors, the parser and the treeprocessors. Return `None` for a blank document. """
         # Fix up the source text
         if not source.strip():
-            return ''  # a blank Unicode string
+            return None
 
         try:
             source = str(source)
@@ -368,28 +527,135 @@ class Markdown:
             if newRoot is not None:
                 root = newRoot
 
-        # Serialize _properly_.  Strip top-level tags.
-        output = self.serializer(root)
-        if self.stripTopLevelTags:
-            try:
-                start = output.index(
-                    '<%s>' % self.doc_tag) + len(self.doc_tag) + 2
-                end = output.rindex('</%s>' % self.doc_tag)
-                output = output[start:end].strip()
-            except ValueError as e:  # pragma: no cover
-                if output.strip().endswith('<%s />' % self.doc_tag):
-                    # We have an empty document
-                    output = ''
-                else:
-                    # We have a serious problem
-                    raise ValueError('Markdown failed to strip top-level '
-                                     'tags. Document=%r' % output.strip()) from e
+        return root
 
-        # Run the text post-processors
-        for pp in self.postprocessors:
-            output = pp.run(output)
+    def convert_to(self, source: str, stream: TextIO | BinaryIO, encoding: str | None = None) -> Markdown:
+        """
+        Convert a Markdown string and write the output to a text or binary stream.
 
-        return output.strip()
+        The output is the same as that of [`convert`][markdown.Markdown.convert]. However, when the output format is
+        one of the built-in formats, the top-level tags are stripped and every postprocessor sets
+        [`CHUNKED`][markdown.postprocessors.Postprocessor.CHUNKED], each top-level element is serialized, passed
+        through the postprocessors and written to `stream` in turn. The output of the document is never held in
+        memory as a whole. Otherwise, the output of [`convert`][markdown.Markdown.convert] is written to `stream`.
+
+        Arguments:
+            source: Markdown formatted text as Unicode or ASCII string.
+            stream: A writable text stream or binary stream, such as an open file or the file object of a socket.
+            encoding: Encoding of the output when `stream` is a binary stream. Defaults to `utf-8`. The
+                [`xmlcharrefreplace`](https://docs.python.org/3/library/codecs.html#error-handlers)
+                error handler is used when encoding the output.
+
+        !!! warning
+            The Python-Markdown library does ***not*** sanitize its HTML output.
+            If you are processing Markdown input from an untrusted source, it is your
+            responsibility to ensure that it is properly sanitized. For more
+            information see [Sanitizing HTML Output](../../sanitization.md).
+
+        """
+        if isinstance(stream, io.TextIOBase):
+            write = stream.write
+        else:
+            write = codecs.getwriter(encoding or 'utf-8')(stream, errors='xmlcharrefreplace').write
+        if self.cache is not None:
+            # The output of a document is cached as a whole.
+            write(self._convert_cached(source))
+            return self
+        with self._profiling():
+            self._write(self._build_tree(source), write)
+        return self
+
+    def _write(self, root: Element | None, write: Callable[[str], Any]) -> None:
+        """ Serialize the tree and write it in chunks if possible. """
+        if root is None:
+            return
+        format = self._content_format(root)
+        if format is None or not all(pp.CHUNKED for pp in self.postprocessors):
+            write(self._serialize(root))
+            return
+
+        # Strip the whitespace from both ends of the output as a whole. Whitespace at the end of a chunk is held
+        # back until it is known whether any more output follows it.
+        pending = None
+        for chunk in self._iter_content(root, format):
+            for pp in self.postprocessors:
+                chunk = pp.run(chunk)
+            body = chunk.rstrip()
+            if pending is None:
+                body = body.lstrip()
+                if not body:
+                    continue
+                pending = ''
+            if body:
+                write(pending + body)
+                pending = chunk[len(chunk.rstrip()):]
+            else:
+                pending += chunk
+
+    def convert_many(
+        self,
+        sources: Iterable[str],
+        workers: int = 1,
+        chunksize: int = 1
+    ) -> list[ConversionResult]:
+        """
+        Convert a batch of Markdown strings and return a result for each in input order.
+
+        The instance is [`reset`][markdown.Markdown.reset] after each document. An exception raised while
+        converting a document does not stop the batch. Instead, it is returned as the `error` of that
+        document's [`ConversionResult`][markdown.ConversionResult]. If the instance has a
+        [`cache`][markdown.cache.RenderCache], the documents are looked up in the cache in this process and only
+        those which are not found are converted by the worker processes.
+
+        Arguments:
+            sources: An iterable of Markdown formatted text.
+            workers: The number of worker processes to use. When greater than `1`, each worker process builds
+                its own instance from the keyword arguments this instance was created with, so they must be
+                picklable. Any changes made to this instance after it was created are not seen by the workers.
+                Otherwise, all documents are converted by this instance in the current process.
+            chunksize: The number of documents sent to a worker process at a time.
+
+        Returns:
+            A list of [`ConversionResult`][markdown.ConversionResult] objects.
+
+        """
+        if workers < 2:
+            return [self._convert_result(source) for source in sources]
+        if self.cache is None:
+            return _convert_in_pool(self.__class__, self._init_kwargs, sources, workers, chunksize)
+        # Look the documents up in this process and only send the misses to the workers, which do not use a cache.
+        sources = list(sources)
+        keys: list[str | None] = []
+        results: list[ConversionResult | None] = []
+        for source in sources:
+            try:
+                key = self._cache_key(source)
+            except Exception:
+                # The error is reported by the conversion of the document.
+                key = render = None
+            else:
+                render = None if key is None else self.cache.get(key)
+            keys.append(key)
+            results.append(None if render is None else ConversionResult(*render, None))
+        misses = [i for i, result in enumerate(results) if result is None]
+        kwargs = {name: value for name, value in self._init_kwargs.items() if name != 'cache'}
+        converted = _convert_in_pool(self.__class__, kwargs, [sources[i] for i in misses], workers, chunksize)
+        for i, result in zip(misses, converted):
+            if result.error is None and keys[i] is not None:
+                self.cache.set(keys[i], result)
+            results[i] = result
+        return results
+
+    def _convert_result(self, source: str) -> ConversionResult:
+        """ Convert a single document, collect the side outputs and reset the instance. """
+        try:
+            html = self.convert(source)
+        except Exception as e:
+            result = ConversionResult(None, None, None, None, e)
+        else:
+            result = ConversionResult(html, *self._side_outputs(), None)
+        self.reset()
+        return result
 
     def convertFile(
         self,
@@ -441,36 +707,389 @@ class Markdown:
 
         text = text.lstrip('\ufeff')  # remove the byte-order mark
 
-        # Convert
-        html = self.convert(text)
-
-        # Write to file or stdout
+        # Convert and write to file or stdout
         if output:
             if isinstance(output, str):
-                output_file = codecs.open(output, "w",
-                                          encoding=encoding,
-                                          errors="xmlcharrefreplace")
-                output_file.write(html)
-                output_file.close()
+                with open(output, mode="wb") as output_file:
+                    self.convert_to(text, output_file, encoding)
             else:
-                writer = codecs.getwriter(encoding)
-                output_file = writer(output, errors="xmlcharrefreplace")
-                output_file.write(html)
+                self.convert_to(text, output, encoding)
                 # Don't close here. User may want to write more.
         else:
-            # Encode manually and write bytes to stdout.
-            html = html.encode(encoding, "xmlcharrefreplace")
-            sys.stdout.buffer.write(html)
+            # Write encoded bytes to stdout.
+            self.convert_to(text, sys.stdout.buffer, encoding)
 
         return self
 
+    def clone(self) -> Markdown:
+        """
+        Return an independent copy of this instance with a fresh document state.
+
+        The copy has the same configuration as this instance, including any processors or extensions which were
+        registered after it was created, but none of the extensions are loaded or set up again. Compiled regular
+        expressions, functions and the `config` of each extension are shared with this instance and should be
+        treated as read-only. All other state (the processors, the registries, the stash, etc.) belongs to the
+        copy alone.
+
+        This instance must not be converting a document while it is being cloned. As the whole instance is walked
+        on each call, a single copy costs about as much as building a new instance. To stamp out many copies of the
+        same configuration, use a [`MarkdownPrototype`][markdown.MarkdownPrototype], which only walks it once.
+
+        """
+        return _ClonePlan(self).replay()
+
+
+# Types which are immutable (or are treated as such) or are meant to be shared between instances, and so are
+# shared by `Markdown.clone`.
+_SHARED_TYPES = frozenset({
+    type(None), bool, int, float, complex, str, bytes, util.AtomicString, range, frozenset, re.Pattern, type,
+    types.FunctionType, types.BuiltinFunctionType, types.ModuleType, Profiler,
+})
+
+# Classes whose instances are copied attribute by attribute by `Markdown.clone`.
+_CLONED_TYPES = (
+    Markdown, Extension, util.Processor, util.Registry, util.HtmlStash, BlockParser, BlockProcessor, Pattern
+)
+
+# Kinds of nodes in a `_ClonePlan`.
+_OBJECT, _CONTAINER, _OPAQUE = range(3)
+
+
+def _is_shared(value: Any) -> bool:
+    """ Return `True` if `value` may be shared between a `Markdown` instance and its clones. """
+    if type(value) in _SHARED_TYPES:
+        return True
+    return isinstance(value, tuple) and all(type(item) in _SHARED_TYPES for item in value)
+
+
+class _ClonePlan:
+    """
+    A flattened copy of the object graph of a `Markdown` instance.
+
+    The graph is walked once and each mutable object in it is recorded along with the positions at which it
+    refers to other mutable objects. `replay` then creates a shallow copy of
+    every recorded object and patches those references to point to the new copies, which is much cheaper than
+    building the instance again. Objects of unknown types are copied with [`copy.deepcopy`][copy.deepcopy].
+
+    The plan keeps references to the objects of the graph and copies their current state on each replay.
+    """
+
+    def __init__(self, md: Markdown):
+        self.sources: list[Any] = [md]
+        self.nodes: list[tuple[int, Any, Any, list[tuple[Any, int]], list[tuple[int, int]] | None]] = []
+        index = {id(md): 0}
+
+        def refs_of(pairs: Iterable[tuple[Any, Any]]) -> list[tuple[Any, int]]:
+            """ Return the positions in `pairs` which refer to objects to copy, recording any new objects. """
+            refs = []
+            for key, value in pairs:
+                if type(value) in _SHARED_TYPES or _is_shared(value):
+                    continue
+                i = index.get(id(value))
+                if i is None:
+                    i = index[id(value)] = len(self.sources)
+                    self.sources.append(value)
+                refs.append((key, i))
+            return refs
+
+        # Lists which are known to only hold shared values and need not be searched for references.
+        flat: set[int] = set()
+        opaque = False
+        pos = 0
+        while pos < len(self.sources):
+            obj = self.sources[pos]
+            pos += 1
+            items = None
+            if isinstance(obj, _CLONED_TYPES) and hasattr(obj, '__dict__'):
+                state = attrs = obj.__dict__
+                if isinstance(obj, Extension) and 'config' in attrs:
+                    attrs = {key: value for key, value in attrs.items() if key != 'config'}
+                elif isinstance(obj, util.Registry):
+                    # The sorted order of a registry is a list of `(name, priority)` tuples. The cached views of
+                    # the sorted items are left out and built again by the copy.
+                    flat.add(id(obj._priority))
+                    state = attrs = {
+                        key: value for key, value in attrs.items() if key not in ('_items', '_index')
+                    }
+                    state['_is_sorted'] = False
+                refs = refs_of(attrs.items())
+                if isinstance(obj, list):
+                    items = refs_of(enumerate(obj))
+                self.nodes.append((_OBJECT, type(obj), state, refs, items))
+            elif isinstance(obj, (list, dict)):
+                if id(obj) in flat:
+                    refs = []
+                else:
+                    refs = refs_of(obj.items() if isinstance(obj, dict) else enumerate(obj))
+                copier = obj.copy if type(obj) in (list, dict) else partial(copy.copy, obj)
+                self.nodes.append((_CONTAINER, copier, None, refs, None))
+            elif isinstance(obj, (set, bytearray)):
+                # Set members are hashable, and so are shared.
+                self.nodes.append((_CONTAINER, partial(copy.copy, obj), None, [], None))
+            else:
+                opaque = True
+                self.nodes.append((_OPAQUE, None, None, [], None))
+        self.opaque = opaque
+
+    def replay(self) -> Markdown:
+        """ Create a new copy of the recorded graph and return its (reset) `Markdown` instance. """
+        new: list[Any] = []
+        for kind, factory, state, refs, items in self.nodes:
+            if kind == _OBJECT:
+                new.append(factory.__new__(factory))
+            elif kind == _CONTAINER:
+                new.append(factory())
+            else:
+                new.append(None)
+        if self.opaque:
+            memo = {id(obj): copied for obj, copied in zip(self.sources, new) if copied is not None}
+            for i, (kind, *_) in enumerate(self.nodes):
+                if kind == _OPAQUE:
+                    new[i] = copy.deepcopy(self.sources[i], memo)
+        for (kind, factory, state, refs, items), source, obj in zip(self.nodes, self.sources, new):
+            if kind == _OBJECT:
+                attrs = state.copy()
+                for key, i in refs:
+                    attrs[key] = new[i]
+                obj.__dict__ = attrs
+                if items is not None:
+                    # An instance of a subclass of `list` (such as `State`) also copies its items.
+                    values = list(source)
+                    for key, i in items:
+                        values[key] = new[i]
+                    obj.extend(values)
+            elif kind == _CONTAINER:
+                for key, i in refs:
+                    obj[key] = new[i]
+        md = new[0]
+        md.reset()
+        return md
+
+
+class MarkdownPrototype:
+    """
+    A snapshot of a configured [`Markdown`][markdown.Markdown] instance which stamps out independent copies.
+
+    The snapshot is taken when the prototype is created, so that later changes to the original instance do not
+    affect it. Each call to [`new`][markdown.MarkdownPrototype.new] returns a copy equivalent to one returned by
+    [`Markdown.clone`][markdown.Markdown.clone], but at a fraction of the cost of building a new instance. A
+    prototype may be shared between threads.
+
+    ```python
+    prototype = markdown.MarkdownPrototype(markdown.Markdown(extensions=['toc', 'footnotes']))
+    md = prototype.new()
+    ```
+    """
+
+    def __init__(self, md: Markdown):
+        """
+        Create a new prototype.
+
+        Arguments:
+            md: A configured instance. It must not be converting a document while the snapshot is taken.
+
+        """
+        self._plan = _ClonePlan(md.clone())
+
+    def new(self) -> Markdown:
+        """ Return a new independent instance with a fresh document state. """
+        return self._plan.replay()
+
+
+class PoolStats(NamedTuple):
+    """ A snapshot of the counters of a [`MarkdownPool`][markdown.MarkdownPool]. """
+    hits: int
+    """ The number of checkouts served by an idle instance. """
+    misses: int
+    """ The number of checkouts which required a new instance to be built. """
+    discarded: int
+    """ The number of returned instances which were discarded to shrink the pool. """
+    construction_time: float
+    """ The total time (in seconds) spent building instances. """
+    size: int
+    """ The number of instances currently owned by the pool (both idle and checked out). """
+    idle: int
+    """ The number of idle instances waiting to be checked out. """
+
+
+class MarkdownPool:
+    """
+    A thread-safe pool of reusable [`Markdown`][markdown.Markdown] instances.
+
+    As an instance of `Markdown` holds the state of the document being converted, it cannot be shared between
+    threads. A pool hands out one instance per checkout and [`reset`][markdown.Markdown.reset]s it when it is
+    returned, so that the cost of building an instance is only paid when no idle instance is available.
+
+    ```python
+    pool = markdown.MarkdownPool(maxsize=8, extensions=['toc'])
+    with pool.checkout() as md:
+        html = md.convert(text)
+        toc = md.toc
+    ```
+    """
+
+    def __init__(self, maxsize: int = 0, max_idle: int | None = None, **kwargs: Any):
+        """
+        Create a new pool.
+
+        Arguments:
+            maxsize: The maximum number of instances owned by the pool at once. When all instances are checked out,
+                [`acquire`][markdown.MarkdownPool.acquire] waits for one to be returned. A value of `0` allows
+                the pool to grow without limit.
+            max_idle: The maximum number of idle instances kept for reuse. Any instance returned beyond this
+                number is discarded. Defaults to `maxsize` (or no limit if `maxsize` is `0`).
+
+        Keyword arguments:
+            **kwargs: Any arguments accepted by the [`Markdown`][markdown.Markdown] class.
+
+        """
+        self.maxsize = maxsize
+        self.max_idle = (maxsize or None) if max_idle is None else max_idle
+        self.kwargs = kwargs
+        self._idle: list[Markdown] = []
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._discarded = 0
+        self._construction_time = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, block: bool = True, timeout: float | None = None) -> Markdown:
+        """
+        Check out an instance from the pool.
+
+        An idle instance is returned if one is available. Otherwise, a new instance is built unless the pool has
+        reached `maxsize`, in which case the call waits for an instance to be returned with
+        [`release`][markdown.MarkdownPool.release].
+
+        Arguments:
+            block: Wait for an instance to be returned when the pool is exhausted.
+            timeout: The maximum number of seconds to wait. Wait forever if `None`.
+
+        Raises:
+            TimeoutError: If no instance is available before `timeout` expires or if `block` is `False`
+                and the pool is exhausted.
+
+        """
+        with self._condition:
+            if not self._idle and self.maxsize and self._size >= self.maxsize:
+                if not block or not self._condition.wait_for(
+                    lambda: self._idle or self._size < self.maxsize, timeout
+                ):
+                    raise TimeoutError('No Markdown instance is available in the pool.')
+            if self._idle:
+                self._hits += 1
+                return self._idle.pop()
+            self._misses += 1
+            self._size += 1
+        try:
+            start = time.perf_counter()
+            md = Markdown(**self.kwargs)
+            elapsed = time.perf_counter() - start
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._construction_time += elapsed
+        return md
+
+    def release(self, md: Markdown) -> None:
+        """
+        Reset an instance and return it to the pool. If the instance fails to reset, it is discarded and the
+        exception is raised.
+
+        Arguments:
+            md: An instance previously checked out with [`acquire`][markdown.MarkdownPool.acquire].
+
+        """
+        try:
+            md.reset()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._discarded += 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            if self.max_idle is not None and len(self._idle) >= self.max_idle:
+                self._size -= 1
+                self._discarded += 1
+            else:
+                self._idle.append(md)
+            self._condition.notify()
+
+    @contextmanager
+    def checkout(self, block: bool = True, timeout: float | None = None) -> Iterator[Markdown]:
+        """
+        A context manager which [`acquire`][markdown.MarkdownPool.acquire]s an instance and
+        [`release`][markdown.MarkdownPool.release]s it on exit.
+        """
+        md = self.acquire(block, timeout)
+        try:
+            yield md
+        finally:
+            self.release(md)
+
+    def convert(self, source: str) -> str:
+        """ Convert a Markdown string with an instance checked out from the pool. """
+        with self.checkout() as md:
+            return md.convert(source)
+
+    def stats(self) -> PoolStats:
+        """ Return a snapshot of the counters of the pool. """
+        with self._condition:
+            return PoolStats(
+                self._hits, self._misses, self._discarded, self._construction_time, self._size, len(self._idle)
+            )
+
+
+# Worker process state used by `Markdown.convert_many`.
+_worker_md: Markdown | None = None
+
+
+def _init_worker(cls: type[Markdown], kwargs: dict[str, Any]) -> None:
+    """ Build the instance used by a worker process of `Markdown.convert_many`. """
+    global _worker_md
+    _worker_md = cls(**kwargs)
+
+
+def _convert_in_worker(source: str) -> ConversionResult:
+    """ Convert a document in a worker process of `Markdown.convert_many`. """
+    result = _worker_md._convert_result(source)
+    if result.error is not None:
+        import pickle
+
+        try:
+            pickle.dumps(result.error)
+        except Exception:
+            # An error which cannot be sent back to the parent would fail the whole batch.
+            result = result._replace(error=RuntimeError(repr(result.error)))
+    return result
+
+
+def _convert_in_pool(
+    cls: type[Markdown],
+    kwargs: dict[str, Any],
+    sources: Iterable[str],
+    workers: int,
+    chunksize: int
+) -> list[ConversionResult]:
+    """ Convert a batch of documents in a pool of worker processes which each build `cls(**kwargs)`. """
+    # Only import the pool when it is used, as it pulls in `multiprocessing`.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cls, kwargs)) as executor:
+        return list(executor.map(_convert_in_worker, sources, chunksize=chunksize))
+
 
 """
 EXPORTED FUNCTIONS
 =============================================================================
 
-Those are the two functions we really mean to export: `markdown()` and
-`markdownFromFile()`.
+Those are the functions we really mean to export: `markdown()`, `markdownFromFile()`
+and `convert_many()`.
 """
 
 
@@ -529,3 +1148,35 @@ def markdownFromFile(**kwargs: Any):
     md.convertFile(kwargs.get('input', None),
                    kwargs.get('output', None),
                    kwargs.get('encoding', None))
+
+
+def convert_many(
+    sources: Iterable[str],
+    workers: int = 1,
+    chunksize: int = 1,
+    **kwargs: Any
+) -> list[ConversionResult]:
+    """
+    Convert a batch of Markdown strings and return a result for each in input order.
+
+    This is a shortcut function which initializes an instance of [`Markdown`][markdown.Markdown]
+    and calls the [`convert_many`][markdown.Markdown.convert_many] method. When `workers` is greater
+    than `1`, only the worker processes build an instance.
+
+    Arguments:
+        sources: An iterable of Markdown formatted text.
+        workers: The number of worker processes to use.
+        chunksize: The number of documents sent to a worker process at a time.
+
+    Keyword arguments:
+        **kwargs: Any arguments accepted by the Markdown class.
+
+    Returns:
+        A list of [`ConversionResult`][markdown.ConversionResult] objects.
+
+    """
+    if workers >= 2 and kwargs.get('cache') is None:
+        # The worker processes build their own instances.
+        return _convert_in_pool(Markdown, kwargs, sources, workers, chunksize)
+    md = Markdown(**kwargs)
+    return md.convert_many(sources, workers, chunksize)
@@ -27,6 +27,7 @@ from ..blockprocessors import BlockProcessor
 from ..inlinepatterns import InlineProcessor
 from ..treeprocessors import Treeprocessor
 from ..util import AtomicString, deprecated
+from functools import lru_cache
 from typing import TYPE_CHECKING
 import re
 import xml.etree.ElementTree as etree
@@ -36,6 +37,53 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..blockparser import BlockParser
 
 
+def _trie_pattern(node: dict[str, dict]) -> str:
+    """ Return a regular expression which matches the keys below the trie `node`, the longest one first. """
+    alternatives = []
+    chars = []
+    for char, child in sorted(node.items()):
+        if not char:
+            # The empty key marks the end of an abbreviation.
+            continue
+        prefix = [char]
+        # Follow the characters which only lead to a single longer abbreviation.
+        while len(child) == 1 and '' not in child:
+            ((char, child),) = child.items()
+            prefix.append(char)
+        if child.keys() != {''}:
+            alternatives.append(re.escape(''.join(prefix)) + _trie_pattern(child))
+        elif len(prefix) == 1:
+            chars.append(re.escape(char))
+        else:
+            alternatives.append(re.escape(''.join(prefix)))
+    if chars:
+        alternatives.append(chars[0] if len(chars) == 1 else f"[{''.join(chars)}]")
+    if not alternatives:
+        return ''
+    pattern = alternatives[0]
+    if len(alternatives) > 1 or '' in node:
+        pattern = f"(?:{'|'.join(alternatives)})"
+    # A greedy optional group tries the longer abbreviations before the one which ends here.
+    return pattern + '?' if '' in node else pattern
+
+
+@lru_cache(maxsize=16)
+def _compile_abbrs(abbrs: frozenset[str]) -> re.Pattern[str]:
+    """
+    Return a regular expression which matches any of `abbrs` as a whole word, the longest one where several match.
+
+    The abbreviations are merged into a trie, so that the expression tries a single branch for each character
+    rather than every abbreviation in turn.
+    """
+    trie: dict = {}
+    for abbr in abbrs:
+        node = trie
+        for char in abbr:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return re.compile(f'\\b{_trie_pattern(trie)}\\b')
+
+
 class AbbrExtension(Extension):
     """ Abbreviation Extension for Python-Markdown. """
 
@@ -93,6 +141,8 @@ class AbbrTreeprocessor(Treeprocessor):
     def __init__(self, md: Markdown | None = None, abbrs: dict | None = None):
         self.abbrs: dict = abbrs if abbrs is not None else {}
         self.RE: re.RegexObject | None = None
+        # The abbreviations `RE` was compiled for.
+        self._RE_abbrs: frozenset[str] = frozenset()
         super().__init__(md)
 
     def create_element(self, title: str, text: str, tail: str) -> etree.Element:
@@ -102,10 +152,17 @@ class AbbrTreeprocessor(Treeprocessor):
         abbr.tail = tail
         return abbr
 
-    def iter_element(self, el: etree.Element, parent: etree.Element | None = None) -> None:
-        ''' Recursively iterate over elements, run regex on text and wrap matches in `abbr` tags. '''
-        for child in reversed(el):
-            self.iter_element(child, el)
+    def iter_element(
+        self, el: etree.Element, parent: etree.Element | None = None, index: int | None = None
+    ) -> None:
+        '''
+        Recursively iterate over elements, run regex on text and wrap matches in `abbr` tags.
+
+        The tail of `el` is only searched when its `parent` is given. The `abbr` elements of the tail are inserted
+        into `parent` after `el`, which is at `index` (looked up when not given).
+        '''
+        for i in range(len(el) - 1, -1, -1):
+            self.iter_element(el[i], el, i)
         if text := el.text:
             if not isinstance(text, AtomicString):
                 for m in reversed(list(self.RE.finditer(text))):
@@ -116,7 +173,9 @@ class AbbrTreeprocessor(Treeprocessor):
                 el.text = text
         if parent is not None and el.tail:
             tail = el.tail
-            index = list(parent).index(el) + 1
+            if index is None:
+                index = list(parent).index(el)
+            index += 1
             if not isinstance(tail, AtomicString):
                 for m in reversed(list(self.RE.finditer(tail))):
                     abbr = self.create_element(self.abbrs[m.group(0)], m.group(0), tail[m.end():])
@@ -129,10 +188,11 @@ class AbbrTreeprocessor(Treeprocessor):
         if not self.abbrs:
             # No abbreviations defined. Skip running processor.
             return
-        # Build and compile regex
-        abbr_list = list(self.abbrs.keys())
-        abbr_list.sort(key=len, reverse=True)
-        self.RE = re.compile(f"\\b(?:{ '|'.join(re.escape(key) for key in abbr_list) })\\b")
+        # Only compile the regex again when the abbreviations changed since the last document, which is the case
+        # when the document defines its own.
+        if self.RE is None or self.abbrs.keys() != self._RE_abbrs:
+            self._RE_abbrs = frozenset(self.abbrs)
+            self.RE = _compile_abbrs(self._RE_abbrs)
         # Step through tree and modify on matches
         self.iter_element(root)
 
@@ -21,22 +21,46 @@ for details.
 
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from . import Extension
 from ..treeprocessors import Treeprocessor
-from ..util import parseBoolValue
-from typing import TYPE_CHECKING, Callable, Any
+from ..util import parseBoolValue, AtomicString, RawHtml
+from typing import TYPE_CHECKING, Callable, Any, Hashable, NamedTuple
 
 if TYPE_CHECKING:  # pragma: no cover
     import xml.etree.ElementTree as etree
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import _CacheInfo
+    from pygments.formatter import Formatter
+    from pygments.lexer import Lexer
 
-try:  # pragma: no cover
-    from pygments import highlight
-    from pygments.lexers import get_lexer_by_name, guess_lexer
-    from pygments.formatters import get_formatter_by_name
-    from pygments.util import ClassNotFound
-    pygments = True
-except ImportError:  # pragma: no cover
-    pygments = False
+# Pygments is slow to import, so it is only checked for here and imported by `CodeHilite.hilite`.
+pygments = importlib.util.find_spec('pygments') is not None
+
+
+# The Pygments names this module imported when it was loaded, which are now imported when they are first used.
+_PYGMENTS_NAMES = {
+    'highlight': 'pygments',
+    'get_lexer_by_name': 'pygments.lexers',
+    'guess_lexer': 'pygments.lexers',
+    'get_formatter_by_name': 'pygments.formatters',
+    'ClassNotFound': 'pygments.util',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """ Import the Pygments name `name` (for code which imports it from this module) when it is first used. """
+    module = _PYGMENTS_NAMES.get(name)
+    if module is None or not pygments:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
 
 def parse_hl_lines(expr: str) -> list[int]:
@@ -54,6 +78,185 @@ def parse_hl_lines(expr: str) -> list[int]:
         return []
 
 
+def _options_key(options: dict[str, Any]) -> tuple[tuple[str, Hashable], ...] | None:
+    """ Return a hashable copy of `options` (with lists as tuples) or `None` if one of its values is not hashable. """
+    key = tuple(sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in options.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# The lexers and the formatters named by a string are cached by their options, as Pygments looks up a language by
+# searching all lexers and a formatter builds its styles when it is created. Both are reused across code blocks and
+# threads. A formatter class passed as `pygments_formatter` is instantiated for each code block, as it may keep state.
+
+@lru_cache(maxsize=256)
+def _get_lexer(lang: str | None, options: tuple[tuple[str, Hashable], ...]) -> Lexer | None:
+    """ Return the lexer of `lang` created with `options` or `None` if there is none. """
+    from pygments.lexers import get_lexer_by_name
+
+    try:
+        return get_lexer_by_name(lang, **dict(options))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _guess_lexer(src: str, options: tuple[tuple[str, Hashable], ...]) -> Lexer:
+    """ Return the lexer guessed for `src` created with `options`. """
+    from pygments.lexers import get_lexer_by_name, guess_lexer
+
+    try:
+        # Guessing is slow as the text is analysed by every lexer.
+        return guess_lexer(src, **dict(options))
+    except ValueError:  # pragma: no cover
+        return get_lexer_by_name('text', **dict(options))
+
+
+@lru_cache(maxsize=256)
+def _get_formatter(formatter: str, options: tuple[tuple[str, Hashable], ...]) -> Formatter:
+    """ Return the formatter named `formatter` (or the `html` formatter if there is none) created with `options`. """
+    from pygments.formatters import get_formatter_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_formatter_by_name(formatter, **dict(options))
+    except ClassNotFound:
+        return get_formatter_by_name('html', **dict(options))
+
+
+def cache_info() -> dict[str, _CacheInfo]:
+    """
+    Return the statistics of the caches of Pygments lexers (`lexers`), lexers guessed from the code (`guesses`) and
+    formatters (`formatters`), which are shared by all instances of
+    [`CodeHilite`][markdown.extensions.codehilite.CodeHilite].
+    """
+    return {
+        'lexers': _get_lexer.cache_info(),
+        'guesses': _guess_lexer.cache_info(),
+        'formatters': _get_formatter.cache_info(),
+    }
+
+
+def clear_cache() -> None:
+    """ Clear the caches of Pygments lexers and formatters. """
+    _get_lexer.cache_clear()
+    _guess_lexer.cache_clear()
+    _get_formatter.cache_clear()
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of the highlighted code blocks kept by a
+    [`CodeHiliteExtension`][markdown.extensions.codehilite.CodeHiliteExtension].
+    """
+    hits: int
+    """ The number of code blocks found among the kept blocks. """
+    misses: int
+    """ The number of code blocks which were not found and were highlighted. """
+    maxsize: int
+    """ The maximum number of code blocks kept. """
+    currsize: int
+    """ The number of code blocks currently kept. """
+
+
+class _Memo:
+    """ A thread-safe LRU cache of highlighted code blocks which is shared by the clones of an instance. """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._blocks: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __copy__(self) -> _Memo:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> _Memo:
+        return self
+
+    def get(self, key: Hashable) -> str | None:
+        """ Return the code block kept under `key` or `None` if there is none. """
+        with self._lock:
+            html = self._blocks.get(key)
+            if html is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._blocks.move_to_end(key)
+            return html
+
+    def add_hits(self, count: int) -> None:
+        """ Count `count` code blocks which are copies of a code block highlighted along with them as hits. """
+        with self._lock:
+            self.hits += count
+
+    def set(self, key: Hashable, html: str) -> None:
+        """ Keep the code block `html` under `key`, dropping the least recently used block if there are too many. """
+        with self._lock:
+            self._blocks[key] = html
+            if len(self._blocks) > self.maxsize:
+                self._blocks.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._blocks))
+
+
+# The pools of worker processes which highlight code blocks, keyed by their number of workers. A pool is shared by
+# all instances of the extension in a process and left running until the process exits.
+_pools: dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor | None:
+    """
+    Return the pool of `workers` worker processes, starting it if it does not exist, or `None` in a worker process
+    of another pool (such as one of `Markdown.convert_many`), which would wait for a pool of its own at exit.
+    """
+    # Only import the pool when it is used, as it pulls in `multiprocessing`.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    if multiprocessing.parent_process() is not None:
+        return None
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+
+def _shutdown_pools() -> None:
+    """ Stop all pools of worker processes while the modules they use at shutdown are still loaded. """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def _forget_pools() -> None:
+    """ Drop the pools of the parent process in a forked child process, which cannot use them. """
+    global _pools_lock
+    _pools.clear()
+    _pools_lock = threading.Lock()
+
+
+atexit.register(_shutdown_pools)
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    os.register_at_fork(after_in_child=_forget_pools)
+
+
+def _hilite_job(job: tuple[str, bool, dict[str, Any]]) -> str:
+    """ Highlight a code block in a worker process of `CodeHiliteExtension.hilite_many`. """
+    src, shebang, options = job
+    return CodeHilite(src, **options).hilite(shebang)
+
+
 # ------------------ The Main CodeHilite Class ----------------------
 class CodeHilite:
     """
@@ -149,26 +352,29 @@ class CodeHilite:
             self._parseHeader()
 
         if pygments and self.use_pygments:
-            try:
-                lexer = get_lexer_by_name(self.lang, **self.options)
-            except ValueError:
-                try:
-                    if self.guess_lang:
-                        lexer = guess_lexer(self.src, **self.options)
-                    else:
-                        lexer = get_lexer_by_name('text', **self.options)
-                except ValueError:  # pragma: no cover
-                    lexer = get_lexer_by_name('text', **self.options)
+            from pygments import highlight
+
+            options = _options_key(self.options)
+
+            def cached(function: Callable, *args: Any) -> Any:
+                """ Call the cached `function`, or the function itself if an option is not hashable. """
+                if options is None:
+                    return function.__wrapped__(*args, self.options)
+                return function(*args, options)
+
+            lexer = cached(_get_lexer, self.lang)
+            if lexer is None:
+                if self.guess_lang:
+                    lexer = cached(_guess_lexer, self.src)
+                else:
+                    lexer = cached(_get_lexer, 'text')
             if not self.lang:
                 # Use the guessed lexer's language instead
                 self.lang = lexer.aliases[0]
-            lang_str = f'{self.lang_prefix}{self.lang}'
             if isinstance(self.pygments_formatter, str):
-                try:
-                    formatter = get_formatter_by_name(self.pygments_formatter, **self.options)
-                except ClassNotFound:
-                    formatter = get_formatter_by_name('html', **self.options)
+                formatter = cached(_get_formatter, self.pygments_formatter)
             else:
+                lang_str = f'{self.lang_prefix}{self.lang}'
                 formatter = self.pygments_formatter(lang_str=lang_str, **self.options)
             return highlight(self.src, lexer, formatter)
         else:
@@ -254,6 +460,7 @@ class HiliteTreeprocessor(Treeprocessor):
     """ Highlight source code in code blocks. """
 
     config: dict[str, Any]
+    ext: CodeHiliteExtension
 
     def code_unescape(self, text: str) -> str:
         """Unescape code."""
@@ -265,27 +472,25 @@ class HiliteTreeprocessor(Treeprocessor):
         return text
 
     def run(self, root: etree.Element) -> None:
-        """ Find code blocks and store in `htmlStash`. """
-        blocks = root.iter('pre')
-        for block in blocks:
-            if len(block) == 1 and block[0].tag == 'code':
-                local_config = self.config.copy()
-                text = block[0].text
-                if text is None:
-                    continue
-                code = CodeHilite(
-                    self.code_unescape(text),
-                    tab_length=self.md.tab_length,
-                    style=local_config.pop('pygments_style', 'default'),
-                    **local_config
-                )
-                placeholder = self.md.htmlStash.store(code.hilite())
-                # Clear code block in `etree` instance
-                block.clear()
-                # Change to `p` element which will later
-                # be removed when inserting raw html
-                block.tag = 'p'
-                block.text = placeholder
+        """ Find code blocks and replace them with raw HTML nodes of the highlighted code. """
+        # `CodeHilite` gets its own copy of the options of each block.
+        options = self.config.copy()
+        options['style'] = options.pop('pygments_style', 'default')
+        options['tab_length'] = self.md.tab_length
+        options.pop('cache_size', None)
+        options.pop('workers', None)
+        # All blocks are collected first so that they may be highlighted in parallel.
+        blocks = [
+            block for block in root.iter('pre')
+            if len(block) == 1 and block[0].tag == 'code' and block[0].text is not None
+        ]
+        jobs = [(self.code_unescape(block[0].text), True, options) for block in blocks]
+        for block, html in zip(blocks, self.ext.hilite_many(jobs)):
+            # Clear code block in `etree` instance
+            block.clear()
+            # Change to a raw HTML node which is written to the output verbatim
+            block.tag = RawHtml
+            block.text = AtomicString(html)
 
 
 class CodeHiliteExtension(Extension):
@@ -318,8 +523,17 @@ class CodeHiliteExtension(Extension):
             'pygments_formatter': [
                 'html', 'Use a specific formatter for Pygments highlighting. Default: `html`.'
             ],
+            'cache_size': [
+                0, 'Number of highlighted code blocks to keep and reuse for code blocks with the same source and '
+                'options. Default: `0` (off).'
+            ],
+            'workers': [
+                1, 'Number of worker processes which highlight the code blocks of a document in parallel. '
+                'Default: `1` (highlight in this process).'
+            ],
         }
         """ Default configuration options. """
+        self._memo: _Memo | None = None
 
         for key, value in kwargs.items():
             if key in self.config:
@@ -344,12 +558,89 @@ class CodeHiliteExtension(Extension):
 
         """
         # flake8: noqa: E501 341-343
+        cache_size = self.getConfig('cache_size')
+        self._memo = _Memo(cache_size) if cache_size else None
         hiliter = HiliteTreeprocessor(md)
         hiliter.config = self.getConfigs()
+        hiliter.ext = self
         md.treeprocessors.register(hiliter, 'hilite', 30)
 
         md.registerExtension(self)
 
+    def hilite(self, src: str, shebang: bool = True, **options: Any) -> str:
+        """
+        Return the HTML of the code block `src` highlighted by a
+        [`CodeHilite`][markdown.extensions.codehilite.CodeHilite] instance created with `options`.
+
+        When `cache_size` is set, the output is kept and returned again for a code block with the same source and
+        options (which include its language).
+        """
+        return self.hilite_many([(src, shebang, options)])[0]
+
+    def hilite_many(self, jobs: list[tuple[str, bool, dict[str, Any]]]) -> list[str]:
+        """
+        Return the HTML of each code block of `jobs`, a list of `(src, shebang, options)` tuples, highlighted as
+        by [`hilite`][markdown.extensions.codehilite.CodeHiliteExtension.hilite].
+
+        When `workers` is greater than `1`, the code blocks which are not kept by the cache are highlighted in
+        parallel by a pool of worker processes, which is started on first use. The output is the same as that of
+        highlighting them one at a time in this process, which is done instead for a job that cannot be sent to
+        the workers (for example, one with a formatter class which cannot be pickled).
+        """
+        results: list[str | None] = [None] * len(jobs)
+        keys: list[Hashable | None] = [None] * len(jobs)
+        misses = []
+        # The index of each job which is a copy of an earlier missed job mapped to the index of that job.
+        copies: dict[int, int] = {}
+        if self._memo is not None:
+            missed: dict[Hashable, int] = {}
+            for i, (src, shebang, options) in enumerate(jobs):
+                key = _options_key(options)
+                if key is not None:
+                    key = keys[i] = (src, shebang, key)
+                    if key in missed:
+                        copies[i] = missed[key]
+                        continue
+                    results[i] = self._memo.get(key)
+                    if results[i] is None:
+                        missed[key] = i
+                if results[i] is None:
+                    misses.append(i)
+            self._memo.add_hits(len(copies))
+        else:
+            misses = list(range(len(jobs)))
+        highlighted = None
+        workers = self.getConfig('workers')
+        pool = _get_pool(workers) if workers > 1 and len(misses) > 1 else None
+        if pool is not None:
+            from concurrent.futures.process import BrokenProcessPool
+
+            try:
+                highlighted = list(pool.map(
+                    _hilite_job, [jobs[i] for i in misses], chunksize=max(1, len(misses) // (workers * 4))
+                ))
+            except BrokenProcessPool:
+                # A worker died. Start a new pool for the next document.
+                with _pools_lock:
+                    if _pools.get(workers) is pool:
+                        del _pools[workers]
+            except Exception:
+                # Any error of a job itself is raised again when it is highlighted in this process below.
+                pass
+        if highlighted is None:
+            highlighted = [CodeHilite(jobs[i][0], **jobs[i][2]).hilite(jobs[i][1]) for i in misses]
+        for i, html in zip(misses, highlighted):
+            results[i] = html
+            if keys[i] is not None:
+                self._memo.set(keys[i], html)
+        for i, first in copies.items():
+            results[i] = results[first]
+        return results
+
+    def cache_info(self) -> CacheInfo | None:
+        """ Return the statistics of the highlighted code blocks kept by the extension or `None` if there are none. """
+        return self._memo.info() if self._memo is not None else None
+
 
 def makeExtension(**kwargs):  # pragma: no cover
     return CodeHiliteExtension(**kwargs)
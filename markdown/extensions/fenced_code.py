@@ -24,7 +24,7 @@ from __future__ import annotations
 from textwrap import dedent
 from . import Extension
 from ..preprocessors import Preprocessor
-from .codehilite import CodeHilite, CodeHiliteExtension, parse_hl_lines
+from .codehilite import CodeHiliteExtension, parse_hl_lines
 from .attr_list import get_attrs_and_remainder, AttrListExtension
 from ..util import parseBoolValue
 from ..serializers import _escape_attrib_html
@@ -79,6 +79,7 @@ class FencedBlockPreprocessor(Preprocessor):
         self.config = config
         self.checked_for_deps = False
         self.codehilite_conf: dict[str, Any] = {}
+        self.codehilite: CodeHiliteExtension | None = None
         self.use_attr_list = False
         # List of options to convert to boolean values
         self.bool_options = [
@@ -96,6 +97,7 @@ class FencedBlockPreprocessor(Preprocessor):
             for ext in self.md.registeredExtensions:
                 if isinstance(ext, CodeHiliteExtension):
                     self.codehilite_conf = ext.getConfigs()
+                    self.codehilite = ext
                 if isinstance(ext, AttrListExtension):
                     self.use_attr_list = True
 
@@ -103,6 +105,10 @@ class FencedBlockPreprocessor(Preprocessor):
 
         text = "\n".join(lines)
         index = 0
+        # The code blocks to highlight and the indexes of their placeholders in the stash, which are filled in once
+        # all blocks are highlighted (possibly in parallel).
+        jobs: list[tuple[str, bool, dict[str, Any]]] = []
+        stash_indexes: list[int] = []
         while 1:
             m = self.FENCED_BLOCK_RE.search(text, index)
             if m:
@@ -135,14 +141,12 @@ class FencedBlockPreprocessor(Preprocessor):
                             ' '.join(classes),
                             local_config['css_class']
                         )
-                    highliter = CodeHilite(
-                        m.group('code'),
-                        lang=lang,
-                        style=local_config.pop('pygments_style', 'default'),
-                        **local_config
-                    )
-
-                    code = highliter.hilite(shebang=False)
+                    local_config.pop('cache_size', None)
+                    local_config.pop('workers', None)
+                    options = dict(lang=lang, style=local_config.pop('pygments_style', 'default'), **local_config)
+                    jobs.append((m.group('code'), False, options))
+                    stash_indexes.append(self.md.htmlStash.html_counter)
+                    code = ''
                 else:
                     id_attr = lang_attr = class_attr = kv_pairs = ''
                     if lang:
@@ -168,6 +172,9 @@ class FencedBlockPreprocessor(Preprocessor):
                 index = m.start() + 1 + len(placeholder)
             else:
                 break
+        if jobs:
+            for stash_index, code in zip(stash_indexes, self.codehilite.hilite_many(jobs)):
+                self.md.htmlStash.rawHtmlBlocks[stash_index] = code
         return text.split("\n")
 
     def handle_attrs(self, attrs: Iterable[tuple[str, str]]) -> tuple[str, list[str], dict[str, Any]]:
@@ -104,7 +104,9 @@ class FootnoteExtension(Extension):
 
         # Insert an inline pattern before `ImageReferencePattern`
         FOOTNOTE_RE = r'\[\^([^\]]*)\]'  # blah blah [^1] blah
-        md.inlinePatterns.register(FootnoteInlineProcessor(FOOTNOTE_RE, self), 'footnote', 175)
+        footnotePattern = FootnoteInlineProcessor(FOOTNOTE_RE, self)
+        footnotePattern.triggers = '['
+        md.inlinePatterns.register(footnotePattern, 'footnote', 175)
         # Insert a tree-processor that would actually add the footnote div
         # This must be before all other tree-processors (i.e., `inline` and
         # `codehilite`) so they can run on the the contents of the div.
@@ -479,6 +481,9 @@ class FootnoteReorderingProcessor(Treeprocessor):
 
 class FootnotePostprocessor(Postprocessor):
     """ Replace placeholders with html entities. """
+
+    CHUNKED = True
+
     def __init__(self, footnotes: FootnoteExtension):
         self.footnotes = footnotes
 
@@ -23,7 +23,7 @@ from __future__ import annotations
 
 from . import Extension
 from ..blockprocessors import BlockProcessor
-from ..preprocessors import Preprocessor
+from .. import preprocessors
 from ..postprocessors import RawHtmlPostprocessor
 from .. import util
 from ..htmlparser import HTMLExtractor, blank_line_re
@@ -214,7 +214,7 @@ class HTMLExtractorExtra(HTMLExtractor):
                     self.state = []
                     # Check if element has a tail
                     if not blank_line_re.match(
-                            self.rawdata[self.line_offset + self.offset + len(self.get_endtag_text(tag)):]):
+                            self.rawdata, self.line_offset + self.offset + len(self.get_endtag_text(tag))):
                         # More content exists after `endtag`.
                         self.intail = True
             else:
@@ -297,15 +297,11 @@ class HTMLExtractorExtra(HTMLExtractor):
         return i + 2
 
 
-class HtmlBlockPreprocessor(Preprocessor):
+class HtmlBlockPreprocessor(preprocessors.HtmlBlockPreprocessor):
     """Remove html blocks from the text and store them for later retrieval."""
 
-    def run(self, lines: list[str]) -> list[str]:
-        source = '\n'.join(lines)
-        parser = HTMLExtractorExtra(self.md)
-        parser.feed(source)
-        parser.close()
-        return ''.join(parser.cleandoc).split('\n')
+    def build_extractor(self) -> HTMLExtractorExtra:
+        return HTMLExtractorExtra(self.md)
 
 
 class MarkdownInHtmlProcessor(BlockProcessor):
@@ -42,6 +42,7 @@ class Nl2BrExtension(Extension):
         """
         # flake8: noqa: E501 38-40
         br_tag = SubstituteTagInlineProcessor(BR_RE, 'br')
+        br_tag.triggers = '\n'
         md.inlinePatterns.register(br_tag, 'nl', 5)
 
 
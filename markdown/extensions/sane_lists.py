@@ -37,6 +37,7 @@ class SaneOListProcessor(OListProcessor):
     """ Exclude `ul` from list of siblings. """
     LAZY_OL = False
     """ Disable lazy list behavior. """
+    TRIGGER_RE = re.compile(r'[ \d]')
 
     def __init__(self, parser: blockparser.BlockParser):
         super().__init__(parser)
@@ -49,6 +50,7 @@ class SaneUListProcessor(UListProcessor):
 
     SIBLING_TAGS = ['ul']
     """ Exclude `ol` from list of siblings. """
+    TRIGGER_RE = re.compile(r'[ *+-]')
 
     def __init__(self, parser: blockparser.BlockParser):
         super().__init__(parser)
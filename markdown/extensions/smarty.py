@@ -158,6 +158,24 @@ closingSingleQuotesRegex2 = r"'(\s|s\b)"
 remainingSingleQuotesRegex = r"'"
 remainingDoubleQuotesRegex = r'"'
 
+# The quote which every match of each of the above starts with. The opening quotes
+# may follow whitespace or an entity and are matched from there, so they are not listed.
+quoteTriggers = {
+    singleQuoteStartRe: "'",
+    doubleQuoteStartRe: '"',
+    doubleQuoteSetsRe: '"',
+    singleQuoteSetsRe: "'",
+    doubleQuoteSetsRe2: "'",
+    singleQuoteSetsRe2: '"',
+    decadeAbbrRe: "'",
+    closingSingleQuotesRegex: "'",
+    closingSingleQuotesRegex2: "'",
+    remainingSingleQuotesRegex: "'",
+    closingDoubleQuotesRegex: '"',
+    closingDoubleQuotesRegex2: '"',
+    remainingDoubleQuotesRegex: '"',
+}
+
 HTML_STRICT_RE = HTML_RE + r'(?!\>)'
 
 
@@ -201,8 +219,10 @@ class SmartyExtension(Extension):
         priority: int,
     ):
         for ind, pattern in enumerate(patterns):
+            regex = pattern[0]
             pattern += (md,)
             pattern = SubstituteTextPattern(*pattern)
+            pattern.triggers = quoteTriggers.get(regex)
             name = 'smarty-%s-%d' % (serie, ind)
             self.inlinePatterns.register(pattern, name, priority-ind)
 
@@ -213,6 +233,7 @@ class SmartyExtension(Extension):
         enDashesPattern = SubstituteTextPattern(
             r'(?<!-)--(?!-)', (self.substitutions['ndash'],), md
         )
+        emDashesPattern.triggers = enDashesPattern.triggers = '-'
         self.inlinePatterns.register(emDashesPattern, 'smarty-em-dashes', 50)
         self.inlinePatterns.register(enDashesPattern, 'smarty-en-dashes', 45)
 
@@ -220,6 +241,7 @@ class SmartyExtension(Extension):
         ellipsesPattern = SubstituteTextPattern(
             r'(?<!\.)\.{3}(?!\.)', (self.substitutions['ellipsis'],), md
         )
+        ellipsesPattern.triggers = '.'
         self.inlinePatterns.register(ellipsesPattern, 'smarty-ellipses', 10)
 
     def educateAngledQuotes(self, md: Markdown) -> None:
@@ -229,6 +251,8 @@ class SmartyExtension(Extension):
         rightAngledQuotePattern = SubstituteTextPattern(
             r'\>\>', (self.substitutions['right-angle-quote'],), md
         )
+        leftAngledQuotePattern.triggers = '<'
+        rightAngledQuotePattern.triggers = '>'
         self.inlinePatterns.register(leftAngledQuotePattern, 'smarty-left-angle-quotes', 40)
         self.inlinePatterns.register(rightAngledQuotePattern, 'smarty-right-angle-quotes', 35)
 
@@ -282,7 +306,9 @@ class SmartyExtension(Extension):
             self.educateAngledQuotes(md)
             # Override `HTML_RE` from `inlinepatterns.py` so that it does not
             # process tags with duplicate closing quotes.
-            md.inlinePatterns.register(HtmlInlineProcessor(HTML_STRICT_RE, md), 'html', 90)
+            htmlPattern = HtmlInlineProcessor(HTML_STRICT_RE, md)
+            htmlPattern.triggers = '<'
+            md.inlinePatterns.register(htmlPattern, 'html', 90)
         if configs['smart_dashes']:
             self.educateDashes(md)
         inlineProcessor = InlineProcessor(md)
@@ -21,7 +21,7 @@ from __future__ import annotations
 
 from . import Extension
 from ..treeprocessors import Treeprocessor
-from ..util import parseBoolValue, AMP_SUBSTITUTE, deprecated, HTML_PLACEHOLDER_RE, AtomicString
+from ..util import parseBoolValue, AMP_SUBSTITUTE, deprecated, HTML_PLACEHOLDER_RE, AtomicString, RawHtml
 from ..treeprocessors import UnescapeTreeprocessor
 from ..serializers import RE_AMP
 import re
@@ -271,7 +271,7 @@ class TocTreeprocessor(Treeprocessor):
         # would causes an endless loop of placing a new TOC
         # inside previously generated TOC.
         for child in node:
-            if not self.header_rgx.match(child.tag) and child.tag not in ['pre', 'code']:
+            if child.tag is not RawHtml and not self.header_rgx.match(child.tag) and child.tag not in ['pre', 'code']:
                 yield node, child
                 yield from self.iterparent(child)
 
@@ -62,6 +62,7 @@ class WikiLinkExtension(Extension):
         WIKILINK_RE = r'\[\[([\w0-9_ -]+)\]\]'
         wikilinkPattern = WikiLinksInlineProcessor(WIKILINK_RE, self.getConfigs())
         wikilinkPattern.md = md
+        wikilinkPattern.triggers = '['
         md.inlinePatterns.register(wikilinkPattern, 'wikilink', 75)
 
 
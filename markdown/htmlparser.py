@@ -28,6 +28,7 @@ from __future__ import annotations
 import re
 import importlib.util
 import sys
+from array import array
 from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -90,7 +91,11 @@ htmlparser.locatetagend = re.compile(r"""
 
 # Match a blank line at the start of a block of text (two newlines).
 # The newlines may be preceded by additional whitespace.
-blank_line_re = re.compile(r'^([ ]*\n){2}')
+# The pattern is not anchored with `^` so that it can be matched at a position of the raw data.
+blank_line_re = re.compile(r'([ ]*\n){2}')
+
+# Match the end of each line.
+newline_re = re.compile('\n')
 
 
 class _HTMLParser(htmlparser.HTMLParser):
@@ -133,8 +138,6 @@ class HTMLExtractor(htmlparser.HTMLParser):
         # Block tags that should contain no content (self closing)
         self.empty_tags = set(['hr'])
 
-        self.lineno_start_cache = [0]
-
         # This calls self.reset
         super().__init__(*args, **kwargs)
         self.md = md
@@ -146,10 +149,19 @@ class HTMLExtractor(htmlparser.HTMLParser):
         self.stack: list[str] = []  # When `inraw==True`, stack contains a list of tags
         self._cache: list[str] = []
         self.cleandoc: list[str] = []
-        self.lineno_start_cache = [0]
+        # The data fed to the parser and the index in it of the start of each line.
+        self.source = ''
+        self.lineno_start_cache = array('L', [0])
 
         super().reset()
 
+    def feed(self, data: str):
+        """Feed data to the parser after indexing the start of each of its lines."""
+        base = len(self.source)
+        self.lineno_start_cache.extend(base + m.end() for m in newline_re.finditer(data))
+        self.source += data
+        super().feed(data)
+
     def close(self):
         """Handle any buffered data."""
         super().close()
@@ -167,16 +179,13 @@ class HTMLExtractor(htmlparser.HTMLParser):
 
     @property
     def line_offset(self) -> int:
-        """Returns char index in `self.rawdata` for the start of the current line. """
-        for ii in range(len(self.lineno_start_cache)-1, self.lineno-1):
-            last_line_start_pos = self.lineno_start_cache[ii]
-            lf_pos = self.rawdata.find('\n', last_line_start_pos)
-            if lf_pos == -1:
-                # No more newlines found. Use end of raw data as start of line beyond end.
-                lf_pos = len(self.rawdata)
-            self.lineno_start_cache.append(lf_pos+1)
+        """
+        Returns char index in `self.rawdata` for the start of the current line.
 
-        return self.lineno_start_cache[self.lineno-1]
+        The parser drops the data it has parsed from `self.rawdata` when it stops at an incomplete construct, in
+        which case the index is negative if the current line starts before the remaining data.
+        """
+        return self.lineno_start_cache[self.lineno - 1] - len(self.source) + len(self.rawdata)
 
     def at_line_start(self) -> bool:
         """
@@ -189,7 +198,8 @@ class HTMLExtractor(htmlparser.HTMLParser):
         if self.offset > 3:
             return False
         # Confirm up to first 3 chars are whitespace
-        return self.rawdata[self.line_offset:self.line_offset + self.offset].strip() == ''
+        start = self.lineno_start_cache[self.lineno - 1]
+        return self.source[start:start + self.offset].isspace()
 
     def get_endtag_text(self, tag: str) -> str:
         """
@@ -239,7 +249,7 @@ class HTMLExtractor(htmlparser.HTMLParser):
                         break
             if len(self.stack) == 0:
                 # End of raw block.
-                if blank_line_re.match(self.rawdata[self.line_offset + self.offset + len(text):]):
+                if blank_line_re.match(self.rawdata, self.line_offset + self.offset + len(text)):
                     # Preserve blank line and end of raw block.
                     self._cache.append('\n')
                 else:
@@ -269,7 +279,7 @@ class HTMLExtractor(htmlparser.HTMLParser):
             self._cache.append(data)
         elif self.at_line_start() and is_block:
             # Handle this as a standalone raw block
-            if blank_line_re.match(self.rawdata[self.line_offset + self.offset + len(data):]):
+            if blank_line_re.match(self.rawdata, self.line_offset + self.offset + len(data)):
                 # Preserve blank line after tag in raw block.
                 data += '\n'
             else:
@@ -44,7 +44,6 @@ from . import util
 from typing import TYPE_CHECKING, Any, Collection, NamedTuple
 import re
 import xml.etree.ElementTree as etree
-from html import entities
 
 if TYPE_CHECKING:  # pragma: no cover
     from markdown import Markdown
@@ -173,6 +172,26 @@ ENTITY_RE = r'(&(?:\#[0-9]+|\#x[0-9a-fA-F]+|[a-zA-Z0-9]+);)'
 LINE_BREAK_RE = r'  \n'
 """ Match two spaces at end of line. """
 
+TRIGGERS: dict[str, str] = {
+    BACKTICK_RE: '`\\',
+    ESCAPE_RE: '\\',
+    LINK_RE: '[',
+    IMAGE_LINK_RE: '!',
+    NOT_STRONG_RE: '*_',
+    AUTOLINK_RE: '<',
+    AUTOMAIL_RE: '<',
+    HTML_RE: '<',
+    ENTITY_RE: '&',
+    LINE_BREAK_RE: ' ',
+    r'\*': '*',
+    r'_': '_',
+}
+"""
+The regular expressions above mapped to the characters which every one of their matches starts with. An
+[`InlineProcessor`][markdown.inlinepatterns.InlineProcessor] created with one of these regular expressions sets its
+[`triggers`][markdown.inlinepatterns.Pattern.triggers] accordingly.
+"""
+
 
 def dequote(string: str) -> str:
     """Remove quotes from around a string."""
@@ -220,6 +239,14 @@ class Pattern:  # pragma: no cover
     would cause the content to be a descendant of one of the listed tag names.
     """
 
+    triggers: str | None = None
+    """
+    The characters which every match of the pattern starts with or `None` if they are unknown. The pattern is skipped
+    for any text which contains none of them and matching begins at the first of them. A pattern whose match may
+    start with a zero-width assertion (such as `^` or a lookbehind) should list the characters of the first
+    character it consumes.
+    """
+
     compiled_re: re.Pattern[str]
     md: Markdown | None
 
@@ -301,6 +328,8 @@ class InlineProcessor(Pattern):
         """
         self.pattern = pattern
         self.compiled_re = re.compile(pattern, re.DOTALL | re.UNICODE)
+        if self.triggers is None and pattern in TRIGGERS:
+            self.triggers = TRIGGERS[pattern]
 
         # API for Markdown to pass `safe_mode` into instance
         self.safe_mode = False
@@ -978,6 +1007,8 @@ class AutomailInlineProcessor(InlineProcessor):
         if email.startswith("mailto:"):
             email = email[len("mailto:"):]
 
+        from html import entities
+
         def codepoint2name(code: int) -> str:
             """Return entity definition by code, or the code if not defined."""
             entity = entities.codepoint2name.get(code)
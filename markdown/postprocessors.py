@@ -34,6 +34,7 @@ import re
 
 if TYPE_CHECKING:  # pragma: no cover
     from markdown import Markdown
+    import xml.etree.ElementTree as etree
 
 
 def build_postprocessors(md: Markdown, **kwargs: Any) -> util.Registry[Postprocessor]:
@@ -55,6 +56,13 @@ class Postprocessor(util.Processor):
 
     """
 
+    CHUNKED: bool = False
+    """
+    Whether `run` may be passed the document in pieces rather than as a whole. When every postprocessor sets
+    `CHUNKED`, [`Markdown.convert_to`][markdown.Markdown.convert_to] passes the serialized text of each top-level
+    element to `run` separately and writes the result to the output stream before serializing the next element.
+    """
+
     def run(self, text: str) -> str:
         """
         Subclasses of `Postprocessor` should implement a `run` method, which
@@ -68,29 +76,64 @@ class Postprocessor(util.Processor):
 class RawHtmlPostprocessor(Postprocessor):
     """ Restore raw html to the document. """
 
+    CHUNKED = True
+
     BLOCK_LEVEL_REGEX = re.compile(r'^\<\/?([^ >]+)')
 
+    PLACEHOLDER_RE = re.compile(
+        '<p>{0}</p>|{0}'.format(util.HTML_PLACEHOLDER % r'([0-9]+)')
+    )
+    """ Match a placeholder, either wrapped in a paragraph (group 1) or bare (group 2). """
+
+    def __init__(self, md: Markdown | None = None):
+        super().__init__(md)
+        # The restored HTML of the placeholders of the current document: one dictionary for the placeholders which
+        # were wrapped in a paragraph and one for the others, each keyed by the index of the stash item. A stash item
+        # is only restored once however often it is referenced, including by other stash items. The cache belongs to
+        # the list of stash items it was built from and is dropped when the stash is reset.
+        self._cache: tuple[dict[str, str], dict[str, str]] = ({}, {})
+        self._cache_blocks: list[str | etree.Element] | None = None
+
     def run(self, text: str) -> str:
         """ Iterate over html stash and restore html. """
-        def substitute_match(m: re.Match[str]) -> str:
-            if key := m.group(1):
-                wrapped = True
-            else:
-                key = m.group(2)
-                wrapped = False
-            if (key := int(key)) >= self.md.htmlStash.html_counter:
-                return m.group(0)
-            html = self.stash_to_string(self.md.htmlStash.rawHtmlBlocks[key])
-            if not wrapped or self.isblocklevel(html):
-                return pattern.sub(substitute_match, html)
-            return pattern.sub(substitute_match, f"<p>{html}</p>")
-
-        if self.md.htmlStash.html_counter:
-            base_placeholder = util.HTML_PLACEHOLDER % r'([0-9]+)'
-            pattern = re.compile(f'<p>{ base_placeholder }</p>|{ base_placeholder }')
-            return pattern.sub(substitute_match, text)
-        else:
+        stash = self.md.htmlStash
+        if not stash.html_counter or util.STX not in text:
             return text
+        if self._cache_blocks is not stash.rawHtmlBlocks:
+            self._cache = ({}, {})
+            self._cache_blocks = stash.rawHtmlBlocks
+        return self._restore(text)
+
+    def _restore(self, text: str) -> str:
+        """ Replace each placeholder in `text` with its HTML in a single pass. """
+        # Splitting on the placeholders gives the text before each placeholder followed by its two groups: the index
+        # of a placeholder wrapped in a paragraph or `None`, then the index of a bare placeholder or `None`.
+        parts = self.PLACEHOLDER_RE.split(text)
+        wrapped_cache, bare_cache = self._cache
+        for i in range(1, len(parts), 3):
+            if (key := parts[i]) is not None:
+                if (html := wrapped_cache.get(key)) is None:
+                    html = wrapped_cache[key] = self._resolve(key, True)
+            else:
+                key = parts[i + 1]
+                if (html := bare_cache.get(key)) is None:
+                    html = bare_cache[key] = self._resolve(key, False)
+            parts[i] = html
+            parts[i + 1] = ''
+        return ''.join(parts)
+
+    def _resolve(self, key: str, wrapped: bool) -> str:
+        """ Return the HTML of a placeholder with any placeholders in it restored. """
+        stash = self.md.htmlStash
+        if (index := int(key)) >= stash.html_counter:
+            placeholder = stash.get_placeholder(key)
+            return f"<p>{placeholder}</p>" if wrapped else placeholder
+        html = self.stash_to_string(stash.rawHtmlBlocks[index])
+        if wrapped and not self.isblocklevel(html):
+            html = f"<p>{html}</p>"
+        if util.STX in html:
+            html = self._restore(html)
+        return html
 
     def isblocklevel(self, html: str) -> bool:
         """ Check is block of HTML is block-level. """
@@ -110,6 +153,8 @@ class RawHtmlPostprocessor(Postprocessor):
 class AndSubstitutePostprocessor(Postprocessor):
     """ Restore valid entities """
 
+    CHUNKED = True
+
     def run(self, text: str) -> str:
         text = text.replace(util.AMP_SUBSTITUTE, "&")
         return text
@@ -122,6 +167,8 @@ class AndSubstitutePostprocessor(Postprocessor):
 class UnescapePostprocessor(Postprocessor):
     """ Restore escaped chars. """
 
+    CHUNKED = True
+
     RE = re.compile(r'{}(\d+){}'.format(util.STX, util.ETX))
 
     def unescape(self, m: re.Match[str]) -> str:
@@ -27,11 +27,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 from . import util
-from .htmlparser import HTMLExtractor
 import re
 
 if TYPE_CHECKING:  # pragma: no cover
     from markdown import Markdown
+    from .htmlparser import HTMLExtractor
 
 
 def build_preprocessors(md: Markdown, **kwargs: Any) -> util.Registry[Preprocessor]:
@@ -81,11 +81,30 @@ class HtmlBlockPreprocessor(Preprocessor):
 
     The raw HTML is stored in the [`htmlStash`][markdown.util.HtmlStash] of the
     [`Markdown`][markdown.Markdown] instance.
+
+    The parser leaves text which contains no markup (`<`) and no character reference (`&#`) as it is. Therefore,
+    the lines before the last blank line which precedes the first of those are passed through without being parsed,
+    and a document which contains neither is returned untouched.
     """
 
     def run(self, lines: list[str]) -> list[str]:
-        source = '\n'.join(lines)
-        parser = HTMLExtractor(self.md)
-        parser.feed(source)
+        start = 0
+        for i, line in enumerate(lines):
+            if not line and i:
+                # The parser also needs the text before a blank line to end a block, as a blank first line does not.
+                start = i + 1
+            elif '<' in line or '&#' in line:
+                break
+        else:
+            return lines
+        parser = self.build_extractor()
+        parser.feed('\n'.join(lines[start:]))
         parser.close()
-        return ''.join(parser.cleandoc).split('\n')
+        return lines[:start] + ''.join(parser.cleandoc).split('\n')
+
+    def build_extractor(self) -> HTMLExtractor:
+        """ Return a new parser which extracts the raw HTML of a document. """
+        # Only import the parser when it is used, as it loads and patches its own copy of `html.parser`.
+        from .htmlparser import HTMLExtractor
+
+        return HTMLExtractor(self.md)
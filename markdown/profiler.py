@@ -0,0 +1,304 @@
+# Python Markdown
+
+# A Python implementation of John Gruber's Markdown.
+
+# Documentation: https://python-markdown.github.io/
+# GitHub: https://github.com/Python-Markdown/markdown/
+# PyPI: https://pypi.org/project/Markdown/
+
+# Started by Manfred Stienstra (http://www.dwerg.net/).
+# Maintained for a few years by Yuri Takhteyev (http://www.freewisdom.org).
+# Currently maintained by Waylan Limberg (https://github.com/waylan),
+# Dmitry Shachnev (https://github.com/mitya57) and Isaac Muse (https://github.com/facelessuser).
+
+# Copyright 2007-2023 The Python Markdown Project (v. 1.7 and later)
+# Copyright 2004, 2005, 2006 Yuri Takhteyev (v. 0.2-1.6b)
+# Copyright 2004 Manfred Stienstra (the original version)
+
+# License: BSD (see LICENSE.md for details).
+
+"""
+Record the time spent in each stage of [`Markdown.convert`][markdown.Markdown.convert].
+
+Profiling is opt-in. Assign a [`Profiler`][markdown.profiler.Profiler] to the `profiler` attribute of a
+[`Markdown`][markdown.Markdown] instance and each conversion produces a
+[`ProfileReport`][markdown.profiler.ProfileReport] which is passed to the callback of the profiler:
+
+```python
+md = markdown.Markdown(extensions=['toc'])
+md.profiler = Profiler(callback=lambda report: print(report))
+md.convert(text)
+```
+
+While a document is being profiled, the `run` (and `test` or `handleMatch`) methods of every registered processor
+and the serializer are replaced by timing wrappers on the instance. They are removed again once the document has
+been converted, so that a `Markdown` instance without a profiler runs no instrumentation at all.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from markdown import Markdown
+    from markdown.util import Registry
+    import re
+
+__all__ = ['Profiler', 'ProfileReport', 'Timing', 'STAGES']
+
+STAGES = (
+    'preprocessors',
+    'blockprocessors.test',
+    'blockprocessors.run',
+    'inlinepatterns.search',
+    'inlinepatterns.handleMatch',
+    'treeprocessors',
+    'serializer',
+    'postprocessors',
+)
+"""
+The stages of a conversion recorded in a [`ProfileReport`][markdown.profiler.ProfileReport], in the order in which
+they (first) run.
+"""
+
+
+class Timing(NamedTuple):
+    """ The timing of a single item of a stage. """
+    calls: int
+    """ The number of times the item was called. """
+    time: float
+    """ The total wall time (in seconds) spent in the item, including any nested calls. """
+
+
+class ProfileReport:
+    """
+    The timings recorded while converting a single document.
+
+    Each stage maps the name under which an item is registered (or `serializer` for the serializer) to its
+    [`Timing`][markdown.profiler.Timing]. As a block processor may parse nested blocks and the `inline` tree
+    processor runs the inline patterns, the time of an item includes the time of any items it calls. Therefore,
+    the times of the stages should not be added together. Use `total` instead.
+
+    Attributes:
+        total (float): The wall time (in seconds) of the whole conversion.
+        stages (dict[str, dict[str, Timing]]): The timings of each stage keyed by the names in
+            [`STAGES`][markdown.profiler.STAGES]. Items which were never called are not included.
+
+    """
+
+    def __init__(self, total: float, stages: dict[str, dict[str, Timing]]):
+        self.total = total
+        self.stages = stages
+
+    def __repr__(self):
+        return '<{} total={:.6f}>'.format(self.__class__.__name__, self.total)
+
+    def __str__(self):
+        lines = ['{:<44}{:>10}{:>14}'.format('total', '', '%.3f ms' % (self.total * 1000))]
+        for stage, timings in self.stages.items():
+            for name, timing in sorted(timings.items(), key=lambda item: item[1].time, reverse=True):
+                lines.append('{:<44}{:>10}{:>14}'.format(
+                    '{}[{}]'.format(stage, name), timing.calls, '%.3f ms' % (timing.time * 1000)
+                ))
+        return '\n'.join(lines)
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return the report as a dictionary of plain values suitable for serializing to JSON. """
+        return {
+            'total': self.total,
+            'stages': {
+                stage: {name: timing._asdict() for name, timing in timings.items()}
+                for stage, timings in self.stages.items()
+            }
+        }
+
+
+class Profiler:
+    """
+    Profile each conversion of the [`Markdown`][markdown.Markdown] instances it is assigned to.
+
+    A profiler keeps no state between conversions other than the most recent report, and so it may be assigned to
+    more than one instance (for example, to each instance of a [`MarkdownPool`][markdown.MarkdownPool]). In that
+    case the callback must be thread-safe.
+
+    Attributes:
+        callback (Callable[[ProfileReport], Any] | None): A callable which is passed the report of each successful
+            conversion.
+        report (ProfileReport | None): The report of the most recent conversion.
+
+    """
+
+    def __init__(self, callback: Callable[[ProfileReport], Any] | None = None):
+        self.callback = callback
+        self.report: ProfileReport | None = None
+
+    def start(self, md: Markdown) -> _Session:
+        """ Instrument `md` for a single conversion and return the session which records it. """
+        return _Session(self, md)
+
+
+class _Session:
+    """ The instrumentation of a single conversion. """
+
+    def __init__(self, profiler: Profiler, md: Markdown):
+        self.profiler = profiler
+        self.md = md
+        self.timings: dict[str, dict[str, list]] = {stage: {} for stage in STAGES}
+        self.patched: list[tuple[Any, str, Any]] = []
+        for name, item in _items(md.preprocessors):
+            self.wrap(item, 'run', 'preprocessors', name)
+        for name, item in _items(md.parser.blockprocessors):
+            self.wrap(item, 'test', 'blockprocessors.test', name)
+            self.wrap(item, 'run', 'blockprocessors.run', name)
+        for name, item in _items(md.inlinePatterns):
+            self.wrap_regex(item, name)
+            self.wrap(item, 'handleMatch', 'inlinepatterns.handleMatch', name)
+        for name, item in _items(md.treeprocessors):
+            self.wrap(item, 'run', 'treeprocessors', name)
+        self.wrap(md, 'serializer', 'serializer', 'serializer')
+        # The built-in serializers serialize the content of the root without calling `serializer`.
+        self.wrap(md, '_serialize_content', 'serializer', 'serializer')
+        self.wrap_iter(md, '_iter_content', 'serializer', 'serializer')
+        for name, item in _items(md.postprocessors):
+            self.wrap(item, 'run', 'postprocessors', name)
+        self.started = time.perf_counter()
+
+    def record(self, stage: str, name: str) -> list:
+        """ Return the `[calls, time]` counters of an item. """
+        timings = self.timings[stage]
+        counters = timings.get(name)
+        if counters is None:
+            counters = timings[name] = [0, 0.0]
+        return counters
+
+    def patch(self, obj: Any, attr: str, value: Any) -> None:
+        """ Set an attribute on `obj` which is removed by `stop`. """
+        try:
+            self.patched.append((obj, attr, obj.__dict__.get(attr, _MISSING)))
+        except AttributeError:
+            # An object with `__slots__` cannot be patched.
+            return
+        setattr(obj, attr, value)
+
+    def wrap(self, obj: Any, attr: str, stage: str, name: str) -> None:
+        """ Replace the method `attr` of `obj` with a wrapper which records its calls. """
+        func = getattr(obj, attr, None)
+        if func is None:
+            return
+        counters = self.record(stage, name)
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counters[0] += 1
+                counters[1] += perf_counter() - start
+
+        # The wrapped method is still recognized by `Markdown` (for example, a built-in serializer).
+        timed.__wrapped__ = func
+        self.patch(obj, attr, timed)
+
+    def wrap_iter(self, obj: Any, attr: str, stage: str, name: str) -> None:
+        """ Replace the method `attr` of `obj`, which returns an iterator, with a wrapper which records its calls. """
+        func = getattr(obj, attr, None)
+        if func is None:
+            return
+        counters = self.record(stage, name)
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            # The time spent producing each item is recorded, not the time spent by the consumer.
+            counters[0] += 1
+            iterator = iter(func(*args, **kwargs))
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    counters[1] += perf_counter() - start
+                yield item
+
+        self.patch(obj, attr, timed)
+
+    def wrap_regex(self, pattern: Any, name: str) -> None:
+        """ Record the time spent searching with the compiled regular expression of an inline pattern. """
+        get_compiled = getattr(pattern, 'getCompiledRegExp', None)
+        if get_compiled is None:
+            return
+        counters = self.record('inlinepatterns.search', name)
+        self.patch(pattern, 'getCompiledRegExp', lambda: _TimedRegex(get_compiled(), counters))
+
+    def stop(self, callback: bool = True) -> ProfileReport:
+        """
+        Remove the instrumentation and build the report. Unless `callback` is `False`, the report is passed to the
+        callback of the profiler.
+        """
+        total = time.perf_counter() - self.started
+        for obj, attr, value in reversed(self.patched):
+            if value is _MISSING:
+                delattr(obj, attr)
+            else:
+                setattr(obj, attr, value)
+        report = ProfileReport(total, {
+            stage: {name: Timing(*counters) for name, counters in timings.items() if counters[0]}
+            for stage, timings in self.timings.items()
+        })
+        self.profiler.report = report
+        if callback and self.profiler.callback is not None:
+            self.profiler.callback(report)
+        return report
+
+
+class _TimedRegex:
+    """ A proxy of a compiled regular expression which records the time spent matching. """
+
+    def __init__(self, compiled: re.Pattern[str], counters: list):
+        self.compiled = compiled
+        self.counters = counters
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.compiled, name)
+
+    def _timed(self, func: Callable, *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.counters[0] += 1
+            self.counters[1] += time.perf_counter() - start
+
+    def match(self, *args: Any) -> re.Match[str] | None:
+        return self._timed(self.compiled.match, *args)
+
+    def search(self, *args: Any) -> re.Match[str] | None:
+        return self._timed(self.compiled.search, *args)
+
+    def finditer(self, *args: Any) -> Iterator[re.Match[str]]:
+        matches = self._timed(self.compiled.finditer, *args)
+        while True:
+            match = self._timed(next, matches, None)
+            if match is None:
+                return
+            yield match
+
+
+# A marker for an attribute which was not set on an instance before it was patched.
+_MISSING = object()
+
+
+def _items(registry: Registry) -> list[tuple[str, Any]]:
+    """ Return the `(name, item)` pairs of a registry in priority order, listing each item only once. """
+    registry._sort()
+    seen = set()
+    items = []
+    for name, priority in registry._priority:
+        item = registry._data[name]
+        if id(item) not in seen:
+            seen.add(id(item))
+            items.append((name, item))
+    return items
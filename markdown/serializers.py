@@ -41,6 +41,8 @@ differences as outlined below:
 
 1. Empty (self-closing) tags are rendered as `<tag>` for HTML and as `<tag />` for XHTML.
 2. Boolean attributes are rendered as `attrname` for HTML and as `attrname="attrname"` for XHTML.
+
+Both write the text of a [`RawHtml`][markdown.util.RawHtml] node to the output verbatim.
 """
 
 from __future__ import annotations
@@ -48,7 +50,9 @@ from __future__ import annotations
 from xml.etree.ElementTree import ProcessingInstruction
 from xml.etree.ElementTree import Comment, ElementTree, Element, QName, HTML_EMPTY
 import re
-from typing import Callable, Literal, NoReturn
+from functools import lru_cache
+from typing import Callable, Iterator, Literal, NoReturn
+from .util import RawHtml
 
 __all__ = ['to_html_string', 'to_xhtml_string']
 
@@ -61,6 +65,10 @@ def _raise_serialization_error(text: str) -> NoReturn:  # pragma: no cover
         )
 
 
+_ESCAPE_CDATA = str.maketrans({'<': '&lt;', '>': '&gt;'})
+_ESCAPE_ATTRIB_HTML = str.maketrans({'<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
 def _escape_cdata(text) -> str:
     # escape character data
     try:
@@ -70,10 +78,8 @@ def _escape_cdata(text) -> str:
         if "&" in text:
             # Only replace & when not part of an entity
             text = RE_AMP.sub('&amp;', text)
-        if "<" in text:
-            text = text.replace("<", "&lt;")
-        if ">" in text:
-            text = text.replace(">", "&gt;")
+        if "<" in text or ">" in text:
+            text = text.translate(_ESCAPE_CDATA)
         return text
     except (TypeError, AttributeError):  # pragma: no cover
         _raise_serialization_error(text)
@@ -104,91 +110,175 @@ def _escape_attrib_html(text: str) -> str:
         if "&" in text:
             # Only replace & when not part of an entity
             text = RE_AMP.sub('&amp;', text)
-        if "<" in text:
-            text = text.replace("<", "&lt;")
-        if ">" in text:
-            text = text.replace(">", "&gt;")
-        if "\"" in text:
-            text = text.replace("\"", "&quot;")
+        if "<" in text or ">" in text or "\"" in text:
+            text = text.translate(_ESCAPE_ATTRIB_HTML)
         return text
     except (TypeError, AttributeError):  # pragma: no cover
         _raise_serialization_error(text)
 
 
-def _serialize_html(write: Callable[[str], None], elem: Element, format: Literal["html", "xhtml"]) -> None:
-    tag = elem.tag
-    text = elem.text
-    if tag is Comment:
-        write("<!--%s-->" % _escape_cdata(text))
-    elif tag is ProcessingInstruction:
-        write("<?%s?>" % _escape_cdata(text))
-    elif tag is None:
-        if text:
-            write(_escape_cdata(text))
-        for e in elem:
-            _serialize_html(write, e, format)
-    else:
-        namespace_uri = None
-        if isinstance(tag, QName):
-            # `QNAME` objects store their data as a string: `{uri}tag`
-            if tag.text[:1] == "{":
-                namespace_uri, tag = tag.text[1:].split("}", 1)
-            else:
-                raise ValueError('QName objects must define a tag.')
-        write("<" + tag)
-        items = elem.items()
-        if items:
-            items = sorted(items)  # lexical order
-            for k, v in items:
-                if isinstance(k, QName):
-                    # Assume a text only `QName`
-                    k = k.text
-                if isinstance(v, QName):
-                    # Assume a text only `QName`
-                    v = v.text
-                else:
-                    v = _escape_attrib_html(v)
-                if k == v and format == 'html':
-                    # handle boolean attributes
-                    write(" %s" % v)
-                else:
-                    write(' {}="{}"'.format(k, v))
-        if namespace_uri:
-            write(' xmlns="%s"' % (_escape_attrib(namespace_uri)))
-        if format == "xhtml" and tag.lower() in HTML_EMPTY:
-            write(" />")
-        else:
-            write(">")
-            if text:
-                if tag.lower() in ["script", "style"]:
-                    write(text)
+@lru_cache(maxsize=256)
+def _tag_flags(tag: str) -> tuple[bool, bool]:
+    # Return whether `tag` is an empty element and whether its text is written unescaped. Cached as the same few
+    # tags are looked up for every element.
+    tag = tag.lower()
+    return tag in HTML_EMPTY, tag in ("script", "style")
+
+
+def _serialize_html(
+    write: Callable[[str], None], elem: Element, format: Literal["html", "xhtml"], sort_attributes: bool = True
+) -> None:
+    # Walk the tree with an explicit stack rather than recursing into each child so that the depth of the tree is not
+    # limited by the recursion limit. `children` iterates over the elements which are being written and the stack holds
+    # the iterator of each parent along with the string which closes that parent (its end tag followed by its tail).
+    stack: list[tuple[Iterator[Element], str]] = []
+    push = stack.append
+    pop = stack.pop
+    children: Iterator[Element] = iter((elem,))
+    xhtml = format == "xhtml"
+    html = format == "html"
+    while True:
+        for elem in children:
+            tag = elem.tag
+            text = elem.text
+            end = ""
+            # Check for a tag name first as it is by far the most common case.
+            if tag.__class__ is str or isinstance(tag, (str, QName)):
+                namespace_uri = None
+                if isinstance(tag, QName):
+                    # `QNAME` objects store their data as a string: `{uri}tag`
+                    if tag.text[:1] == "{":
+                        namespace_uri, tag = tag.text[1:].split("}", 1)
+                    else:
+                        raise ValueError('QName objects must define a tag.')
+                start = "<" + tag
+                items = elem.items()
+                if items:
+                    if sort_attributes:
+                        items = sorted(items)  # lexical order
+                    for k, v in items:
+                        if isinstance(k, QName):
+                            # Assume a text only `QName`
+                            k = k.text
+                        if isinstance(v, QName):
+                            # Assume a text only `QName`
+                            v = v.text
+                        else:
+                            v = _escape_attrib_html(v)
+                        if k == v and html:
+                            # handle boolean attributes
+                            start += " " + v
+                        else:
+                            start += f' {k}="{v}"'
+                if namespace_uri:
+                    start += f' xmlns="{_escape_attrib(namespace_uri)}"'
+                empty, raw_text = _tag_flags(tag)
+                if xhtml and empty:
+                    # The children of an empty element are never written.
+                    write(start + " />")
+                    if elem.tail:
+                        write(_escape_cdata(elem.tail))
+                    continue
+                if text:
+                    write(start + ">" + (text if raw_text else _escape_cdata(text)))
                 else:
+                    write(start + ">")
+                if not empty:
+                    end = "</" + tag + ">"
+            elif tag is None:
+                if text:
                     write(_escape_cdata(text))
-            for e in elem:
-                _serialize_html(write, e, format)
-            if tag.lower() not in HTML_EMPTY:
-                write("</" + tag + ">")
-    if elem.tail:
-        write(_escape_cdata(elem.tail))
+            else:
+                if tag is Comment:
+                    write(f"<!--{_escape_cdata(text)}-->")
+                elif tag is ProcessingInstruction:
+                    write(f"<?{_escape_cdata(text)}?>")
+                elif tag is RawHtml:
+                    write(text)
+                else:  # pragma: no cover
+                    _raise_serialization_error(tag)
+                if elem.tail:
+                    write(_escape_cdata(elem.tail))
+                continue
+            if len(elem):
+                # Write the children before closing the element.
+                if elem.tail:
+                    end += _escape_cdata(elem.tail)
+                push((children, end))
+                children = iter(elem)
+                break
+            if end:
+                write(end)
+            if elem.tail:
+                write(_escape_cdata(elem.tail))
+        else:
+            # All of the children have been written: close their parent and continue with its siblings.
+            if not stack:
+                return
+            children, end = pop()
+            if end:
+                write(end)
 
 
-def _write_html(root: Element, format: Literal["html", "xhtml"] = "html") -> str:
+def _write_html(root: Element, format: Literal["html", "xhtml"] = "html", sort_attributes: bool = True) -> str:
     assert root is not None
     data: list[str] = []
     write = data.append
-    _serialize_html(write, root, format)
+    _serialize_html(write, root, format, sort_attributes)
     return "".join(data)
 
 
+def _write_html_content(root: Element, format: Literal["html", "xhtml"] = "html") -> str:
+    # Serialize the content of `root` without the tags of `root` itself and strip the whitespace from both ends.
+    # The fragments at the ends are stripped before they are joined to avoid copying the whole string again.
+    assert root is not None
+    data: list[str] = []
+    write = data.append
+    if root.text:
+        write(_escape_cdata(root.text))
+    for child in root:
+        _serialize_html(write, child, format)
+    while data and not data[-1].strip():
+        data.pop()
+    if not data:
+        return ""
+    data[-1] = data[-1].rstrip()
+    start = 0
+    while not data[start].strip():
+        start += 1
+    data[start] = data[start].lstrip()
+    return "".join(data[start:])
+
+
+def _iter_html(root: Element, format: Literal["html", "xhtml"] = "html") -> Iterator[str]:
+    # Serialize the content of `root` without the tags of `root` itself. The text of `root` and each child (along
+    # with its tail) are produced one at a time so that a large document need not be held in memory as one string.
+    assert root is not None
+    if root.text:
+        yield _escape_cdata(root.text)
+    for child in root:
+        yield _write_html(child, format)
+
+
 # --------------------------------------------------------------------
 # public functions
 
 
-def to_html_string(element: Element) -> str:
-    """ Serialize element and its children to a string of HTML5. """
-    return _write_html(ElementTree(element).getroot(), format="html")
+def to_html_string(element: Element, *, sort_attributes: bool = True) -> str:
+    """
+    Serialize element and its children to a string of HTML5.
+
+    Attributes are written in lexical order unless `sort_attributes` is `False`, in which case they are written in
+    the order they were set, which is faster.
+    """
+    return _write_html(ElementTree(element).getroot(), format="html", sort_attributes=sort_attributes)
+
 
+def to_xhtml_string(element: Element, *, sort_attributes: bool = True) -> str:
+    """
+    Serialize element and its children to a string of XHTML.
 
-def to_xhtml_string(element: Element) -> str:
-    """ Serialize element and its children to a string of XHTML. """
-    return _write_html(ElementTree(element).getroot(), format="xhtml")
+    Attributes are written in lexical order unless `sort_attributes` is `False`, in which case they are written in
+    the order they were set, which is faster.
+    """
+    return _write_html(ElementTree(element).getroot(), format="xhtml", sort_attributes=sort_attributes)
@@ -26,7 +26,9 @@ references, or last minute adjustments.
 
 from __future__ import annotations
 
+import functools
 import re
+from collections import deque
 import xml.etree.ElementTree as etree
 from typing import TYPE_CHECKING, Any
 from . import util
@@ -52,6 +54,22 @@ def isString(s: object) -> bool:
     return False
 
 
+def _find_first(data: str, chars: str, start: int) -> int:
+    """ Return the lowest index in `data` (from `start`) of any of `chars` or `-1` if none are found. """
+    first = -1
+    for char in chars:
+        index = data.find(char, start)
+        if index != -1 and (first == -1 or index < first):
+            first = index
+    return first
+
+
+@functools.lru_cache(maxsize=None)
+def _has_lookbehind(regex: str) -> bool:
+    """ Return `True` if a regular expression may look at the text before the position a match starts at. """
+    return '(?<' in regex or '\\b' in regex or '\\B' in regex
+
+
 class Treeprocessor(util.Processor):
     """
     `Treeprocessor`s are run on the `ElementTree` object before serialization.
@@ -131,16 +149,23 @@ class InlineProcessor(Treeprocessor):
         """
         if not isinstance(data, util.AtomicString):
             startIndex = 0
-            count = len(self.inlinePatterns)
+            patterns = self.inlinePatterns.snapshot()
+            count = len(patterns)
             while patternIndex < count:
                 data, matched, startIndex = self.__applyPattern(
-                    self.inlinePatterns[patternIndex], data, patternIndex, startIndex
+                    patterns[patternIndex], data, patternIndex, startIndex
                 )
                 if not matched:
                     patternIndex += 1
         return data
 
-    def __processElementText(self, node: etree.Element, subnode: etree.Element, isText: bool = True) -> None:
+    def __processElementText(
+        self,
+        node: etree.Element,
+        subnode: etree.Element,
+        isText: bool = True,
+        pos: int = 0
+    ) -> int:
         """
         Process placeholders in `Element.text` or `Element.tail`
         of Elements popped from `self.stashed_nodes`.
@@ -149,6 +174,10 @@ class InlineProcessor(Treeprocessor):
             node: Parent node.
             subnode: Processing node.
             isText: Boolean variable, True - it's text, False - it's a tail.
+            pos: Index in `node` at which the new elements are inserted.
+
+        Returns:
+            The number of elements inserted in `node`.
 
         """
         if isText:
@@ -160,14 +189,8 @@ class InlineProcessor(Treeprocessor):
 
         childResult = self.__processPlaceholders(text, subnode, isText)
 
-        if not isText and node is not subnode:
-            pos = list(node).index(subnode) + 1
-        else:
-            pos = 0
-
-        childResult.reverse()
-        for newChild in childResult:
-            node.insert(pos, newChild[0])
+        node[pos:pos] = [newChild[0] for newChild in childResult]
+        return len(childResult)
 
     def __processPlaceholders(
         self,
@@ -219,15 +242,20 @@ class InlineProcessor(Treeprocessor):
                         linkText(text)
 
                     if not isinstance(node, str):  # it's Element
-                        for child in [node] + list(node):
+                        # Count the elements inserted in `node` to know the
+                        # index of each child without searching for it.
+                        inserted = 0
+                        for i, child in enumerate([node] + list(node)):
                             if child.tail:
                                 if child.tail.strip():
-                                    self.__processElementText(
-                                        node, child, False
+                                    inserted += self.__processElementText(
+                                        node, child, False, i + inserted
                                     )
                             if child.text:
                                 if child.text.strip():
-                                    self.__processElementText(child, child)
+                                    count = self.__processElementText(child, child)
+                                    if child is node:
+                                        inserted += count
                     else:  # it's just a string
                         linkText(node)
                         strartIndex = phEndIndex
@@ -277,33 +305,94 @@ class InlineProcessor(Treeprocessor):
             if exclude.lower() in self.ancestors:
                 return data, False, 0
 
-        if new_style:
+        triggers = getattr(pattern, 'triggers', None)
+        if triggers is not None:
+            # No match can start before the first trigger character.
+            first = _find_first(data, triggers, startIndex)
+            if first == -1:
+                return data, False, 0
+            if new_style:
+                startIndex = first
+
+        if not new_style:  # pragma: no cover
+            match = pattern.getCompiledRegExp().match(data[startIndex:])
+            if not match:
+                return data, False, 0
+            node = pattern.handleMatch(match)
+            if node is None:
+                return data, True, match.end(0)
+            placeholder = self.__stashMatch(node, pattern, patternIndex)
+            return "{}{}{}{}".format(data[:startIndex],
+                                     match.group(1),
+                                     placeholder, match.groups()[-1]), True, 0
+
+        # Replace every match in a single pass. The text between the matches
+        # and the placeholders are collected in `parts` and joined once at the
+        # end, so that each match does not copy the whole text.
+        regex = pattern.getCompiledRegExp()
+        lookbehind = _has_lookbehind(regex.pattern)
+        if isinstance(pattern, inlinepatterns.AsteriskProcessor):
+            # Its `handleMatch` matches its own patterns at the position its regular expression matched.
+            lookbehind = lookbehind or any(_has_lookbehind(item.pattern.pattern) for item in pattern.PATTERNS)
+        parts = []
+        last = 0
+        replaced = False
+        while True:
             match = None
             # Since `handleMatch` may reject our first match,
             # we iterate over the buffer looking for matches
             # until we can't find any more.
-            for match in pattern.getCompiledRegExp().finditer(data, startIndex):
+            for match in regex.finditer(data, startIndex):
                 node, start, end = pattern.handleMatch(match, data)
                 if start is None or end is None:
-                    startIndex += match.end(0)
                     match = None
                     continue
                 break
-        else:  # pragma: no cover
-            match = pattern.getCompiledRegExp().match(data[startIndex:])
-            leftData = data[:startIndex]
-
-        if not match:
-            return data, False, 0
-
-        if not new_style:  # pragma: no cover
-            node = pattern.handleMatch(match)
-            start = match.start(0)
-            end = match.end(0)
-
-        if node is None:
-            return data, True, end
-
+            if match is None:
+                break
+            # `handleMatch` may return indexes which are negative or out of order. Treat
+            # them as the slices of the text they were once used for.
+            start, end, _ = slice(start, end).indices(len(data))
+            if start < last:
+                # The match overlaps text which has already been replaced. Replace the
+                # matches so far and search the resulting text again from the start.
+                parts.append(data[last:])
+                return ''.join(parts), True, 0
+            if node is not None and (
+                end < start or triggers is None or any(data.find(char, last, start) != -1 for char in triggers)
+            ):
+                # Either the text between `end` and `start` is kept on both sides of the placeholder or a match
+                # may start in the text before the placeholder and surround it (such as `**foo* bar*`). Replace
+                # the matches so far and search the resulting text again from the start.
+                parts.append(data[last:start])
+                parts.append(self.__stashMatch(node, pattern, patternIndex))
+                parts.append(data[end:])
+                return ''.join(parts), True, 0
+            if node is not None:
+                parts.append(data[last:start])
+                parts.append(self.__stashMatch(node, pattern, patternIndex))
+                last = end
+                replaced = True
+                if lookbehind and end < len(data) and (triggers is None or data[end] in triggers):
+                    # A match starting right after the placeholder would look behind at the
+                    # placeholder rather than at the replaced text. Join the text so far.
+                    rest = data[end:]
+                    parts.append(rest)
+                    data = ''.join(parts)
+                    end = len(data) - len(rest)
+                    parts = []
+                    last = 0
+            startIndex = end
+
+        if parts:
+            parts.append(data[last:])
+            data = ''.join(parts)
+        # Search the joined text again until a pass replaces nothing, so that a match may still surround the
+        # placeholders of earlier matches of this pattern.
+        return data, replaced, 0
+
+    def __stashMatch(self, node: etree.Element | str, pattern: inlinepatterns.Pattern, patternIndex: int) -> str:
+        """ Apply the remaining patterns to the text of a matched node and stash it. Return its placeholder. """
         if not isinstance(node, str):
             if not isinstance(node.text, util.AtomicString):
                 # We need to process current node too
@@ -320,25 +409,7 @@ class InlineProcessor(Treeprocessor):
                                 child.tail, patternIndex
                             )
 
-        placeholder = self.__stashNode(node, pattern.type())
-
-        if new_style:
-            return "{}{}{}".format(data[:start],
-                                   placeholder, data[end:]), True, 0
-        else:  # pragma: no cover
-            return "{}{}{}{}".format(leftData,
-                                     match.group(1),
-                                     placeholder, match.groups()[-1]), True, 0
-
-    def __build_ancestors(self, parent: etree.Element | None, parents: list[str]) -> None:
-        """Build the ancestor list."""
-        ancestors = []
-        while parent is not None:
-            if parent is not None:
-                ancestors.append(parent.tag.lower())
-            parent = self.parent_map.get(parent)
-        ancestors.reverse()
-        parents.extend(ancestors)
+        return self.__stashNode(node, pattern.type())
 
     def run(self, tree: etree.Element, ancestors: list[str] | None = None) -> etree.Element:
         """Apply inline patterns to a parsed Markdown tree.
@@ -364,17 +435,21 @@ class InlineProcessor(Treeprocessor):
         # to ensure we don't have the user accidentally change it on us.
         tree_parents = [] if ancestors is None else ancestors[:]
 
-        self.parent_map = {c: p for p in tree.iter() for c in p}
-        stack = [(tree, tree_parents)]
+        # Each element is queued with the tags of its ancestors, which
+        # are extended with its own tag when it is processed.
+        stack = deque([(tree, tree_parents)])
 
         while stack:
-            currElement, parents = stack.pop(0)
+            currElement, parents = stack.popleft()
 
             self.ancestors = parents
-            self.__build_ancestors(currElement, self.ancestors)
+            self.ancestors.append(currElement.tag.lower())
 
             insertQueue = []
-            for child in currElement:
+            # Iterate by index as the results of each tail are inserted after its child.
+            index = 0
+            while index < len(currElement):
+                child = currElement[index]
                 if child.text and not isinstance(
                     child.text, util.AtomicString
                 ):
@@ -384,9 +459,7 @@ class InlineProcessor(Treeprocessor):
                     lst = self.__processPlaceholders(
                         self.__handleInline(text), child
                     )
-                    for item in lst:
-                        self.parent_map[item[0]] = child
-                    stack += lst
+                    stack.extend(lst)
                     insertQueue.append((child, lst))
                     self.ancestors.pop()
                 if child.tail:
@@ -396,14 +469,10 @@ class InlineProcessor(Treeprocessor):
                     tailResult = self.__processPlaceholders(tail, dumby, False)
                     if dumby.tail:
                         child.tail = dumby.tail
-                    pos = list(currElement).index(child) + 1
-                    tailResult.reverse()
-                    for newChild in tailResult:
-                        self.parent_map[newChild[0]] = currElement
-                        currElement.insert(pos, newChild[0])
+                    currElement[index + 1:index + 1] = [newChild[0] for newChild in tailResult]
                 if len(child):
-                    self.parent_map[child] = currElement
                     stack.append((child, self.ancestors[:]))
+                index += 1
 
             for element, lst in insertQueue:
                 for i, obj in enumerate(lst):
@@ -421,10 +490,10 @@ class PrettifyTreeprocessor(Treeprocessor):
         i = "\n"
         if self.md.is_block_level(elem.tag) and elem.tag not in ['code', 'pre']:
             if (not elem.text or not elem.text.strip()) \
-                    and len(elem) and self.md.is_block_level(elem[0].tag):
+                    and len(elem) and (elem[0].tag is util.RawHtml or self.md.is_block_level(elem[0].tag)):
                 elem.text = i
             for e in elem:
-                if self.md.is_block_level(e.tag):
+                if e.tag is util.RawHtml or self.md.is_block_level(e.tag):
                     self._prettifyETree(e)
         if not elem.tail or not elem.tail.strip():
             elem.tail = i
@@ -466,7 +535,7 @@ class UnescapeTreeprocessor(Treeprocessor):
         """ Loop over all elements and unescape all text. """
         for elem in root.iter():
             # Unescape text content
-            if elem.text and not elem.tag == 'code':
+            if elem.text and not elem.tag == 'code' and elem.tag is not util.RawHtml:
                 elem.text = self.unescape(elem.text)
             # Unescape tail content
             if elem.tail:
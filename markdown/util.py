@@ -24,16 +24,18 @@ throughout the code base.
 
 from __future__ import annotations
 
+import importlib
 import re
 import sys
 import warnings
+import xml.etree.ElementTree as etree
 from functools import wraps, lru_cache
 from itertools import count
-from typing import TYPE_CHECKING, Generic, Iterator, NamedTuple, TypeVar, TypedDict, overload
+from typing import TYPE_CHECKING, Callable, Generic, Iterator, NamedTuple, TypeVar, TypedDict, overload
 
 if TYPE_CHECKING:  # pragma: no cover
     from markdown import Markdown
-    import xml.etree.ElementTree as etree
+    from markdown.extensions import Extension
 
 _T = TypeVar('_T')
 
@@ -95,6 +97,31 @@ RTL_BIDI_RANGES = (
     ('\u2D30', '\u2D7F')  # Tifinagh
 )
 
+BUILTIN_EXTENSIONS: dict[str, str] = {
+    'abbr': 'markdown.extensions.abbr:AbbrExtension',
+    'admonition': 'markdown.extensions.admonition:AdmonitionExtension',
+    'attr_list': 'markdown.extensions.attr_list:AttrListExtension',
+    'codehilite': 'markdown.extensions.codehilite:CodeHiliteExtension',
+    'def_list': 'markdown.extensions.def_list:DefListExtension',
+    'extra': 'markdown.extensions.extra:ExtraExtension',
+    'fenced_code': 'markdown.extensions.fenced_code:FencedCodeExtension',
+    'footnotes': 'markdown.extensions.footnotes:FootnoteExtension',
+    'md_in_html': 'markdown.extensions.md_in_html:MarkdownInHtmlExtension',
+    'meta': 'markdown.extensions.meta:MetaExtension',
+    'nl2br': 'markdown.extensions.nl2br:Nl2BrExtension',
+    'sane_lists': 'markdown.extensions.sane_lists:SaneListExtension',
+    'smarty': 'markdown.extensions.smarty:SmartyExtension',
+    'tables': 'markdown.extensions.tables:TableExtension',
+    'toc': 'markdown.extensions.toc:TocExtension',
+    'wikilinks': 'markdown.extensions.wikilinks:WikiLinkExtension',
+    'legacy_attrs': 'markdown.extensions.legacy_attrs:LegacyAttrExtension',
+    'legacy_em': 'markdown.extensions.legacy_em:LegacyEmExtension',
+}
+"""
+The entry points of the built-in extensions, keyed by name. These names are resolved without scanning the metadata of
+the installed distributions. Keep in sync with the `markdown.extensions` entry points in `pyproject.toml`.
+"""
+
 
 # AUXILIARY GLOBAL FUNCTIONS
 # =============================================================================
@@ -111,6 +138,35 @@ def get_installed_extensions():
     return metadata.entry_points(group='markdown.extensions')
 
 
+@lru_cache(maxsize=None)
+def get_extension_class(name: str) -> Callable[..., Extension] | None:
+    """
+    Return the extension class registered under the entry point `name`, or `None` if there is none.
+
+    The names of the built-in extensions are looked up in [`BUILTIN_EXTENSIONS`][markdown.util.BUILTIN_EXTENSIONS].
+    Only other names are looked up in the `markdown.extensions` entry points of the installed distributions, which are
+    scanned once. If more than one distribution registers a name, the first one found is used. The result for each
+    name is cached for the life of the process. Call [`clear_extension_cache`][markdown.util.clear_extension_cache]
+    to find extensions installed since.
+    """
+    if name in BUILTIN_EXTENSIONS:
+        module_name, class_name = BUILTIN_EXTENSIONS[name].split(':')
+        return getattr(importlib.import_module(module_name), class_name)
+    for entry_point in get_installed_extensions():
+        if entry_point.name == name:
+            return entry_point.load()
+    return None
+
+
+def clear_extension_cache() -> None:
+    """
+    Clear the cached entry points of [`get_installed_extensions`][markdown.util.get_installed_extensions] and the
+    extension classes of [`get_extension_class`][markdown.util.get_extension_class].
+    """
+    get_installed_extensions.cache_clear()
+    get_extension_class.cache_clear()
+
+
 def deprecated(message: str, stacklevel: int = 2):
     """
     Raise a [`DeprecationWarning`][] when wrapped function/method is called.
@@ -191,6 +247,24 @@ class AtomicString(str):
     pass
 
 
+def RawHtml(html: str) -> etree.Element:
+    """
+    Return a node of raw HTML which the serializers write to the output verbatim.
+
+    As with [`Comment`][xml.etree.ElementTree.Comment], the tag of the node is this function, so a node of raw
+    HTML can be recognized with `element.tag is RawHtml`. Its HTML is held as an
+    [`AtomicString`][markdown.util.AtomicString] in the `text` of the node, so that it is not processed by inline
+    patterns, and it has no children. The `PrettifyTreeprocessor` treats it as a block-level element.
+
+    Arguments:
+        html: A string of block-level HTML.
+
+    """
+    element = etree.Element(RawHtml)
+    element.text = AtomicString(html)
+    return element
+
+
 class Processor:
     """ The base class for all processors.
 
@@ -308,12 +382,19 @@ class Registry(Generic[_T]):
 
     The method `get_index_for_name` is also available to obtain the index of
     an item using that item's assigned "name".
+
+    The sorted items are cached until an item is registered or deregistered.
+    Code which reads the items many times in a row may get them all at once
+    with `snapshot`.
     """
 
     def __init__(self):
         self._data: dict[str, _T] = {}
         self._priority: list[_PriorityItem] = []
         self._is_sorted = False
+        # Built by `_sort`: the items in sorted order and the index of each name.
+        self._items: tuple[_T, ...] = ()
+        self._index: dict[str, int] = {}
 
     def __contains__(self, item: str | _T) -> bool:
         if isinstance(item, str):
@@ -324,7 +405,7 @@ class Registry(Generic[_T]):
 
     def __iter__(self) -> Iterator[_T]:
         self._sort()
-        return iter([self._data[k] for k, p in self._priority])
+        return iter(self._items)
 
     @overload
     def __getitem__(self, key: str | int) -> _T:  # pragma: no cover
@@ -342,7 +423,7 @@ class Registry(Generic[_T]):
                 data.register(self._data[k], k, p)
             return data
         if isinstance(key, int):
-            return self._data[self._priority[key].name]
+            return self._items[key]
         return self._data[key]
 
     def __len__(self) -> int:
@@ -355,13 +436,22 @@ class Registry(Generic[_T]):
         """
         Return the index of the given name.
         """
-        if name in self:
+        if name in self._data:
             self._sort()
-            return self._priority.index(
-                [x for x in self._priority if x.name == name][0]
-            )
+            return self._index[name]
         raise ValueError('No item named "{}" exists.'.format(name))
 
+    def snapshot(self) -> tuple[_T, ...]:
+        """
+        Return all items sorted by priority from highest to lowest.
+
+        The same tuple is returned until an item is registered or deregistered,
+        so it is cheaper to read the items of the tuple in a loop than to index
+        the registry. The tuple does not change when the registry does.
+        """
+        self._sort()
+        return self._items
+
     def register(self, item: _T, name: str, priority: float) -> None:
         """
         Add an item to the registry with the given name and priority.
@@ -398,6 +488,7 @@ class Registry(Generic[_T]):
             index = self.get_index_for_name(name)
             del self._priority[index]
             del self._data[name]
+            self._is_sorted = False
         except ValueError:
             if strict:
                 raise
@@ -410,4 +501,6 @@ class Registry(Generic[_T]):
         """
         if not self._is_sorted:
             self._priority.sort(key=lambda item: item.priority, reverse=True)
+            self._items = tuple(self._data[name] for name, _ in self._priority)
+            self._index = {name: i for i, (name, _) in enumerate(self._priority)}
             self._is_sorted = True
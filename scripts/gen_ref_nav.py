@@ -23,6 +23,7 @@ modules = [
     base_path.joinpath("markdown", "inlinepatterns.py"),
     base_path.joinpath("markdown", "postprocessors.py"),
     base_path.joinpath("markdown", "serializers.py"),
+    base_path.joinpath("markdown", "profiler.py"),
     base_path.joinpath("markdown", "util.py"),
     base_path.joinpath("markdown", "htmlparser.py"),
     base_path.joinpath("markdown", "test_tools.py"),
@@ -25,8 +25,11 @@ Tests of the various APIs with the Python Markdown library.
 """
 
 import unittest
+import re
 import sys
+import time
 import os
+import subprocess
 import markdown
 import warnings
 from markdown.__main__ import parse_options
@@ -75,6 +78,36 @@ class TestMarkdownBasics(unittest.TestCase):
         """ Test Extension loading with class name (`path.to.module:Class`). """
         markdown.Markdown(extensions=['markdown.extensions.footnotes:FootnoteExtension'])
 
+    def testBuiltinExtensionNames(self):
+        """ Test that the built-in extensions match the entry points in `pyproject.toml`. """
+        try:
+            import tomllib
+        except ImportError:  # pragma: no cover
+            self.skipTest('tomllib is not available')
+        with open(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'pyproject.toml'), 'rb') as f:
+            entry_points = tomllib.load(f)['project']['entry-points']['markdown.extensions']
+        self.assertEqual(markdown.util.BUILTIN_EXTENSIONS, entry_points)
+
+    def testExtensionClassCache(self):
+        """ Test that extension classes found by name are cached until the cache is cleared. """
+        from importlib.metadata import EntryPoint
+        from markdown.extensions.footnotes import FootnoteExtension
+        entry_point = EntryPoint('myext', 'markdown.extensions.footnotes:FootnoteExtension', 'markdown.extensions')
+        get_installed_extensions = markdown.util.get_installed_extensions
+        markdown.util.clear_extension_cache()
+        try:
+            markdown.util.get_installed_extensions = lambda: [entry_point]
+            self.assertIs(markdown.util.get_extension_class('footnotes'), FootnoteExtension)
+            self.assertIs(markdown.util.get_extension_class('myext'), FootnoteExtension)
+            self.assertIsNone(markdown.util.get_extension_class('missing'))
+            markdown.util.get_installed_extensions = get_installed_extensions
+            self.assertIsInstance(markdown.Markdown(extensions=['myext']).registeredExtensions[0], FootnoteExtension)
+            markdown.util.clear_extension_cache()
+            self.assertIsNone(markdown.util.get_extension_class('myext'))
+        finally:
+            markdown.util.get_installed_extensions = get_installed_extensions
+            markdown.util.clear_extension_cache()
+
 
 class TestConvertFile(unittest.TestCase):
     """ Tests of ConvertFile. """
@@ -115,6 +148,516 @@ class TestConvertFile(unittest.TestCase):
         self.assertEqual(sys.stdout.read(), '<p>foo</p>')
 
 
+class RecordingStream(StringIO):
+    """ A text stream which records each write. """
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, s):
+        self.writes.append(s)
+        return super().write(s)
+
+
+class WholeDocumentPostprocessor(markdown.postprocessors.Postprocessor):
+    """ A postprocessor which wraps the whole document. """
+
+    def run(self, text):
+        return '<main>' + text + '</main>'
+
+
+class TestConvertTo(unittest.TestCase):
+    """ Tests of `Markdown.convert_to`. """
+
+    source = (
+        '  \n\n# Title\n\nSome *text* & [a link](http://example.com?a&b "T").[^1]\n\n'
+        '<div>\nraw\n</div>\n\n    code\n\n* item\n\n[^1]: A footnote.\n\n  '
+    )
+
+    def testTextStream(self):
+        for output_format in ('html', 'xhtml'):
+            md = markdown.Markdown(extensions=['footnotes'], output_format=output_format)
+            expected = md.convert(self.source)
+            stream = RecordingStream()
+            md.reset().convert_to(self.source, stream)
+            self.assertEqual(stream.getvalue(), expected)
+
+    def testWrittenInChunks(self):
+        stream = RecordingStream()
+        markdown.Markdown().convert_to('# Title\n\nA paragraph.\n\n* item', stream)
+        self.assertEqual(stream.writes, ['<h1>Title</h1>', '\n<p>A paragraph.</p>', '\n<ul>\n<li>item</li>\n</ul>'])
+
+    def testBinaryStream(self):
+        stream = BytesIO()
+        markdown.Markdown().convert_to('A \u00e9 \u2014 paragraph.', stream)
+        self.assertEqual(stream.getvalue(), '<p>A \u00e9 \u2014 paragraph.</p>'.encode('utf-8'))
+
+    def testBinaryStreamEncoding(self):
+        stream = BytesIO()
+        markdown.Markdown().convert_to('A \u00e9 paragraph.', stream, encoding='ascii')
+        self.assertEqual(stream.getvalue(), b'<p>A &#233; paragraph.</p>')
+
+    def testBlankDocument(self):
+        stream = RecordingStream()
+        markdown.Markdown().convert_to(' \n\n ', stream)
+        self.assertEqual(stream.writes, [])
+
+    def testWholeDocumentPostprocessor(self):
+        md = markdown.Markdown()
+        md.postprocessors.register(WholeDocumentPostprocessor(), 'whole', 0)
+        stream = RecordingStream()
+        md.convert_to(self.source, stream)
+        self.assertEqual(stream.writes, [md.reset().convert(self.source)])
+
+    def testNoStripTopLevelTags(self):
+        md = markdown.Markdown()
+        md.stripTopLevelTags = False
+        stream = RecordingStream()
+        md.convert_to('A paragraph.', stream)
+        self.assertEqual(stream.writes, ['<div>\n<p>A paragraph.</p>\n</div>'])
+
+    def testReturnsInstance(self):
+        md = markdown.Markdown()
+        self.assertIs(md.convert_to('foo', StringIO()), md)
+
+
+class TestConvertMany(unittest.TestCase):
+    """ Tests of batch conversion. """
+
+    sources = ['# One', 'title: Two\n\n# Two', '*three*']
+
+    def testSerial(self):
+        md = markdown.Markdown(extensions=['toc'])
+        results = md.convert_many(self.sources)
+        self.assertEqual(
+            [r.html for r in results],
+            ['<h1 id="one">One</h1>', '<p>title: Two</p>\n<h1 id="two">Two</h1>', '<p><em>three</em></p>']
+        )
+        self.assertEqual(results[0].toc_tokens[0]['name'], 'One')
+        self.assertIsNone(results[0].Meta)
+        self.assertIsNone(results[0].error)
+
+    def testWorkers(self):
+        results = markdown.convert_many(self.sources, workers=2, extensions=['meta', 'toc'])
+        self.assertEqual(
+            [r.html for r in results],
+            ['<h1 id="one">One</h1>', '<h1 id="two">Two</h1>', '<p><em>three</em></p>']
+        )
+        self.assertEqual([r.Meta for r in results], [{}, {'title': ['Two']}, {}])
+        self.assertIn('href="#two"', results[1].toc)
+
+    def testError(self):
+        results = markdown.convert_many(['foo', None, 'bar'])
+        self.assertEqual(results[0].html, '<p>foo</p>')
+        self.assertIsNone(results[1].html)
+        self.assertIsInstance(results[1].error, AttributeError)
+        self.assertEqual(results[2].html, '<p>bar</p>')
+
+    def testUnpicklableErrorInWorker(self):
+        results = markdown.convert_many(['foo', 'fail', 'bar'], workers=2, extensions=[FailingExtension()])
+        self.assertEqual([r.html for r in results], ['<p>foo</p>', None, '<p>bar</p>'])
+        self.assertIsInstance(results[1].error, RuntimeError)
+        self.assertIn('UnpicklableError', str(results[1].error))
+
+    def testImportDoesNotLoadMultiprocessing(self):
+        code = 'import sys, markdown; print("multiprocessing" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=os.path.dirname(os.path.dirname(__file__)))
+        self.assertEqual(output.strip(), b'False')
+
+
+class UnpicklableError(Exception):
+    """ An error which holds an attribute that cannot be pickled. """
+
+    def __init__(self):
+        super().__init__('unpicklable')
+        self.callback = lambda: None
+
+
+class FailingPreprocessor(markdown.preprocessors.Preprocessor):
+    """ Raise an `UnpicklableError` for the document `fail`. """
+
+    def run(self, lines):
+        if lines == ['fail']:
+            raise UnpicklableError()
+        return lines
+
+
+class FailingExtension(markdown.extensions.Extension):
+    """ Register the `FailingPreprocessor`. """
+
+    def extendMarkdown(self, md):
+        md.preprocessors.register(FailingPreprocessor(md), 'failing', 100)
+
+
+class TestMarkdownPool(unittest.TestCase):
+    """ Tests of the MarkdownPool class. """
+
+    def testReuse(self):
+        pool = markdown.MarkdownPool(extensions=['footnotes'])
+        self.assertEqual(pool.convert('foo[^1]\n\n[^1]: bar'), markdown.markdown(
+            'foo[^1]\n\n[^1]: bar', extensions=['footnotes']
+        ))
+        with pool.checkout() as md:
+            # The instance was reset when it was returned.
+            self.assertEqual(md.htmlStash.html_counter, 0)
+            self.assertEqual(len(md.parser.blockprocessors['footnote'].footnotes.footnotes), 0)
+        stats = pool.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size, stats.idle), (1, 1, 1, 1))
+        self.assertGreater(stats.construction_time, 0)
+
+    def testMaxSize(self):
+        pool = markdown.MarkdownPool(maxsize=1)
+        md = pool.acquire()
+        with self.assertRaises(TimeoutError):
+            pool.acquire(block=False)
+        with self.assertRaises(TimeoutError):
+            pool.acquire(timeout=0.01)
+        pool.release(md)
+        self.assertIs(pool.acquire(block=False), md)
+
+    def testResetFailure(self):
+        pool = markdown.MarkdownPool(maxsize=1)
+        md = pool.acquire()
+
+        def reset():
+            raise ValueError('reset failed')
+
+        md.reset = reset
+        with self.assertRaises(ValueError):
+            pool.release(md)
+        stats = pool.stats()
+        self.assertEqual((stats.discarded, stats.size, stats.idle), (1, 0, 0))
+        self.assertIsNot(pool.acquire(block=False), md)
+
+    def testMaxIdle(self):
+        pool = markdown.MarkdownPool(max_idle=1)
+        instances = [pool.acquire() for i in range(3)]
+        for md in instances:
+            pool.release(md)
+        stats = pool.stats()
+        self.assertEqual((stats.misses, stats.discarded, stats.size, stats.idle), (3, 2, 1, 1))
+
+    def testThreads(self):
+        import threading
+        pool = markdown.MarkdownPool(maxsize=2)
+        results = {}
+
+        def convert(i):
+            results[i] = pool.convert('*%d*' % i)
+
+        threads = [threading.Thread(target=convert, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {i: '<p><em>%d</em></p>' % i for i in range(20)})
+        stats = pool.stats()
+        self.assertLessEqual(stats.size, 2)
+        self.assertEqual(stats.hits + stats.misses, 20)
+
+
+class TestClone(unittest.TestCase):
+    """ Tests of Markdown.clone and the MarkdownPrototype class. """
+
+    source = '# Header\n\nfoo[^1] "bar"\n\n[^1]: baz'
+    kwargs = {'extensions': ['toc', 'footnotes', 'smarty'], 'extension_configs': {'toc': {'permalink': True}}}
+
+    def testClone(self):
+        md = markdown.Markdown(**self.kwargs)
+        clone = md.clone()
+        self.assertIsInstance(clone, markdown.Markdown)
+        reference = markdown.Markdown(**self.kwargs)
+        self.assertEqual(clone.convert(self.source), reference.convert(self.source))
+        self.assertEqual(clone.toc, reference.toc)
+        # The state of the clone is its own.
+        self.assertEqual(md.htmlStash.html_counter, 0)
+        self.assertEqual(len(md.parser.blockprocessors['footnote'].footnotes.footnotes), 0)
+        self.assertIs(clone.parser.blockprocessors['footnote'].parser, clone.parser)
+        self.assertIs(clone.treeprocessors['inline'].md, clone)
+        self.assertIsNot(clone.registeredExtensions[0], md.registeredExtensions[0])
+        # Compiled regular expressions and extension configs are shared.
+        self.assertIs(clone.inlinePatterns['link'].compiled_re, md.inlinePatterns['link'].compiled_re)
+        self.assertIs(clone.registeredExtensions[0].config, md.registeredExtensions[0].config)
+
+    def testIndependentRegistries(self):
+        md = markdown.Markdown()
+        clone = md.clone()
+        clone.inlinePatterns.deregister('em_strong')
+        clone.preprocessors.register(markdown.preprocessors.NormalizeWhitespace(clone), 'extra', 5)
+        self.assertIn('em_strong', md.inlinePatterns)
+        self.assertNotIn('extra', md.preprocessors)
+        self.assertEqual(md.convert('*foo*'), '<p><em>foo</em></p>')
+        self.assertEqual(clone.convert('*foo*'), '<p>*foo*</p>')
+
+    def testPrototype(self):
+        md = markdown.Markdown(**self.kwargs)
+        prototype = markdown.MarkdownPrototype(md)
+        # Later changes to the original do not affect the prototype.
+        md.inlinePatterns.deregister('em_strong')
+        first, second = prototype.new(), prototype.new()
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.htmlStash, second.htmlStash)
+        source = self.source + ' *qux*'
+        self.assertEqual(first.convert(source), markdown.markdown(source, **self.kwargs))
+        self.assertEqual(second.htmlStash.html_counter, 0)
+        self.assertEqual(len(second.parser.blockprocessors['footnote'].footnotes.footnotes), 0)
+
+    def testUnknownTypes(self):
+        md = markdown.Markdown()
+        md.custom = {'set': {1, 2}, 'method': md.reset, 'other': Item('foo')}
+        clone = md.clone()
+        self.assertIsNot(clone.custom['set'], md.custom['set'])
+        self.assertIs(clone.custom['method'].__self__, clone)
+        self.assertIsNot(clone.custom['other'], md.custom['other'])
+        self.assertEqual(clone.custom['other'].data, 'foo')
+
+
+class TestLazyImports(unittest.TestCase):
+    """ Test that modules which are slow to import are only imported when used. """
+
+    def isLoaded(self, code, module):
+        code = f'import sys; {code}; print({module!r} in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=os.path.dirname(os.path.dirname(__file__)))
+        return output.strip() == b'True'
+
+    def testImport(self):
+        for module in ('htmlparser', 'pickle', 'html.entities', 'pygments', 'yaml'):
+            with self.subTest(module=module):
+                self.assertFalse(self.isLoaded('import markdown', module))
+
+    def testCommandLine(self):
+        self.assertFalse(self.isLoaded('import markdown.__main__', 'yaml'))
+
+    def testPygments(self):
+        code = 'import markdown; markdown.markdown("foo", extensions=["fenced_code", "codehilite"])'
+        self.assertFalse(self.isLoaded(code, 'pygments'))
+
+    def testHtmlParser(self):
+        self.assertTrue(self.isLoaded('import markdown; markdown.markdown("<div>foo</div>")', 'htmlparser'))
+
+
+class TestProfiler(unittest.TestCase):
+    """ Tests of the pipeline profiler. """
+
+    def testReport(self):
+        from markdown.profiler import Profiler, STAGES
+        reports = []
+        md = markdown.Markdown(extensions=['toc'])
+        md.profiler = Profiler(callback=reports.append)
+        source = '# Header\n\nSome *emphasis*.\n\n    code'
+        self.assertEqual(md.convert(source), markdown.markdown(source, extensions=['toc']))
+        self.assertEqual(reports, [md.profiler.report])
+        report = md.profiler.report
+        self.assertEqual(tuple(report.stages), STAGES)
+        self.assertEqual(report.stages['preprocessors']['html_block'].calls, 1)
+        self.assertEqual(report.stages['blockprocessors.run']['code'].calls, 1)
+        self.assertIn('hashheader', report.stages['blockprocessors.test'])
+        self.assertEqual(report.stages['inlinepatterns.handleMatch']['em_strong'].calls, 1)
+        self.assertIn('em_strong', report.stages['inlinepatterns.search'])
+        self.assertEqual(report.stages['treeprocessors']['toc'].calls, 1)
+        self.assertGreaterEqual(report.stages['serializer']['serializer'].calls, 1)
+        self.assertGreaterEqual(report.stages['postprocessors']['raw_html'].calls, 1)
+        self.assertGreaterEqual(report.total, report.stages['treeprocessors']['inline'].time)
+        self.assertEqual(report.as_dict()['stages']['blockprocessors.run']['code']['calls'], 1)
+        self.assertIn('blockprocessors.run[code]', str(report))
+
+    def testSerializerPath(self):
+        from markdown.profiler import Profiler
+        md = markdown.Markdown()
+        md.profiler = Profiler()
+        source = '*foo*\n\nbar\n\n    baz'
+        # The profiled conversion serializes the content of the root as one without a profiler does.
+        formats = []
+        serialize_content = md._serialize_content
+        md._serialize_content = lambda root, format: formats.append(format) or serialize_content(root, format)
+        self.assertEqual(md.convert(source), markdown.markdown(source))
+        self.assertEqual(formats, ['xhtml'])
+        self.assertEqual(md.profiler.report.stages['serializer']['serializer'].calls, 1)
+        stream = RecordingStream()
+        md.reset().convert_to(source, stream)
+        self.assertEqual(stream.getvalue(), markdown.markdown(source))
+        self.assertEqual(len(stream.writes), 3)
+        self.assertEqual(md.profiler.report.stages['serializer']['serializer'].calls, 1)
+
+    def testInstrumentationRemoved(self):
+        from markdown.profiler import Profiler
+        md = markdown.Markdown()
+        serializer = md.serializer
+        md.profiler = Profiler()
+        md.convert('*foo*')
+        self.assertIs(md.serializer, serializer)
+        self.assertNotIn('run', vars(md.parser.blockprocessors['paragraph']))
+        self.assertNotIn('handleMatch', vars(md.inlinePatterns['em_strong']))
+        self.assertNotIn('getCompiledRegExp', vars(md.inlinePatterns['em_strong']))
+
+    def testError(self):
+        from markdown.profiler import Profiler
+        md = markdown.Markdown()
+        md.profiler = Profiler()
+        with self.assertRaises(AttributeError):
+            md.convert(None)
+        self.assertIsNotNone(md.profiler.report)
+        self.assertNotIn('run', vars(md.preprocessors['html_block']))
+
+    def testErrorWithRaisingCallback(self):
+        from markdown.profiler import Profiler
+
+        def callback(report):
+            raise ValueError('callback failed')
+
+        md = markdown.Markdown()
+        md.profiler = Profiler(callback=callback)
+        # The error of the conversion is raised, not the error of the callback.
+        with self.assertRaises(AttributeError):
+            md.convert(None)
+        self.assertIsNotNone(md.profiler.report)
+        with self.assertRaises(ValueError):
+            md.convert('foo')
+
+
+class TestRenderCache(unittest.TestCase):
+    """ Tests of the render caches. """
+
+    source = 'Title: Foo\n\n# Header\n\nSome *text*.'
+    kwargs = {'extensions': ['toc', 'meta']}
+
+    def testHit(self):
+        from markdown.cache import MemoryCache, CacheStats
+        cache = MemoryCache()
+        md = markdown.Markdown(cache=cache, **self.kwargs)
+        html = md.convert(self.source)
+        toc, meta = md.toc, md.Meta
+        md.reset()
+        self.assertEqual(md.convert(self.source), html)
+        self.assertEqual((md.toc, md.Meta), (toc, meta))
+        self.assertEqual(cache.stats(), CacheStats(hits=1, misses=1, evictions=0))
+        self.assertEqual(len(cache), 1)
+        # A hit does not run the pipeline.
+        self.assertEqual(md.htmlStash.html_counter, 0)
+        self.assertEqual(html, markdown.markdown(self.source, **self.kwargs))
+
+    def testKey(self):
+        from markdown.cache import MemoryCache
+        cache = MemoryCache()
+        markdown.markdown('foo  \nbar', cache=cache)
+        markdown.markdown('foo  \nbar', cache=cache, output_format='html')
+        markdown.markdown('foo  \nbar', cache=cache, extensions=['toc'])
+        markdown.markdown('foo  \nbar', cache=cache, extensions=['toc'], extension_configs={'toc': {'marker': ''}})
+        markdown.markdown('foo  \nbar ', cache=cache)
+        self.assertEqual(cache.stats().misses, 5)
+        md = markdown.Markdown(cache=cache)
+        self.assertEqual(md.convert('foo  \nbar'), '<p>foo<br />\nbar</p>')
+        self.assertEqual(md.set_output_format('html').convert('foo  \nbar'), '<p>foo<br>\nbar</p>')
+        self.assertEqual(cache.stats().hits, 2)
+
+    def testExtensionInstance(self):
+        from markdown.cache import MemoryCache
+        from markdown.extensions.toc import TocExtension
+        cache = MemoryCache()
+        markdown.markdown('[TOC]', cache=cache, extensions=[TocExtension(title='Foo')])
+        markdown.markdown('[TOC]', cache=cache, extensions=[TocExtension(title='Foo')])
+        markdown.markdown('[TOC]', cache=cache, extensions=[TocExtension(title='Bar')])
+        self.assertEqual(cache.stats()[:2], (1, 2))
+
+    def testUnkeyableSettings(self):
+        from markdown.cache import MemoryCache
+        from markdown.extensions.toc import TocExtension
+
+        def make(separator):
+            return lambda value, sep: value.lower().replace(' ', separator)
+
+        class Slugify:
+            def __call__(self, value, separator):
+                return value.lower()
+
+        cache = MemoryCache()
+        for slugify in (make('_'), make('+'), lambda value, sep: value, make('_')):
+            md = markdown.Markdown(cache=cache, extensions=[TocExtension(slugify=slugify)])
+            self.assertEqual(md.convert('# Hello World'), markdown.markdown('# Hello World', extensions=[
+                TocExtension(slugify=slugify)
+            ]))
+        md = markdown.Markdown(cache=cache, extensions=[TocExtension(slugify=Slugify())])
+        md.convert('foo')
+        self.assertIsNone(md._cache_key('foo'))
+        self.assertEqual(cache.stats()[:2], (0, 0))
+        self.assertEqual(len(cache), 0)
+
+    def testMixedKeySettings(self):
+        from markdown.cache import MemoryCache
+        cache = MemoryCache()
+        # The keys of the configs cannot be sorted. The config of an extension which is not loaded is ignored.
+        kwargs = {'extensions': ['abbr'], 'extension_configs': {'abbr': {'glossary': {'ABBR': 'Abbreviation'}}, 1: {}}}
+        expected = markdown.markdown('ABBR', **kwargs)
+        self.assertEqual(markdown.markdown('ABBR', cache=cache, **kwargs), expected)
+        self.assertEqual(len(cache), 0)
+        results = markdown.convert_many(['ABBR'], cache=cache, **kwargs)
+        self.assertEqual(results[0].html, expected)
+        self.assertEqual(len(cache), 0)
+
+    def testEviction(self):
+        from markdown.cache import MemoryCache
+        # Room for three of the documents.
+        cache = MemoryCache(maxsize=150)
+        md = markdown.Markdown(cache=cache)
+        for source in ('a' * 20, 'b' * 20, 'c' * 20, 'a' * 20, 'd' * 20):
+            md.convert(source)
+        self.assertEqual(cache.stats()[:2], (1, 4))
+        # The least recently used document was evicted.
+        md.convert('b' * 20)
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertGreater(cache.stats().evictions, 0)
+        self.assertLessEqual(cache.size, cache.maxsize)
+        md.convert('x' * 200)
+        self.assertNotIn(b'x' * 200, b''.join(cache._entries.values()))
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def testDiskCache(self):
+        from markdown.cache import DiskCache
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskCache(directory)
+            html = markdown.markdown(self.source, cache=cache, **self.kwargs)
+            md = markdown.Markdown(cache=DiskCache(directory), **self.kwargs)
+            self.assertEqual(md.convert(self.source), html)
+            self.assertEqual(md.Meta, {'title': ['Foo']})
+            self.assertEqual(md.cache.stats().hits, 1)
+            self.assertEqual(len(cache), 1)
+            # A corrupt document is converted again.
+            key = md._cache_key(self.source)
+            with open(cache._path(key), 'wb') as f:
+                f.write(b'corrupt')
+            self.assertEqual(md.convert(self.source), html)
+            self.assertEqual(md.cache.stats().misses, 1)
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+
+    def testConvertTo(self):
+        from markdown.cache import MemoryCache
+        md = markdown.Markdown(cache=MemoryCache())
+        for _ in range(2):
+            output = StringIO()
+            md.convert_to('*foo*\n\nbar', output)
+            self.assertEqual(output.getvalue(), '<p><em>foo</em></p>\n<p>bar</p>')
+        self.assertEqual(md.cache.stats()[:2], (1, 1))
+
+    def testClone(self):
+        from markdown.cache import MemoryCache
+        md = markdown.Markdown(cache=MemoryCache())
+        self.assertIs(md.clone().cache, md.cache)
+        self.assertIs(markdown.MarkdownPrototype(md).new().cache, md.cache)
+
+    def testConvertManyWorkers(self):
+        from markdown.cache import MemoryCache
+        cache = MemoryCache()
+        markdown.markdown('foo', cache=cache)
+        results = markdown.convert_many(['foo', 'bar', None], workers=2, cache=cache)
+        self.assertEqual([r.html for r in results], ['<p>foo</p>', '<p>bar</p>', None])
+        self.assertIsInstance(results[2].error, AttributeError)
+        self.assertEqual(cache.stats()[:2], (1, 2))
+        self.assertEqual(len(cache), 2)
+
+
 class TestBlockParser(unittest.TestCase):
     """ Tests of the BlockParser class. """
 
@@ -143,6 +686,120 @@ class TestBlockParser(unittest.TestCase):
             "<div><h1>foo</h1><p>bar</p><pre><code>baz\n</code></pre></div>"
         )
 
+    class CountingProcessor(markdown.blockprocessors.BlockProcessor):
+        """ Record the blocks it is tested against and never pass. """
+
+        def __init__(self, parser, trigger=None):
+            super().__init__(parser)
+            self.tested = []
+            if trigger is not None:
+                self.TRIGGER_RE = re.compile(trigger)
+
+        def test(self, parent, block):
+            self.tested.append(block)
+            return False
+
+    def testTriggerSkipsProcessor(self):
+        """ Test that a processor is only tested against blocks its `TRIGGER_RE` matches. """
+        processor = self.CountingProcessor(self.parser, r'[%]')
+        self.parser.blockprocessors.register(processor, 'counting', 200)
+        root = etree.Element("div")
+        self.parser.parseChunk(root, 'foo\n\n%bar\n\n# baz')
+        self.assertEqual(processor.tested, ['%bar'])
+
+    def testProcessorWithoutTrigger(self):
+        """ Test that a processor without a `TRIGGER_RE` is tested against every block. """
+        processor = self.CountingProcessor(self.parser)
+        self.parser.blockprocessors.register(processor, 'counting', 200)
+        root = etree.Element("div")
+        self.parser.parseChunk(root, 'foo\n\n%bar\n\n# baz')
+        self.assertEqual(processor.tested, ['foo', '%bar', '# baz'])
+
+    def testTriggerOrder(self):
+        """ Test that the processors are tested in priority order. """
+        first = self.CountingProcessor(self.parser, r'[%]')
+        second = self.CountingProcessor(self.parser)
+        self.parser.blockprocessors.register(second, 'second', 200)
+        self.parser.blockprocessors.register(first, 'first', 300)
+        order = []
+        first.test = lambda parent, block: order.append('first')
+        second.test = lambda parent, block: order.append('second')
+        self.parser.parseChunk(etree.Element("div"), '%foo\n\nbar')
+        self.assertEqual(order, ['first', 'second', 'second'])
+
+    def testTriggerIgnoredForOverridingSubclass(self):
+        """ Test that an inherited `TRIGGER_RE` is ignored when a subclass overrides `test` or `__init__`. """
+
+        class ConsumingCodeProcessor(markdown.blockprocessors.CodeBlockProcessor):
+            def run(self, parent, blocks):
+                etree.SubElement(parent, 'pre').text = blocks.pop(0)
+
+        class PercentTestProcessor(ConsumingCodeProcessor):
+            def test(self, parent, block):
+                return block.startswith('%')
+
+        class PercentInitProcessor(ConsumingCodeProcessor):
+            def __init__(self, parser):
+                super().__init__(parser)
+                self.test = lambda parent, block: block.startswith('%')
+
+        for cls in (PercentTestProcessor, PercentInitProcessor):
+            with self.subTest(cls=cls.__name__):
+                self.parser.blockprocessors.register(cls(self.parser), 'code', 200)
+                root = etree.Element("div")
+                self.parser.parseChunk(root, '%foo')
+                self.assertEqual(markdown.serializers.to_xhtml_string(root), "<div><pre>%foo</pre></div>")
+
+    def testTriggerDeregister(self):
+        """ Test that changes to the registered processors are picked up. """
+        root = etree.Element("div")
+        self.parser.parseChunk(root, '* foo')
+        self.parser.blockprocessors.deregister('ulist')
+        self.parser.parseChunk(root, '* bar')
+        self.assertEqual(
+            markdown.serializers.to_xhtml_string(root),
+            "<div><ul><li>foo</li></ul><p>* bar</p></div>"
+        )
+
+
+class TestBlockQueue(unittest.TestCase):
+    """ Tests of the BlockQueue class. """
+
+    def setUp(self):
+        self.blocks = markdown.blockparser.BlockQueue(['a', 'b', 'c'])
+
+    def testPopAndInsert(self):
+        """ Test `pop` and `insert` at the front, the end and in the middle. """
+        self.assertEqual(self.blocks.pop(0), 'a')
+        self.blocks.insert(0, 'x')
+        self.assertEqual(self.blocks.pop(), 'c')
+        self.blocks.insert(1, 'y')
+        self.assertEqual(self.blocks.pop(1), 'y')
+        self.assertEqual(self.blocks, ['x', 'b'])
+
+    def testListCompatibility(self):
+        """ Test the parts of the list API used by block processors. """
+        self.assertEqual(self.blocks[0], 'a')
+        self.assertEqual(self.blocks[1:], ['b', 'c'])
+        self.assertEqual(self.blocks + ['d'], ['a', 'b', 'c', 'd'])
+        self.assertEqual(['z'] + self.blocks, ['z', 'a', 'b', 'c'])
+        self.blocks[1:] = ['d']
+        self.assertEqual(self.blocks, ['a', 'd'])
+        del self.blocks[:1]
+        self.assertEqual(self.blocks, ['d'])
+        self.assertNotEqual(self.blocks, ['a'])
+
+    def testParseBlocksList(self):
+        """ Test that a list passed to `parseBlocks` is parsed and emptied. """
+        blocks = ['foo', '* bar']
+        root = etree.Element('div')
+        markdown.Markdown().parser.parseBlocks(root, blocks)
+        self.assertEqual(blocks, [])
+        self.assertEqual(
+            markdown.serializers.to_xhtml_string(root),
+            '<div><p>foo</p><ul><li>bar</li></ul></div>'
+        )
+
 
 class TestBlockParserState(unittest.TestCase):
     """ Tests of the State class for `BlockParser`. """
@@ -182,6 +839,35 @@ class TestBlockParserState(unittest.TestCase):
         self.assertEqual(self.state, ['state1'])
 
 
+class TestHtmlBlockPreprocessor(unittest.TestCase):
+    """ Test that the HTML block preprocessor only parses the text which may contain raw HTML. """
+
+    def setUp(self):
+        self.md = markdown.Markdown()
+        self.preprocessor = self.md.preprocessors['html_block']
+
+    def testNoHtml(self):
+        lines = ['# Header', '', 'Some *text* & more.']
+        self.assertIs(self.preprocessor.run(lines), lines)
+        self.assertEqual(self.md.htmlStash.html_counter, 0)
+
+    def testTextBeforeHtml(self):
+        lines = ['foo', '', 'bar', '', '<div>', 'baz', '</div>', '', 'qux']
+        self.assertEqual(
+            self.preprocessor.run(lines),
+            ['foo', '', 'bar', '', '', self.md.htmlStash.get_placeholder(0), '', '', '', 'qux']
+        )
+
+    def testBlankFirstLine(self):
+        self.assertEqual(
+            self.preprocessor.run(['', '<hr>', 'foo']),
+            ['', '', self.md.htmlStash.get_placeholder(0), '', '', 'foo']
+        )
+
+    def testCharref(self):
+        self.assertEqual(self.preprocessor.run(['foo', '', '&#123 bar']), ['foo', '', '&#123; bar'])
+
+
 class TestHtmlStash(unittest.TestCase):
     """ Test Markdown's `HtmlStash`. """
 
@@ -212,6 +898,69 @@ class TestHtmlStash(unittest.TestCase):
         self.assertEqual(self.stash.rawHtmlBlocks, [])
 
 
+class CountingRawHtmlPostprocessor(markdown.postprocessors.RawHtmlPostprocessor):
+    """ A `RawHtmlPostprocessor` which counts the stash items it converts to a string. """
+
+    def __init__(self, md):
+        super().__init__(md)
+        self.count = 0
+
+    def stash_to_string(self, text):
+        self.count += 1
+        return super().stash_to_string(text)
+
+
+class TestRawHtmlPostprocessor(unittest.TestCase):
+    """ Test restoring the raw HTML of the stash. """
+
+    def setUp(self):
+        self.md = markdown.Markdown()
+        self.stash = self.md.htmlStash
+        self.pp = CountingRawHtmlPostprocessor(self.md)
+
+    def testRestore(self):
+        """ Test that wrapped and bare placeholders are restored. """
+        block = self.stash.store('<div>block</div>')
+        inline = self.stash.store('<b>')
+        self.assertEqual(
+            self.pp.run(f'<p>{block}</p>\n<p>{inline}x{inline}</p>\n<p>{inline}</p>'),
+            '<div>block</div>\n<p><b>x<b></p>\n<p><b></p>'
+        )
+
+    def testNestedPlaceholders(self):
+        """ Test that placeholders in a stash item are restored. """
+        inner = self.stash.store('<i>inner</i>')
+        outer = self.stash.store(f'<div>{inner}</div>')
+        self.assertEqual(self.pp.run(f'<p>{outer}</p>'), '<div><i>inner</i></div>')
+
+    def testUnknownPlaceholder(self):
+        """ Test that a placeholder without a stash item is left as is. """
+        self.stash.store('<b>')
+        unknown = self.stash.get_placeholder(5)
+        self.assertEqual(self.pp.run(f'<p>{unknown}</p>{unknown}'), f'<p>{unknown}</p>{unknown}')
+
+    def testNoPlaceholders(self):
+        """ Test that text without placeholders is returned unchanged. """
+        self.stash.store('<b>')
+        text = '<p>foo</p>'
+        self.assertIs(self.pp.run(text), text)
+        self.assertEqual(self.pp.count, 0)
+
+    def testRestoredOnce(self):
+        """ Test that a stash item is only converted once across chunks of a document. """
+        inner = self.stash.store('<i>inner</i>')
+        outer = self.stash.store(f'<div>{inner}{inner}</div>')
+        self.assertEqual(self.pp.run(f'<p>{outer}</p>'), '<div><i>inner</i><i>inner</i></div>')
+        self.assertEqual(self.pp.run(f'<li>{inner}</li>'), '<li><i>inner</i></li>')
+        self.assertEqual(self.pp.count, 2)
+
+    def testReset(self):
+        """ Test that the restored HTML of a document is not reused for the next one. """
+        self.assertEqual(self.pp.run(f'<p>{self.stash.store("<b>")}</p>'), '<p><b></p>')
+        self.md.reset()
+        self.assertEqual(self.pp.run(f'<p>{self.stash.store("<i>")}</p>'), '<p><i></p>')
+
+
 class Item:
     """ A dummy `Registry` item object for testing. """
     def __init__(self, data):
@@ -347,6 +1096,29 @@ class RegistryTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             r.get_index_for_name('c')
 
+    def testSnapshot(self):
+        r = markdown.util.Registry()
+        r.register(Item('a'), 'a', 20)
+        r.register(Item('b'), 'b', 30)
+        snapshot = r.snapshot()
+        self.assertEqual(snapshot, ('b', 'a'))
+        self.assertIs(r.snapshot(), snapshot)
+        r.register(Item('c'), 'c', 25)
+        self.assertEqual(r.snapshot(), ('b', 'c', 'a'))
+        self.assertEqual(snapshot, ('b', 'a'))
+        r.deregister('b')
+        self.assertEqual(r.snapshot(), ('c', 'a'))
+
+    def testGetIndexForNameAfterDeregister(self):
+        r = markdown.util.Registry()
+        r.register(Item('a'), 'a', 20)
+        r.register(Item('b'), 'b', 30)
+        self.assertEqual(r.get_index_for_name('a'), 1)
+        r.deregister('b')
+        self.assertEqual(r.get_index_for_name('a'), 0)
+        with self.assertRaises(ValueError):
+            r.get_index_for_name('b')
+
     def testRegisterDupplicate(self):
         r = markdown.util.Registry()
         r.register(Item('a'), 'a', 20)
@@ -445,6 +1217,74 @@ class testETreeComments(unittest.TestCase):
         )
 
 
+class RawHtmlCollector(markdown.treeprocessors.Treeprocessor):
+    """ A treeprocessor which collects the raw HTML nodes of the tree. """
+
+    def run(self, root):
+        self.nodes = [el for el in root.iter() if el.tag is markdown.util.RawHtml]
+
+
+class TestRawHtml(unittest.TestCase):
+    """ Test raw HTML nodes. """
+
+    def setUp(self):
+        self.raw = markdown.util.RawHtml('<div class="x">*not* &amp; <escaped></div>')
+
+    def testRawHtmlIsRawHtml(self):
+        """ Test that a raw HTML node passes the `is RawHtml` test. """
+        self.assertIs(self.raw.tag, markdown.util.RawHtml)
+        self.assertIsInstance(self.raw.text, markdown.util.AtomicString)
+
+    def testRawHtmlSerialization(self):
+        """ Test that the HTML of a raw HTML node is written verbatim and its tail is escaped. """
+        self.raw.tail = '<tail>'
+        expected = '<div class="x">*not* &amp; <escaped></div>&lt;tail&gt;'
+        self.assertEqual(markdown.serializers.to_html_string(self.raw), expected)
+        self.assertEqual(markdown.serializers.to_xhtml_string(self.raw), expected)
+
+    def testRawHtmlPrettify(self):
+        """ Test that a raw HTML node is prettified as a block-level element. """
+        root = etree.Element('div')
+        root.append(self.raw)
+        pretty = markdown.treeprocessors.PrettifyTreeprocessor(markdown.Markdown())
+        pretty.run(root)
+        self.assertEqual(
+            markdown.serializers.to_html_string(root),
+            '<div>\n<div class="x">*not* &amp; <escaped></div>\n</div>\n'
+        )
+
+    def testRawHtmlBlock(self):
+        """ Test that a block of raw HTML is parsed into a raw HTML node. """
+        md = markdown.Markdown()
+        collector = RawHtmlCollector(md)
+        md.treeprocessors.register(collector, 'collector', 0)
+        self.assertEqual(
+            md.convert('<div>\n*raw*\n</div>\n\nA paragraph.'),
+            '<div>\n*raw*\n</div>\n\n<p>A paragraph.</p>'
+        )
+        self.assertEqual([node.text for node in collector.nodes], ['<div>\n*raw*\n</div>\n'])
+
+    def testInlineHtmlIsNotRawHtmlNode(self):
+        """ Test that a paragraph which only holds inline raw HTML remains a paragraph. """
+        md = markdown.Markdown()
+        collector = RawHtmlCollector(md)
+        md.treeprocessors.register(collector, 'collector', 0)
+        self.assertEqual(md.convert('<span>inline</span>'), '<p><span>inline</span></p>')
+        self.assertEqual(collector.nodes, [])
+
+    def testHighlightedCode(self):
+        """ Test that `codehilite` replaces a code block with a raw HTML node. """
+        md = markdown.Markdown(extensions=['codehilite'], extension_configs={'codehilite': {'use_pygments': False}})
+        collector = RawHtmlCollector(md)
+        md.treeprocessors.register(collector, 'collector', 0)
+        self.assertEqual(
+            md.convert('    :::python\n    x < 1'),
+            '<pre class="codehilite"><code class="language-python">x &lt; 1\n</code></pre>'
+        )
+        self.assertEqual(len(collector.nodes), 1)
+        self.assertEqual(md.htmlStash.html_counter, 0)
+
+
 class testElementTailTests(unittest.TestCase):
     """ Element Tail Tests """
     def setUp(self):
@@ -628,6 +1468,89 @@ class testSerializers(unittest.TestCase):
             '<div xmlns="&lt;&amp;&quot;test&#10;escaping&quot;&gt;"></div>'
         )
 
+    def testEscaping(self):
+        """ Test escaping of text and attribute values which contain entities. """
+        el = etree.Element('p')
+        el.set('title', '<a & b> "c" &amp; &#10;')
+        el.text = '<a & b> "c" &amp; &#x27; &copy; & co;'
+        el.tail = '>tail<'
+        self.assertEqual(
+            markdown.serializers.to_html_string(el),
+            '<p title="&lt;a &amp; b&gt; &quot;c&quot; &amp; &#10;">'
+            '&lt;a &amp; b&gt; "c" &amp; &#x27; &copy; &amp; co;</p>&gt;tail&lt;'
+        )
+
+    def testMixedCaseEmptyTags(self):
+        """ Test that empty and raw text tags are recognized regardless of case. """
+        el = etree.Element('div')
+        etree.SubElement(el, 'HR')
+        etree.SubElement(el, 'Br')
+        script = etree.SubElement(el, 'SCRIPT')
+        script.text = 'a < b'
+        self.assertEqual(markdown.serializers.to_xhtml_string(el), '<div><HR /><Br /><SCRIPT>a < b</SCRIPT></div>')
+        self.assertEqual(markdown.serializers.to_html_string(el), '<div><HR><Br><SCRIPT>a < b</SCRIPT></div>')
+
+    def testUnsortedAttributes(self):
+        """ Test that attributes are written in the order they were set when not sorted. """
+        el = etree.Element('div')
+        el.set('id', 'foo')
+        el.set('class', 'bar')
+        el.set('hidden', 'hidden')
+        self.assertEqual(markdown.serializers.to_html_string(el), '<div class="bar" hidden id="foo"></div>')
+        self.assertEqual(
+            markdown.serializers.to_html_string(el, sort_attributes=False), '<div id="foo" class="bar" hidden></div>'
+        )
+        self.assertEqual(
+            markdown.serializers.to_xhtml_string(el, sort_attributes=False),
+            '<div id="foo" class="bar" hidden="hidden"></div>'
+        )
+
+    def buildDeepTree(self, depth):
+        """ Build a tree of `depth` nested elements which each have text, a tail and an empty sibling. """
+        root = etree.Element('div')
+        el = root
+        for i in range(depth):
+            el = etree.SubElement(el, 'blockquote')
+            el.text = 'text'
+            el.tail = 'tail'
+            etree.SubElement(el, 'br')
+        return root
+
+    def testDeeplyNestedHtml(self):
+        """ Test serializing a tree which is nested far deeper than the recursion limit to HTML. """
+        depth = 10000
+        self.assertEqual(
+            markdown.serializers.to_html_string(self.buildDeepTree(depth)),
+            '<div>' + '<blockquote>text<br>' * depth + '</blockquote>tail' * depth + '</div>'
+        )
+
+    def testDeeplyNestedXhtml(self):
+        """ Test serializing a tree which is nested far deeper than the recursion limit to XHTML. """
+        depth = 10000
+        self.assertEqual(
+            markdown.serializers.to_xhtml_string(self.buildDeepTree(depth)),
+            '<div>' + '<blockquote>text<br />' * depth + '</blockquote>tail' * depth + '</div>'
+        )
+
+    def testDeeplyNestedConvert(self):
+        """ Test converting a document whose tree is nested far deeper than the recursion limit. """
+        depth = 10000
+
+        class DeepTreeprocessor(markdown.treeprocessors.Treeprocessor):
+            def run(self, root):
+                el = root
+                for i in range(depth):
+                    el = etree.SubElement(el, 'div')
+
+        md = markdown.Markdown()
+        # Register after `prettify`, which walks the tree recursively.
+        md.treeprocessors.register(DeepTreeprocessor(md), 'deep', -1)
+        expected = '<p>foo</p>\n' + '<div>' * depth + '</div>' * depth
+        self.assertEqual(md.convert('foo'), expected)
+        stream = StringIO()
+        md.reset().convert_to('foo', stream)
+        self.assertEqual(stream.getvalue(), expected)
+
     def buildExtension(self):
         """ Build an extension which registers `fakeSerializer`. """
         def fakeSerializer(elem):
@@ -976,3 +1899,104 @@ Some +test+ and a [+link+](http://test.com)
 
         self.md.reset()
         self.assertEqual(self.md.convert(test), result)
+
+    def test_ancestors_tree(self):
+        """ Test that an extension can exclude tags higher up in the tree. """
+        tree = etree.Element('div')
+        link = etree.SubElement(tree, 'a')
+        span = etree.SubElement(link, 'span')
+        span.text = '+a+'
+        em = etree.SubElement(tree, 'em')
+        em.text = '+b+'
+
+        self.md.reset()
+        self.md.treeprocessors['inline'].run(tree)
+        self.assertEqual(
+            markdown.serializers.to_xhtml_string(tree),
+            '<div><a><span>+a+</span></a><em><strong>b</strong></em></div>'
+        )
+
+    def test_ancestors_argument(self):
+        """ Test that an extension can exclude tags passed as the ancestors of the tree. """
+        tree = etree.Element('p')
+        tree.text = '+a+'
+
+        self.md.reset()
+        self.md.treeprocessors['inline'].run(tree, ancestors=['a'])
+        self.assertEqual(markdown.serializers.to_xhtml_string(tree), '<p>+a+</p>')
+
+
+class TestInlineScaling(unittest.TestCase):
+    """ Tests that the inline processor takes linear time on wide elements. """
+
+    def run_list(self, size):
+        """ Run the inline processor on a list of `size` items with tails and return the list and the time. """
+        tree = etree.Element('div')
+        ul = etree.SubElement(tree, 'ul')
+        for i in range(size):
+            li = etree.SubElement(ul, 'li')
+            li.text = f'*item {i}*' if i % 1000 == 0 else f'item {i}'
+            li.tail = '\n'
+        md = markdown.Markdown()
+        start = time.perf_counter()
+        md.treeprocessors['inline'].run(tree)
+        return ul, time.perf_counter() - start
+
+    def test_large_list(self):
+        """ Test that a list of 50,000 items takes roughly four times as long as one of 12,500 items. """
+        small = min(self.run_list(12500)[1] for _ in range(3))
+        ul, large = self.run_list(50000)
+        self.assertEqual(len(ul), 50000)
+        self.assertEqual(markdown.serializers.to_html_string(ul[49000]), '<li><em>item 49000</em></li>\n')
+        self.assertEqual(markdown.serializers.to_html_string(ul[49999]), '<li>item 49999</li>\n')
+        # Linear time gives a ratio of about 4, quadratic time one of about 16.
+        self.assertLess(large / small, 8)
+
+
+class TestInlineTriggers(unittest.TestCase):
+    """ Tests skipping inline patterns by their trigger characters. """
+
+    class CountingProcessor(markdown.inlinepatterns.SimpleTagInlineProcessor):
+        """ Count the searches of the pattern. """
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.searches = 0
+
+        def getCompiledRegExp(self):
+            self.searches += 1
+            return super().getCompiledRegExp()
+
+    def build(self, triggers):
+        md = markdown.Markdown()
+        pattern = self.CountingProcessor(r'(?<!\w)(\+)([^\+]+)\1', 'ins')
+        pattern.triggers = triggers
+        md.inlinePatterns.register(pattern, 'ins', 0)
+        return md, pattern
+
+    def testCoreTriggers(self):
+        """ Test that the core patterns declare their triggers. """
+        patterns = markdown.Markdown().inlinePatterns
+        self.assertEqual(patterns['backtick'].triggers, '`\\')
+        self.assertEqual(patterns['link'].triggers, '[')
+        self.assertEqual(patterns['em_strong'].triggers, '*')
+
+    def testSkipped(self):
+        """ Test that a pattern is not searched for in text without its triggers. """
+        md, pattern = self.build('+')
+        self.assertEqual(md.convert('Some *plain* text'), '<p>Some <em>plain</em> text</p>')
+        self.assertEqual(pattern.searches, 0)
+        self.assertEqual(md.convert('Some +new+ text'), '<p>Some <ins>new</ins> text</p>')
+        self.assertEqual(pattern.searches, 1)
+
+    def testLookbehindAtTrigger(self):
+        """ Test that a lookbehind is still applied when matching starts at a trigger. """
+        md, pattern = self.build('+')
+        self.assertEqual(md.convert('a+b+ and +c+'), '<p>a+b+ and <ins>c</ins></p>')
+
+    def testNoTriggers(self):
+        """ Test that a pattern without triggers is always searched for. """
+        md, pattern = self.build(None)
+        self.assertEqual(md.convert('Some *plain* text'), '<p>Some <em>plain</em> text</p>')
+        self.assertEqual(pattern.searches, 2)
+        self.assertEqual(md.convert('Some +new+ text'), '<p>Some <ins>new</ins> text</p>')
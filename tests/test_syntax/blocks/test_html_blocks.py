@@ -1667,6 +1667,15 @@ class TestHTMLBlocks(TestCase):
         result = md.postprocessors['raw_html'].run(placeholder)
         self.assertEqual(placeholder, result)
 
+    def test_block_level_decided_by_postprocessor(self):
+        class InlineRawHtmlPostprocessor(markdown.postprocessors.RawHtmlPostprocessor):
+            def isblocklevel(self, html):
+                return False
+
+        md = markdown.Markdown()
+        md.postprocessors.register(InlineRawHtmlPostprocessor(md), 'raw_html', 30)
+        self.assertEqual(md.convert('<div>foo</div>'), '<p><div>foo</div>\n</p>')
+
     def test_noname_tag(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -1787,3 +1796,28 @@ class TestHTMLBlocks(TestCase):
                 '''
             )
         )
+
+    def test_raw_block_after_incomplete_charref(self):
+        """Ensure raw HTML is extracted correctly after the parser stops at an incomplete character reference."""
+
+        self.assertMarkdownRenders(
+            self.dedent(
+                '''
+                Foo
+                <b>&#</b>
+
+                <p>bar</p>
+
+                baz &amp; qux
+                '''
+            ),
+            self.dedent(
+                '''
+                <p>Foo
+                <b>&amp;#</b></p>
+                <p>bar</p>
+
+                <p>baz &amp; qux</p>
+                '''
+            )
+        )
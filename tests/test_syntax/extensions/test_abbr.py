@@ -542,3 +542,69 @@ class TestAbbr(TestCase):
         self.assertEqual(ext.abbrs, {})
         md.convert('*[foo]: Foo Definition')
         self.assertEqual(ext.abbrs, {'foo': 'Foo Definition'})
+
+    def test_abbr_shared_prefix(self):
+        self.assertMarkdownRenders(
+            self.dedent(
+                """
+                A, AB, ABC, ABD and ABCD, but not ABE.
+
+                *[A]: One
+                *[AB]: Two
+                *[ABC]: Three
+                *[ABD]: Three too
+                *[ABCD]: Four
+                """
+            ),
+            self.dedent(
+                """
+                <p><abbr title="One">A</abbr>, <abbr title="Two">AB</abbr>, <abbr title="Three">ABC</abbr>, """
+                + """<abbr title="Three too">ABD</abbr> and <abbr title="Four">ABCD</abbr>, but not ABE.</p>
+                """
+            )
+        )
+
+    def test_abbr_longest_at_word_boundary(self):
+        self.assertMarkdownRenders(
+            self.dedent(
+                """
+                U.S.A. and U.S.Army
+
+                *[U.S.]: United States
+                *[U.S.A]: United States of America
+                *[U.S.A.]: The United States of America
+                """
+            ),
+            self.dedent(
+                """
+                <p><abbr title="United States of America">U.S.A</abbr>. and """
+                + """<abbr title="United States">U.S.</abbr>Army</p>
+                """
+            )
+        )
+
+    def test_abbr_regex_reused(self):
+        ext = AbbrExtension(glossary={'ABBR': 'Abbreviation'})
+        md = Markdown(extensions=[ext])
+        processor = md.treeprocessors['abbr']
+        md.convert('ABBR')
+        regex = processor.RE
+        md.reset().convert('ABBR')
+        self.assertIs(processor.RE, regex)
+        self.assertEqual(
+            md.reset().convert('ABBR and HTML\n\n*[HTML]: Hyper Text Markup Language'),
+            '<p><abbr title="Abbreviation">ABBR</abbr> and <abbr title="Hyper Text Markup Language">HTML</abbr></p>'
+        )
+        self.assertIsNot(processor.RE, regex)
+        self.assertEqual(md.reset().convert('ABBR and HTML'), '<p><abbr title="Abbreviation">ABBR</abbr> and HTML</p>')
+        self.assertIs(processor.RE, regex)
+
+    def test_abbr_large_glossary(self):
+        glossary = {f'T{i}': f'Term {i}' for i in range(5000)}
+        self.assertMarkdownRenders(
+            'T1, T12, T123, T1234, *T4999* and T5000',
+            '<p><abbr title="Term 1">T1</abbr>, <abbr title="Term 12">T12</abbr>, '
+            '<abbr title="Term 123">T123</abbr>, <abbr title="Term 1234">T1234</abbr>, '
+            '<em><abbr title="Term 4999">T4999</abbr></em> and T5000</p>',
+            extensions=[AbbrExtension(glossary=glossary)]
+        )
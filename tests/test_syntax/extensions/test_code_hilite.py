@@ -20,9 +20,10 @@ License: BSD (see LICENSE.md for details).
 """
 
 from markdown.test_tools import TestCase
-from markdown.extensions.codehilite import CodeHiliteExtension, CodeHilite
-from markdown import extensions, treeprocessors
+from markdown.extensions.codehilite import CodeHiliteExtension, CodeHilite, cache_info, clear_cache
+from markdown import Markdown, extensions, treeprocessors
 import os
+import unittest
 import xml.etree.ElementTree as etree
 
 try:
@@ -774,6 +775,166 @@ class TestCodeHiliteExtension(TestCase):
         )
 
 
+class TestCodeHiliteCache(TestCase):
+    """ Test the caches of Pygments lexers and formatters and of highlighted code blocks. """
+
+    def setUp(self):
+        clear_cache()
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_lexer_and_formatter_cache(self):
+        first = CodeHilite('x = 1', lang='python').hilite()
+        second = CodeHilite('y = 2', lang='python').hilite()
+        info = cache_info()
+        self.assertEqual((info['lexers'].hits, info['lexers'].misses), (1, 1))
+        self.assertEqual((info['formatters'].hits, info['formatters'].misses), (1, 1))
+        self.assertNotEqual(first, second)
+        CodeHilite('x = 1', lang='python', hl_lines=[1]).hilite()
+        self.assertEqual(cache_info()['formatters'].misses, 2)
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_formatter_class_not_cached(self):
+        from pygments.formatters import HtmlFormatter
+
+        class CountingFormatter(HtmlFormatter):
+            instances = 0
+
+            def __init__(self, lang_str='', **options):
+                super().__init__(**options)
+                CountingFormatter.instances += 1
+                self.count = 0
+
+            def wrap(self, source):
+                self.count += 1
+                yield 0, f'<div data-count="{self.count}">'
+                yield from source
+                yield 0, '</div>'
+
+        for _ in range(2):
+            html = CodeHilite('x = 1', lang='python', pygments_formatter=CountingFormatter).hilite()
+            self.assertIn('data-count="1"', html)
+        self.assertEqual(CountingFormatter.instances, 2)
+        self.assertEqual(cache_info()['formatters'].currsize, 0)
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_pygments_names(self):
+        from markdown.extensions import codehilite
+        from pygments import highlight
+        from pygments.util import ClassNotFound
+        self.assertIs(codehilite.highlight, highlight)
+        self.assertIs(codehilite.ClassNotFound, ClassNotFound)
+        for name in ('get_lexer_by_name', 'guess_lexer', 'get_formatter_by_name'):
+            self.assertTrue(callable(getattr(codehilite, name)))
+        with self.assertRaises(AttributeError):
+            codehilite.unknown_name
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_unknown_lang(self):
+        CodeHilite('x = 1', lang='unknown', guess_lang=False).hilite()
+        CodeHilite('x = 1', lang='unknown', guess_lang=False).hilite()
+        self.assertEqual(cache_info()['lexers'].hits, 2)
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_guess_cache(self):
+        source = 'import os\nprint(os.getcwd())'
+        first = CodeHilite(source).hilite()
+        self.assertEqual(CodeHilite(source).hilite(), first)
+        info = cache_info()['guesses']
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_unhashable_option(self):
+        expected = CodeHilite('x = 1', lang='python').hilite()
+        clear_cache()
+        self.assertEqual(CodeHilite('x = 1', lang='python', unknown={}).hilite(), expected)
+        self.assertEqual(cache_info()['lexers'].currsize, 0)
+
+    def test_no_memo(self):
+        ext = CodeHiliteExtension()
+        Markdown(extensions=[ext])
+        self.assertIsNone(ext.cache_info())
+
+    def test_memo(self):
+        source = '\tx = 1\n\ntext\n\n\tx = 1\n\ntext\n\n\ty = 2\n'
+        expected = Markdown(extensions=['codehilite']).convert(source)
+        ext = CodeHiliteExtension(cache_size=8)
+        md = Markdown(extensions=[ext])
+        self.assertEqual(md.convert(source), expected)
+        info = ext.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+        md.reset().convert(source)
+        self.assertEqual(ext.cache_info().hits, 4)
+
+    def test_memo_fenced_code(self):
+        source = '```python\nx = 1\n```\n\n```python\nx = 1\n```\n\n```{.python hl_lines="1"}\nx = 1\n```\n'
+        expected = Markdown(extensions=['codehilite', 'fenced_code']).convert(source)
+        ext = CodeHiliteExtension(cache_size=8)
+        self.assertEqual(Markdown(extensions=[ext, 'fenced_code']).convert(source), expected)
+        info = ext.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_memo_clone(self):
+        ext = CodeHiliteExtension(cache_size=8)
+        md = Markdown(extensions=[ext])
+        md.convert('\tx = 1')
+        clone = md.clone()
+        clone.convert('\tx = 1')
+        self.assertEqual(ext.cache_info().hits, 1)
+
+    def test_memo_copies_in_batch(self):
+        ext = CodeHiliteExtension(cache_size=8)
+        Markdown(extensions=[ext])
+        jobs = [('x = 1', True, {'lang': 'python'}), ('x = 1', True, {'lang': 'python'}), ('x = 1', False, {})]
+        first, second, third = ext.hilite_many(jobs)
+        self.assertEqual(first, second)
+        info = ext.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+
+def _failing_formatter(**options):
+    raise ValueError('No formatter')
+
+
+class TestCodeHiliteWorkers(TestCase):
+    """ Test highlighting code blocks in worker processes. """
+
+    source = '\n\n'.join(
+        f'```{lang}\nx = {i}\n```\n\ntext\n\n\ty = {i}\n\ntext' for i, lang in enumerate(['python', 'js'] * 4)
+    )
+
+    def test_workers(self):
+        expected = Markdown(extensions=['codehilite', 'fenced_code']).convert(self.source)
+        md = Markdown(extensions=[CodeHiliteExtension(workers=2), 'fenced_code'])
+        self.assertEqual(md.convert(self.source), expected)
+        self.assertEqual(md.reset().convert(self.source), expected)
+
+    def test_workers_and_memo(self):
+        expected = Markdown(extensions=['codehilite', 'fenced_code']).convert(self.source)
+        ext = CodeHiliteExtension(workers=2, cache_size=64)
+        md = Markdown(extensions=[ext, 'fenced_code'])
+        self.assertEqual(md.convert(self.source), expected)
+        self.assertEqual(md.reset().convert(self.source), expected)
+        info = ext.cache_info()
+        self.assertEqual((info.hits, info.misses), (16, 16))
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_workers_unpicklable_formatter(self):
+        from pygments.formatters import HtmlFormatter
+
+        class Formatter(HtmlFormatter):
+            pass
+
+        expected = Markdown(extensions=[CodeHiliteExtension(pygments_formatter=Formatter)]).convert(self.source)
+        md = Markdown(extensions=[CodeHiliteExtension(workers=2, pygments_formatter=Formatter)])
+        self.assertEqual(md.convert(self.source), expected)
+
+    @unittest.skipUnless(has_pygments, 'Pygments is required')
+    def test_workers_error(self):
+        md = Markdown(extensions=[CodeHiliteExtension(workers=2, pygments_formatter=_failing_formatter)])
+        with self.assertRaisesRegex(ValueError, 'No formatter'):
+            md.convert(self.source)
+
+
 class _ExtensionThatAddsAnEmptyCodeTag(extensions.Extension):
     def extendMarkdown(self, md):
         md.treeprocessors.register(_AddCodeTagTreeprocessor(), 'add-code-tag', 40)
@@ -321,3 +321,25 @@ class TestDefList(TestCase):
             ),
             extensions=['def_list', 'admonition']
         )
+
+    def test_def_list_after_raw_html(self):
+
+        self.assertMarkdownRenders(
+            self.dedent(
+                '''
+                <div>raw</div>
+
+                : definition
+                '''
+            ),
+            self.dedent(
+                '''
+                <div>raw</div>
+
+                <dl>
+                <dd>definition</dd>
+                </dl>
+                '''
+            ),
+            extensions=['def_list']
+        )
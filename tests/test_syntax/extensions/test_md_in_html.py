@@ -1556,6 +1556,32 @@ class TestMdInHTML(TestCase):
             )
         )
 
+    def test_md1_after_incomplete_charref(self):
+        self.assertMarkdownRenders(
+            self.dedent(
+                """
+                Foo
+                <b>&#</b>
+
+                <div markdown="1">
+                *bar*
+                </div>
+                baz &amp; qux
+                """
+            ),
+            self.dedent(
+                """
+                <p>Foo
+                <b>&amp;#</b></p>
+                <div>
+                <p><em>bar</em></p>
+                </div>
+                <p>baz &amp; qux</p>
+                """
+            ),
+            extensions=['md_in_html']
+        )
+
 
 def load_tests(loader, tests, pattern):
     """ Ensure `TestHTMLBlocks` doesn't get run twice by excluding it here. """
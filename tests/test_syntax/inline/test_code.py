@@ -79,3 +79,15 @@ class TestCode(TestCase):
                 """
             )
         )
+
+    def test_adjacent_code_spans(self):
+        self.assertMarkdownRenders(
+            """`a``b` `c`""",
+            """<p><code>a``b</code> <code>c</code></p>"""
+        )
+
+    def test_escaped_backslashes_between_code_spans(self):
+        self.assertMarkdownRenders(
+            """`a`\\\\`b`""",
+            """<p><code>a</code>\\<code>b</code></p>"""
+        )
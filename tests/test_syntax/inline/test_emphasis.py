@@ -191,3 +191,46 @@ class TestNotEmphasis(TestCase):
             '**[**text**](url)**',
             '<p><strong><a href="url"><strong>text</strong></a></strong></p>'
         )
+
+    def test_emphasis_wrapping_many_elements(self):
+        self.assertMarkdownRenders(
+            '**' + ' '.join(f'`{i}` [{i}](/{i})' for i in range(100)) + '**',
+            '<p><strong>' + ' '.join(f'<code>{i}</code> <a href="/{i}">{i}</a>' for i in range(100)) + '</strong></p>'
+        )
+
+    def test_emphasis_wrapping_elements_with_tails(self):
+        self.assertMarkdownRenders(
+            '*a `b` c [d](e) f `g` h*',
+            '<p><em>a <code>b</code> c <a href="e">d</a> f <code>g</code> h</em></p>'
+        )
+
+    def test_emphasis_surrounding_emphasis(self):
+        self.assertMarkdownRenders(
+            '**foo* bar*',
+            '<p><em><em>foo</em> bar</em></p>'
+        )
+
+    def test_emphasis_surrounding_emphasis_in_text(self):
+        self.assertMarkdownRenders(
+            'This is **really* important* stuff',
+            '<p>This is <em><em>really</em> important</em> stuff</p>'
+        )
+
+    def test_emphasis_surrounding_emphasis_at_start(self):
+        self.assertMarkdownRenders(
+            '**a* b* c',
+            '<p><em><em>a</em> b</em> c</p>'
+        )
+
+    def test_emphasis_surrounding_emphasis_deeply(self):
+        self.assertMarkdownRenders(
+            '***a* b* c* d',
+            '<p><em><em><em>a</em> b</em> c</em> d</p>'
+        )
+
+    def test_legacy_emphasis_surrounding_emphasis(self):
+        self.assertMarkdownRenders(
+            '__foo_ bar_',
+            '<p><em><em>foo</em> bar</em></p>',
+            extensions=['legacy_em']
+        )
@@ -164,6 +164,24 @@ class TestInlineLinks(TestCase):
             '<p><a href="?}]*+|&amp;)">test nonsense</a>.</p>'
         )
 
+    def test_adjacent_links(self):
+        self.assertMarkdownRenders(
+            """[a](/a)[b](/b) [c](/c)""",
+            """<p><a href="/a">a</a><a href="/b">b</a> <a href="/c">c</a></p>"""
+        )
+
+    def test_many_links(self):
+        self.assertMarkdownRenders(
+            ' '.join(f'[{i}](/{i})' for i in range(1000)),
+            '<p>' + ' '.join(f'<a href="/{i}">{i}</a>' for i in range(1000)) + '</p>'
+        )
+
+    def test_unclosed_title(self):
+        self.assertMarkdownRenders(
+            """[a]("(""",
+            """<p><a href="">a</a>(</p>"""
+        )
+
 
 class TestReferenceLinks(TestCase):
 